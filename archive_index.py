@@ -0,0 +1,207 @@
+"""
+연도별/전체 인덱스 모듈
+매니페스트에 기록된 저장 완료 심의(기간, 결정유형, 언론사)로 연도별 인덱스(output/YYYY/INDEX_YYYY.md)와
+전체 인덱스(output/INDEX.md)를 만듭니다.
+
+마크다운 파일을 다시 읽지 않고 매니페스트 조회 결과만 집계하므로,
+한 달을 처리한 뒤에는 해당 연도와 전체 인덱스만 다시 만들고, 내용이 같으면 파일을 쓰지 않습니다.
+
+사용법 (전체 인덱스 재생성):
+    python archive_index.py
+"""
+
+import os
+import sys
+import time
+import argparse
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import config
+from manifest import ProgressManifest
+from markdown_writer import write_file_if_changed, sync_directories
+
+
+UNCLASSIFIED = '(미분류)'
+
+GLOBAL_INDEX_FILENAME = 'INDEX.md'
+
+
+def yearly_index_filename(year: int) -> str:
+    """연도별 인덱스 파일명 (예: INDEX_2019.md)"""
+    return f"INDEX_{year}.md"
+
+
+def _cell(text: str) -> str:
+    """표 구분자와 겹치지 않도록 '|' 이스케이프"""
+    return text.replace('|', '\\|')
+
+
+def _count_table(header: str, counts: Counter, type_counts: Optional[Dict[str, Counter]] = None) -> List[str]:
+    """건수 내림차순 표 (type_counts가 있으면 결정유형별 건수 열 추가)"""
+    lines = []
+    if type_counts is None:
+        lines.append(f"| {header} | 건수 |")
+        lines.append("|---|---:|")
+    else:
+        lines.append(f"| {header} | 건수 | 결정유형 |")
+        lines.append("|---|---:|---|")
+
+    for name, count in sorted(counts.items(), key=lambda item: (-item[1], item[0])):
+        if type_counts is None:
+            lines.append(f"| {_cell(name)} | {count} |")
+        else:
+            types = ', '.join(f"{decision_type} {type_count}" for decision_type, type_count
+                              in sorted(type_counts[name].items(), key=lambda item: (-item[1], item[0])))
+            lines.append(f"| {_cell(name)} | {count} | {_cell(types)} |")
+    return lines
+
+
+def _breakdown(entries: List[Dict]) -> List[str]:
+    """결정유형별/언론사별 집계 섹션"""
+    type_counts = Counter(entry.get('decision_type') or UNCLASSIFIED for entry in entries)
+    newspaper_counts = Counter()
+    newspaper_types: Dict[str, Counter] = defaultdict(Counter)
+    for entry in entries:
+        newspaper = entry.get('newspaper') or UNCLASSIFIED
+        newspaper_counts[newspaper] += 1
+        newspaper_types[newspaper][entry.get('decision_type') or UNCLASSIFIED] += 1
+
+    lines = ["## 결정유형별\n"]
+    lines.extend(_count_table('결정유형', type_counts))
+    lines.append("")
+    lines.append("## 언론사별\n")
+    lines.extend(_count_table('언론사', newspaper_counts, newspaper_types))
+    lines.append("")
+    return lines
+
+
+def render_yearly_index(year: int, entries: List[Dict]) -> str:
+    """
+    연도별 인덱스 마크다운을 만듭니다.
+
+    Args:
+        year: 연도
+        entries: 해당 연도의 인덱스 항목 ('month', 'decision_type', 'newspaper' 키)
+
+    Returns:
+        마크다운 문자열
+    """
+    month_counts = Counter(entry['month'] for entry in entries)
+
+    md_content = [f"# 신문윤리위원회 심의결정 - {year}년\n"]
+    md_content.append(f"- **생성 시간**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    md_content.append(f"- **총 심의 건수**: {len(entries)}건\n")
+
+    md_content.append("## 월별 목록\n")
+    md_content.append("| 월 | 건수 | 인덱스 |")
+    md_content.append("|---|---:|---|")
+    for month in sorted(month_counts):
+        index_name = f"INDEX_{year}_{month:02d}.md"
+        md_content.append(f"| {month}월 | {month_counts[month]} | [{index_name}](./{month:02d}/{index_name}) |")
+    md_content.append("")
+
+    md_content.extend(_breakdown(entries))
+    return "\n".join(md_content)
+
+
+def render_global_index(entries: List[Dict]) -> str:
+    """
+    전체 인덱스 마크다운을 만듭니다.
+
+    Args:
+        entries: 모든 인덱스 항목 ('year', 'month', 'decision_type', 'newspaper' 키)
+
+    Returns:
+        마크다운 문자열
+    """
+    year_counts = Counter(entry['year'] for entry in entries)
+
+    md_content = ["# 신문윤리위원회 심의결정 - 전체\n"]
+    md_content.append(f"- **생성 시간**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    md_content.append(f"- **총 심의 건수**: {len(entries)}건")
+    if entries:
+        first = min((entry['year'], entry['month']) for entry in entries)
+        last = max((entry['year'], entry['month']) for entry in entries)
+        md_content.append(f"- **기간**: {first[0]}년 {first[1]}월 ~ {last[0]}년 {last[1]}월")
+    md_content.append("")
+
+    md_content.append("## 연도별 목록\n")
+    md_content.append("| 연도 | 건수 | 인덱스 |")
+    md_content.append("|---|---:|---|")
+    for year in sorted(year_counts, reverse=True):
+        index_name = yearly_index_filename(year)
+        md_content.append(f"| {year}년 | {year_counts[year]} | [{index_name}](./{year}/{index_name}) |")
+    md_content.append("")
+
+    md_content.extend(_breakdown(entries))
+    return "\n".join(md_content)
+
+
+def write_archive_indexes(entries: List[Dict], output_dir: str = None,
+                          years: Optional[Iterable[int]] = None) -> List[str]:
+    """
+    연도별 인덱스와 전체 인덱스를 기록합니다. (내용이 같은 파일은 다시 쓰지 않음)
+
+    Args:
+        entries: 모든 인덱스 항목 (ProgressManifest.index_entries 결과)
+        output_dir: 출력 디렉토리 (None이면 config.OUTPUT_DIR)
+        years: 다시 만들 연도 (None이면 모든 연도, 전체 인덱스는 항상 다시 만듦)
+
+    Returns:
+        새로 기록한 파일 경로 리스트
+    """
+    output_dir = output_dir or config.OUTPUT_DIR
+    by_year: Dict[int, List[Dict]] = defaultdict(list)
+    for entry in entries:
+        by_year[entry['year']].append(entry)
+
+    targets = sorted(by_year) if years is None else sorted(set(years) & set(by_year))
+
+    written = []
+    for year in targets:
+        year_dir = os.path.join(output_dir, str(year))
+        os.makedirs(year_dir, exist_ok=True)
+        path = os.path.join(year_dir, yearly_index_filename(year))
+        if write_file_if_changed(path, render_yearly_index(year, by_year[year])):
+            written.append(path)
+
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, GLOBAL_INDEX_FILENAME)
+    if write_file_if_changed(path, render_global_index(entries)):
+        written.append(path)
+
+    sync_directories()
+    return written
+
+
+def main(argv: Optional[List[str]] = None):
+    """매니페스트로 연도별/전체 인덱스를 모두 다시 만드는 명령행 실행"""
+    arg_parser = argparse.ArgumentParser(description="연도별/전체 인덱스 재생성")
+    arg_parser.add_argument('--manifest', default=config.MANIFEST_PATH,
+                            help=f"매니페스트 경로 (기본값: {config.MANIFEST_PATH})")
+    arg_parser.add_argument('--output-dir', default=config.OUTPUT_DIR,
+                            help=f"출력 디렉토리 (기본값: {config.OUTPUT_DIR})")
+    args = arg_parser.parse_args(argv)
+
+    if not os.path.exists(args.manifest):
+        print(f"매니페스트가 없습니다: {args.manifest}", file=sys.stderr)
+        sys.exit(1)
+
+    start = time.perf_counter()
+    manifest = ProgressManifest(args.manifest)
+    try:
+        entries = manifest.index_entries()
+    finally:
+        manifest.close()
+
+    written = write_archive_indexes(entries, args.output_dir)
+    elapsed = time.perf_counter() - start
+
+    years = len({entry['year'] for entry in entries})
+    print(f"심의 {len(entries)}건, {years}개 연도: 인덱스 {len(written)}개 갱신 ({elapsed:.2f}초)")
+
+
+if __name__ == "__main__":
+    main()
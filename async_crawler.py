@@ -0,0 +1,130 @@
+"""
+asyncio 기반 크롤링 스케줄러
+설정된 개수만큼 요청을 동시에 진행하면서 호스트별 토큰 버킷으로 속도를 제한합니다.
+
+한 요청이 토큰을 기다리는 동안 다른 요청의 네트워크 시간이 진행되므로,
+고정 대기 후 한 건씩 요청하던 방식보다 같은 속도 제한에서 처리량이 높습니다.
+실제 HTTP 요청은 동기식 HttpFetcher를 스레드 실행기에서 호출하며,
+이벤트 루프는 별도 스레드에서 실행되어 결과를 완료되는 대로 넘겨줍니다.
+"""
+
+import queue
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import config
+from http_fetcher import HttpFetcher
+from rate_limiter import HostRateLimiter
+
+
+# 이벤트 루프 스레드 종료 신호
+_FINISHED = object()
+
+
+class AsyncCrawler:
+    """동시 요청 수와 호스트별 속도를 제한하는 asyncio 크롤러"""
+
+    def __init__(self, fetcher: HttpFetcher, rate_limiter: Optional[HostRateLimiter] = None,
+                 max_in_flight: int = None, fetch_func: Callable = None):
+        """
+        크롤러 초기화
+
+        Args:
+            fetcher: 실제 요청을 보낼 HttpFetcher 인스턴스
+            rate_limiter: 호스트별 요청 예산
+            max_in_flight: 동시에 진행할 최대 요청 수
+            fetch_func: (페처, URL) -> HTML 또는 None 을 반환하는 함수
+        """
+        self.fetcher = fetcher
+        self.rate_limiter = rate_limiter if rate_limiter is not None else HostRateLimiter()
+        self.max_in_flight = max_in_flight if max_in_flight is not None else config.ASYNC_MAX_IN_FLIGHT
+        self.fetch_func = fetch_func or (lambda page_fetcher, url: page_fetcher.get_decision_detail(url))
+        self.logger = logging.getLogger(__name__)
+
+    def fetch_all(self, urls: List[str]) -> Iterator[Tuple[str, Optional[str], Optional[Exception]]]:
+        """
+        여러 URL을 동시에 가져오고 완료되는 순서대로 결과를 반환합니다.
+        소비 측이 결과를 가져가지 않으면 진행 중인 요청도 대기하므로 메모리가 늘어나지 않습니다.
+
+        Args:
+            urls: 요청할 URL 리스트
+
+        Yields:
+            (URL, HTML 소스, 예외) 튜플 - 구조 검사 실패 시 HTML과 예외 모두 None
+        """
+        results: queue.Queue = queue.Queue(maxsize=self.max_in_flight)
+        stop = threading.Event()
+
+        def run_loop():
+            try:
+                asyncio.run(self.crawl(urls, results, stop))
+            except Exception as e:
+                self.logger.error(f"비동기 수집 중 오류: {e}")
+            finally:
+                results.put(_FINISHED)
+
+        thread = threading.Thread(target=run_loop, name="async-crawler-loop", daemon=True)
+        thread.start()
+
+        try:
+            while True:
+                item = results.get()
+                if item is _FINISHED:
+                    break
+                yield item
+        finally:
+            # 소비 측이 중간에 멈춘 경우(오류, 종료 신호) 남은 요청을 건너뛰도록 알림
+            stop.set()
+            while thread.is_alive():
+                try:
+                    results.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            thread.join()
+
+    async def crawl(self, urls: List[str], results: queue.Queue, stop: threading.Event):
+        """
+        이벤트 루프에서 URL 목록을 처리하고 완료된 결과를 큐에 넣습니다.
+
+        Args:
+            urls: 요청할 URL 리스트
+            results: 결과를 전달할 큐 (가득 차면 해당 요청 슬롯이 대기)
+            stop: 중단 요청 이벤트
+        """
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+
+        # 결과 전달 대기용 스레드를 요청 스레드와 분리하여 큐가 가득 차도 요청 스레드가 막히지 않도록 함
+        with ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="async-crawler") as executor:
+            tasks = [self._fetch_one(url, semaphore, executor, results, stop) for url in urls]
+            await asyncio.gather(*tasks)
+
+        self.logger.info(f"비동기 수집 완료: {len(urls)}건 (동시 요청 {self.max_in_flight}개)")
+
+    async def _fetch_one(self, url: str, semaphore: asyncio.Semaphore, executor: ThreadPoolExecutor,
+                         results: queue.Queue, stop: threading.Event):
+        """동시 요청 슬롯과 토큰을 얻은 뒤 한 URL을 가져와 결과 큐에 넣습니다."""
+        async with semaphore:
+            if stop.is_set():
+                return
+
+            # 캐시에 있는 페이지는 요청하지 않으므로 토큰을 쓰지 않음
+            if not self.fetcher.is_cached(url):
+                await self.rate_limiter.acquire_async(url)
+
+            loop = asyncio.get_running_loop()
+            try:
+                html_content = await loop.run_in_executor(executor, self.fetch_func, self.fetcher, url)
+                item = (url, html_content, None)
+            except Exception as e:
+                item = (url, None, e)
+
+            # 소비 측이 따라오지 못하면 슬롯을 쥔 채로 대기 (역압)
+            while not stop.is_set():
+                try:
+                    results.put_nowait(item)
+                    return
+                except queue.Full:
+                    await asyncio.sleep(0.05)
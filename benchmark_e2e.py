@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+전체 흐름(수집 → 파싱 → 저장) 벤치마크 스크립트
+
+기록된 목록/상세 페이지를 로컬 재생 서버에서 제공하고, main()을 수집 방식과 동시성 수준별로
+실행하여 처리량을 측정합니다. 실제 사이트에 요청하지 않으므로 스크레이핑 엔진 변경 전후를 비교할 수 있습니다.
+
+- 재생 페이지: 페이지 캐시(config.CACHE_DIR)에 기록된 페이지 (없으면 --synthetic으로 생성한 페이지)
+- 측정 항목: 초당 처리 페이지 수, 단계별(목록/수집/파싱/저장) p50/p95 지연 시간, 최대 RSS, 기록한 바이트 수
+- 각 시나리오는 별도 프로세스에서 실행되어 최대 RSS와 설정이 서로 섞이지 않음
+- 결과는 JSON으로 표준 출력(또는 --output 파일)에 기록
+
+사용법:
+    python benchmark_e2e.py                                  # 캐시된 페이지, async/pool/serial
+    python benchmark_e2e.py --synthetic 3x40 --latency 0.05  # 3개월 x 40건 생성 페이지, 응답 지연 50ms
+    python benchmark_e2e.py --backends async --concurrency 1,4,8 --modes pipeline,batch --output bench.json
+    python benchmark_e2e.py --browser                        # 목록 페이지와 대체 경로에 실제 WebDriver 사용
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import threading
+import subprocess
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import config
+from page_cache import PageCache, normalize_url, DECIDE_BASE_NO_PATTERN
+
+
+# 재생 서버가 인식하는 페이지 경로
+LIST_PATH = '/m2/sub2_1.asp'
+DETAIL_PATH = '/m2/sub2_1_1.asp'
+
+
+def replay_key(url: str) -> str:
+    """호스트를 제외한 정규화 경로 + 쿼리 (재생 페이지 조회 키)"""
+    normalized = urlsplit(normalize_url(url))
+    return f"{normalized.path}?{normalized.query}" if normalized.query else normalized.path
+
+
+# ----- 재생 페이지 준비 -----
+
+def load_recorded_pages(cache_dir: str) -> Dict[str, str]:
+    """페이지 캐시에 기록된 모든 페이지를 {조회 키: HTML}로 읽습니다."""
+    cache = PageCache(cache_dir=cache_dir)
+    try:
+        return {replay_key(url): html_content for url, html_content in cache.iter_pages()}
+    finally:
+        cache.close()
+
+
+def generate_synthetic_pages(months: int, decisions_per_month: int, paragraph_count: int = 8) -> Dict[str, str]:
+    """
+    실제 페이지 구조(rst_list_l, rst_result_view)를 따르는 생성 페이지를 만듭니다.
+
+    Args:
+        months: 생성할 월 수 (2019년 1월부터)
+        decisions_per_month: 월별 심의 수
+        paragraph_count: 이유 본문 문단 수
+
+    Returns:
+        {조회 키: HTML}
+    """
+    rng = random.Random(42)
+    pages = {}
+    filler = '<ul class="gnb">' + ''.join(
+        f'<li><a href="/m{i}/index.asp">메뉴 {i}</a></li>' for i in range(80)
+    ) + '</ul><script>var menu = [];</script>'
+
+    decision_seq = 4000
+    for index in range(months):
+        year, month = 2019 + index // 12, index % 12 + 1
+        decide_base_no = f"Y{year}{month:02d}10"
+
+        items = []
+        for _ in range(decisions_per_month):
+            decision_seq += 1
+            decide_no = f"{year}-{decision_seq}"
+            query = f"Year={year}&DecideBaseNo={decide_base_no}&DecideNo={decide_no}"
+            title = f"생성 심의 {decide_no} 보도에 대한 결정"
+            items.append(
+                f'<li><a href="sub2_1_1.asp?{query.replace("&", "&amp;")}"><span>{decide_no}</span>'
+                f'<strong>{title}</strong><u class="rl_btn green">주의</u></a></li>'
+            )
+
+            reason = ''.join(
+                f'{n}. 이 기사는 사실과 다른 내용을 보도하여 신문윤리실천요강을 위반하였다. ' * rng.randint(3, 8) + '<br>'
+                for n in range(1, paragraph_count + 1)
+            )
+            pages[replay_key(f"http://replay{DETAIL_PATH}?{query}")] = (
+                f'<html><head><title>심의결정</title></head><body>{filler}'
+                f'<div class="rst_result_view"><div class="rst_titleW"><u class="rl_btn green">주의</u>'
+                f'<h3 class="type01"><i>{decide_no}</i> {title}</h3>'
+                f'<dl><dd>생성일보      발행인  홍 길 동</dd></dl></div>'
+                f'<div class="rst_contW"><ul>'
+                f'<li><h3 class="type01">주 문</h3><p>생성일보에 대하여 주의한다.</p></li>'
+                f'<li><h3 class="type01">이 유</h3><p>{reason}</p></li>'
+                f'<li><h3 class="type01">적용 조항</h3><p>신문윤리실천요강 제3조 「보도준칙」</p></li>'
+                f'</ul></div></div>{filler}</body></html>'
+            )
+
+        pages[replay_key(f"http://replay{LIST_PATH}?Year={year}&DecideBaseNo={decide_base_no}")] = (
+            f'<html><body>{filler}<div class="rst_list_l"><ul>{"".join(items)}</ul></div></body></html>'
+        )
+
+    return pages
+
+
+def list_periods(pages: Dict[str, str], base_url: str) -> List[Tuple[int, int, str]]:
+    """재생 페이지 중 월별 목록 페이지를 TARGET_MONTH_URLS 형식으로 반환합니다."""
+    periods = []
+    for key in sorted(pages):
+        if not key.startswith(LIST_PATH + '?'):
+            continue
+        match = DECIDE_BASE_NO_PATTERN.search(key)
+        if not match:
+            continue
+        date = match.group(1)
+        periods.append((int(date[:4]), int(date[4:6]), base_url + key))
+    return periods
+
+
+# ----- 재생 서버 -----
+
+class ReplayServer:
+    """기록된 페이지를 EUC-KR(CP949)로 제공하는 로컬 HTTP 서버"""
+
+    def __init__(self, pages: Dict[str, str], latency: float = 0.0, jitter: float = 0.0, port: int = 0):
+        """
+        재생 서버 초기화
+
+        Args:
+            pages: {조회 키: HTML}
+            latency: 응답마다 추가할 지연 시간 (초)
+            jitter: 지연 시간에 더할 0~jitter초 사이의 임의 시간
+            port: 사용할 포트 (0이면 임의의 빈 포트)
+        """
+        bodies = {key: html_content.encode('cp949', errors='xmlcharrefreplace') for key, html_content in pages.items()}
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                delay = latency + (random.uniform(0, jitter) if jitter else 0.0)
+                if delay > 0:
+                    time.sleep(delay)
+
+                body = bodies.get(replay_key(f"http://replay{self.path}"))
+                if body is None:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="replay-server", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """서버 기본 URL (config.BASE_URL 대체용)"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """서버 시작"""
+        self.thread.start()
+
+    def stop(self):
+        """서버 종료"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread.join()
+
+
+# ----- 시나리오 실행 (하위 프로세스) -----
+
+def percentile(values: List[float], fraction: float) -> Optional[float]:
+    """최근접 순위 백분위수 (값이 없으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def directory_bytes(path: str, suffix: str = '') -> int:
+    """디렉토리 아래 파일 크기 합계"""
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            if name.endswith(suffix):
+                total += os.path.getsize(os.path.join(dirpath, name))
+    return total
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """현재 프로세스의 최대 RSS (바이트, 측정할 수 없으면 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def run_scenario(scenario: Dict) -> Dict:
+    """
+    현재 프로세스에서 시나리오 하나를 실행하고 측정 결과를 반환합니다.
+    (작업 디렉토리는 호출한 쪽에서 시나리오 전용 임시 디렉토리로 지정)
+    """
+    # config는 main을 가져오기 전에 바꿔야 기본값을 읽는 모듈에 반영됨
+    config.BASE_URL = scenario['base_url']
+    config.MONTH_LIST_URL = scenario['base_url'] + LIST_PATH
+    config.DECISION_DETAIL_URL = scenario['base_url'] + DETAIL_PATH
+    config.TARGET_MONTH_URLS = [tuple(period) for period in scenario['periods']]
+    config.OUTPUT_DIR = 'output'
+    config.MANIFEST_PATH = 'output/manifest.db'
+    config.USE_PAGE_CACHE = False
+    config.USE_RANDOM_DELAY = False
+    config.INCREMENTAL_MODE = False
+    config.PIPELINE_MONITOR_INTERVAL = 0
+    config.HOST_REQUESTS_PER_SECOND = scenario['rate']
+    config.ADAPTIVE_PACING = False  # 시나리오마다 고정된 요청 예산으로 비교
+    config.HOST_BURST_SIZE = max(1, scenario['concurrency'])
+    config.FETCH_BACKEND = scenario['backend']
+    config.ASYNC_MAX_IN_FLIGHT = scenario['concurrency']
+    config.DRIVER_POOL_SIZE = scenario['concurrency']
+    config.HTTP_POOL_SIZE = max(config.HTTP_POOL_SIZE, scenario['concurrency'])
+    config.USE_PIPELINE = scenario['mode'] == 'pipeline'
+
+    import main
+    import metrics
+    import http_fetcher
+    from scraper import IkpecScraper
+    from parser import parse_decision_list
+
+    timings: Dict[str, List[float]] = {'list': [], 'fetch': [], 'parse': [], 'write': []}
+
+    def timed(stage: str, func):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timings[stage].append(time.perf_counter() - start)
+        return wrapper
+
+    # 단계별 지연 시간 측정 (모듈 전역 함수를 감싸서 기록)
+    http_fetcher.HttpFetcher.get_decision_detail = timed('fetch', http_fetcher.HttpFetcher.get_decision_detail)
+    main.build_decision_record = timed('parse', main.build_decision_record)
+    main.write_decision_record = timed('write', main.write_decision_record)
+
+    if not scenario['browser']:
+        class HttpOnlyScraper(IkpecScraper):
+            """브라우저 없이 HTTP로 목록 페이지와 대체 경로를 처리하는 스크레이퍼 (벤치마크용)"""
+
+            def setup_driver(self):
+                self.http = http_fetcher.HttpFetcher()
+                self.http.setup_session()
+
+            def close_driver(self):
+                self.http.close_session()
+
+            def get_page_source(self, url, ready_selector=None, timeout=None):
+                return self.http.get_page_source(url)
+
+            def get_decision_links_from_url(self, url, year, month, use_cache=True):
+                return parse_decision_list(self.get_page_source(url))
+
+        main.IkpecScraper = HttpOnlyScraper
+
+    main.IkpecScraper.get_decision_links_from_url = timed('list', main.IkpecScraper.get_decision_links_from_url)
+
+    start = time.perf_counter()
+    main.main([])
+    elapsed = time.perf_counter() - start
+
+    pages = len(timings['write'])
+    summary = metrics.registry.summary()
+    return {
+        'scenario': {key: scenario[key] for key in ('backend', 'concurrency', 'mode', 'browser', 'latency', 'rate')},
+        'periods': len(scenario['periods']),
+        'pages': pages,
+        'elapsed_seconds': round(elapsed, 4),
+        'pages_per_second': round(pages / elapsed, 3) if elapsed > 0 else None,
+        'stages': {
+            stage: {
+                'count': len(values),
+                'p50_ms': round(percentile(values, 0.50) * 1000, 3) if values else None,
+                'p95_ms': round(percentile(values, 0.95) * 1000, 3) if values else None,
+            }
+            for stage, values in timings.items()
+        },
+        # 스크레이퍼 내부 지표 (이동/대기/소스 전송/렌더링 등 세부 단계, 바이트 수, 오류 유형)
+        'run_metrics': {key: summary[key] for key in ('counters', 'stages')},
+        'peak_rss_bytes': peak_rss_bytes(),
+        'bytes_written': directory_bytes('output', '.md'),
+        'bytes_written_total': directory_bytes('output'),
+    }
+
+
+def run_scenario_subprocess(scenario: Dict, keep_output: bool = False) -> Dict:
+    """시나리오를 별도 프로세스와 임시 작업 디렉토리에서 실행합니다."""
+    workdir = tempfile.mkdtemp(prefix='ikpec-bench-')
+    result_path = os.path.join(workdir, 'result.json')
+    try:
+        completed = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--run-scenario', json.dumps(scenario),
+             '--result-file', result_path],
+            cwd=workdir, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+        )
+        if completed.returncode != 0 or not os.path.exists(result_path):
+            return {'scenario': scenario, 'error': completed.stderr.strip().splitlines()[-1:] or ['unknown']}
+        with open(result_path, 'r', encoding='utf-8') as f:
+            result = json.load(f)
+        if keep_output:
+            result['workdir'] = workdir
+        return result
+    finally:
+        if not keep_output:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+# ----- 명령행 -----
+
+def parse_list(value: str) -> List[str]:
+    """쉼표로 구분된 값 리스트"""
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def main():
+    """벤치마크 실행"""
+    arg_parser = argparse.ArgumentParser(description="재생 서버 기반 전체 흐름 벤치마크")
+    arg_parser.add_argument('--cache-dir', default=config.CACHE_DIR, help="기록된 페이지가 있는 페이지 캐시 디렉토리")
+    arg_parser.add_argument('--synthetic', metavar='MONTHSxDECISIONS',
+                            help="캐시 대신 생성 페이지 사용 (예: 3x40)")
+    arg_parser.add_argument('--backends', type=parse_list, default=['serial', 'async', 'pool'],
+                            help="수집 방식 (serial,async,pool)")
+    arg_parser.add_argument('--concurrency', type=lambda v: [int(x) for x in parse_list(v)], default=[1, 4],
+                            help="동시성 수준 (async: 동시 요청 수, pool: 드라이버 수)")
+    arg_parser.add_argument('--modes', type=parse_list, default=['pipeline'],
+                            help="처리 방식 (pipeline,batch)")
+    arg_parser.add_argument('--latency', type=float, default=0.02, help="재생 서버 응답 지연 (초)")
+    arg_parser.add_argument('--jitter', type=float, default=0.0, help="응답 지연에 더할 최대 임의 시간 (초)")
+    arg_parser.add_argument('--rate', type=float, default=1000.0, help="호스트별 초당 요청 수 한도")
+    arg_parser.add_argument('--browser', action='store_true', help="목록 페이지와 대체 경로에 실제 WebDriver 사용")
+    arg_parser.add_argument('--keep-output', action='store_true', help="시나리오별 작업 디렉토리를 지우지 않음")
+    arg_parser.add_argument('--output', help="결과 JSON 파일 경로 (생략 시 표준 출력)")
+    arg_parser.add_argument('--run-scenario', help=argparse.SUPPRESS)
+    arg_parser.add_argument('--result-file', help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    # 하위 프로세스: 시나리오 하나 실행
+    if args.run_scenario:
+        result = run_scenario(json.loads(args.run_scenario))
+        with open(args.result_file, 'w', encoding='utf-8') as f:
+            json.dump(result, f)
+        return
+
+    if args.synthetic:
+        months, decisions = (int(value) for value in args.synthetic.lower().split('x', 1))
+        pages = generate_synthetic_pages(months, decisions)
+        source = f"synthetic:{months}x{decisions}"
+    elif os.path.isdir(args.cache_dir):
+        pages = load_recorded_pages(args.cache_dir)
+        source = f"cache:{os.path.abspath(args.cache_dir)}"
+    else:
+        arg_parser.error(f"캐시 디렉토리가 없습니다: {args.cache_dir} (--synthetic으로 생성 페이지를 사용할 수 있습니다)")
+
+    server = ReplayServer(pages, latency=args.latency, jitter=args.jitter)
+    server.start()
+    periods = list_periods(pages, server.base_url)
+    if not periods:
+        server.stop()
+        arg_parser.error("재생할 월별 목록 페이지가 없습니다.")
+
+    results = []
+    try:
+        for mode in args.modes:
+            for backend in args.backends:
+                # 순차 처리는 동시성 수준과 관계없으므로 한 번만 실행
+                levels = [1] if backend == 'serial' else args.concurrency
+                for concurrency in levels:
+                    scenario = {
+                        'base_url': server.base_url, 'periods': periods, 'backend': backend,
+                        'concurrency': concurrency, 'mode': mode, 'browser': args.browser,
+                        'latency': args.latency, 'rate': args.rate,
+                    }
+                    print(f"실행 중: {mode} / {backend} / 동시성 {concurrency}", file=sys.stderr)
+                    result = run_scenario_subprocess(scenario, keep_output=args.keep_output)
+                    if 'error' in result:
+                        print(f"  ✗ 실패: {result['error']}", file=sys.stderr)
+                    else:
+                        print(f"  {result['pages']}페이지, {result['pages_per_second']} 페이지/초", file=sys.stderr)
+                    results.append(result)
+    finally:
+        server.stop()
+
+    report = {
+        'source': source,
+        'pages_available': len(pages),
+        'periods': len(periods),
+        'python': sys.version.split()[0],
+        'parser_backend': config.PARSER_BACKEND,
+        'results': results,
+    }
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+        print(f"결과 저장: {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+HTML 파서 방식 벤치마크 스크립트
+
+캐시에 저장된 목록/상세 페이지(또는 지정한 HTML 파일)를 두 파서 방식으로 파싱하여
+처리 속도를 비교하고, 두 방식의 결과 딕셔너리가 같은지 확인합니다.
+
+사용법:
+    python benchmark_parser.py                       # config.CACHE_DIR의 캐시 전체
+    python benchmark_parser.py --cache-dir .cache/pages --repeat 3
+    python benchmark_parser.py page1.html pages/     # HTML 파일 또는 디렉토리
+"""
+
+import os
+import sys
+import time
+import argparse
+from typing import Callable, Dict, List, Tuple
+
+import config
+from page_cache import PageCache
+from parser import is_valid_detail_page, parse_decision_detail, parse_decision_list
+
+
+BACKENDS = ('html.parser', 'lxml')
+
+
+def load_pages_from_cache(cache_dir: str) -> List[Tuple[str, str]]:
+    """캐시의 모든 페이지를 (URL, HTML) 리스트로 읽습니다."""
+    cache = PageCache(cache_dir=cache_dir)
+    try:
+        return list(cache.iter_pages())
+    finally:
+        cache.close()
+
+
+def load_pages_from_paths(paths: List[str]) -> List[Tuple[str, str]]:
+    """HTML 파일과 디렉토리(하위 .html 파일)를 (경로, HTML) 리스트로 읽습니다."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, _, filenames in os.walk(path):
+                files.extend(os.path.join(dirpath, name) for name in sorted(filenames) if name.endswith('.html'))
+        else:
+            files.append(path)
+
+    pages = []
+    for filepath in files:
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        try:
+            html_content = raw.decode('utf-8')
+        except UnicodeDecodeError:
+            html_content = raw.decode('cp949', errors='replace')
+        pages.append((filepath, html_content))
+    return pages
+
+
+def run_backend(pages: List[Tuple[str, str]], parse_func: Callable, backend: str,
+                repeat: int) -> Tuple[float, List]:
+    """
+    한 파서 방식으로 모든 페이지를 repeat번 파싱합니다.
+
+    Returns:
+        (가장 빠른 회차의 소요 시간, 마지막 회차의 결과 리스트)
+    """
+    best = None
+    results = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [parse_func(html_content, backend=backend) for _, html_content in pages]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, results
+
+
+def benchmark(name: str, pages: List[Tuple[str, str]], parse_func: Callable, repeat: int) -> int:
+    """
+    페이지 종류 하나(목록 또는 상세)에 대해 두 방식을 비교합니다.
+
+    Returns:
+        결과가 다른 페이지 수
+    """
+    if not pages:
+        print(f"[{name}] 페이지 없음")
+        return 0
+
+    timings: Dict[str, float] = {}
+    outputs: Dict[str, List] = {}
+    for backend in BACKENDS:
+        timings[backend], outputs[backend] = run_backend(pages, parse_func, backend, repeat)
+
+    print(f"[{name}] {len(pages)}페이지")
+    for backend in BACKENDS:
+        elapsed = timings[backend]
+        rate = len(pages) / elapsed if elapsed > 0 else float('inf')
+        print(f"  {backend:<12} {elapsed:8.3f}초  ({rate:,.1f} 페이지/초)")
+
+    if timings['lxml'] > 0:
+        print(f"  속도 향상: {timings['html.parser'] / timings['lxml']:.1f}배")
+
+    mismatches = [
+        source for (source, _), expected, actual in zip(pages, outputs['html.parser'], outputs['lxml'])
+        if expected != actual
+    ]
+    if mismatches:
+        print(f"  ✗ 결과 불일치 {len(mismatches)}건:")
+        for source in mismatches[:10]:
+            print(f"    - {source}")
+    else:
+        print("  ✓ 두 방식의 결과가 모두 같습니다.")
+
+    return len(mismatches)
+
+
+def main():
+    """벤치마크 실행"""
+    arg_parser = argparse.ArgumentParser(description="HTML 파서 방식 벤치마크")
+    arg_parser.add_argument('paths', nargs='*', help="HTML 파일 또는 디렉토리 (생략 시 페이지 캐시 사용)")
+    arg_parser.add_argument('--cache-dir', default=config.CACHE_DIR, help="페이지 캐시 디렉토리")
+    arg_parser.add_argument('--repeat', type=int, default=3, help="반복 횟수 (가장 빠른 회차 기준)")
+    args = arg_parser.parse_args()
+
+    if args.paths:
+        pages = load_pages_from_paths(args.paths)
+    elif os.path.isdir(args.cache_dir):
+        pages = load_pages_from_cache(args.cache_dir)
+    else:
+        print(f"캐시 디렉토리가 없습니다: {args.cache_dir}")
+        sys.exit(1)
+
+    detail_pages = [(source, html) for source, html in pages if is_valid_detail_page(html)]
+    list_pages = [(source, html) for source, html in pages if not is_valid_detail_page(html)]
+
+    print("=" * 60)
+    print(f"HTML 파서 벤치마크 (반복 {args.repeat}회)")
+    print("=" * 60)
+
+    mismatches = benchmark("상세 페이지", detail_pages, parse_decision_detail, args.repeat)
+    mismatches += benchmark("목록 페이지", list_pages, parse_decision_list, args.repeat)
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""
+상시 실행 브라우저 모듈
+원격 디버깅 포트를 연 Chrome을 영구 프로필/디스크 캐시와 함께 미리 띄워 두고,
+IkpecScraper가 실행마다 새 브라우저를 시작하지 않고 그 브라우저에 연결(debuggerAddress)하도록 합니다.
+
+- 프로필(쿠키, 디스크 캐시)이 실행 사이에 유지되므로 첫 페이지부터 캐시된 리소스를 재사용
+- 시작할 때 사이트 첫 페이지를 열어 캐시를 미리 채움
+- 연결할 수 없으면 IkpecScraper는 기존처럼 새 브라우저를 실행
+
+사용법:
+    python browser_daemon.py start          # 백그라운드로 실행
+    python browser_daemon.py start --foreground  # 서비스 관리자(systemd 등)에서 실행
+    python browser_daemon.py status
+    python browser_daemon.py stop
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import signal
+import logging
+import argparse
+import subprocess
+import urllib.request
+from typing import Dict, List, Optional, Tuple
+
+import config
+from logging_setup import setup_logging
+
+
+logger = logging.getLogger(__name__)
+
+# PATH에서 찾을 Chrome 실행 파일 이름 (config.CHROME_BINARY가 없을 때)
+CHROME_CANDIDATES = ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome')
+
+# 연결 확인 요청의 제한 시간 (초) - 데몬이 없을 때 대체 경로가 늦어지지 않도록 짧게
+PROBE_TIMEOUT = 0.5
+
+
+def split_address(address: str) -> Tuple[str, int]:
+    """'호스트:포트' 문자열을 (호스트, 포트)로 나눔"""
+    host, _, port = address.rpartition(':')
+    return host or '127.0.0.1', int(port)
+
+
+def browser_version(address: str, timeout: float = PROBE_TIMEOUT) -> Optional[Dict]:
+    """
+    원격 디버깅 엔드포인트(/json/version)를 조회합니다.
+
+    Args:
+        address: '호스트:포트'
+        timeout: 제한 시간 (초)
+
+    Returns:
+        브라우저 정보 딕셔너리, 응답이 없으면 None
+    """
+    try:
+        with urllib.request.urlopen(f"http://{address}/json/version", timeout=timeout) as response:
+            return json.loads(response.read().decode('utf-8'))
+    except (OSError, ValueError):
+        return None
+
+
+def daemon_available(address: str = None) -> bool:
+    """
+    연결할 수 있는 상시 실행 브라우저가 있는지 확인합니다.
+
+    Args:
+        address: '호스트:포트' (None이면 config.BROWSER_DAEMON_ADDRESS, 빈 값이면 사용 안 함)
+
+    Returns:
+        연결 가능 여부
+    """
+    address = address if address is not None else config.BROWSER_DAEMON_ADDRESS
+    return bool(address) and browser_version(address) is not None
+
+
+def find_chrome_binary() -> str:
+    """
+    Chrome 실행 파일 경로를 찾습니다.
+
+    Raises:
+        FileNotFoundError: 실행 파일을 찾지 못한 경우
+    """
+    if config.CHROME_BINARY:
+        return config.CHROME_BINARY
+    for name in CHROME_CANDIDATES:
+        path = shutil.which(name)
+        if path:
+            return path
+    raise FileNotFoundError(f"Chrome 실행 파일을 찾을 수 없습니다: {', '.join(CHROME_CANDIDATES)}")
+
+
+def chrome_command(address: str, profile_dir: str, headless: bool = True, lean: bool = None) -> List[str]:
+    """
+    상시 실행 브라우저의 명령행을 만듭니다.
+
+    Args:
+        address: 원격 디버깅 '호스트:포트'
+        profile_dir: 영구 프로필 디렉토리 (디스크 캐시 포함)
+        headless: 창 없이 실행
+        lean: 이미지 로딩 끄기 (None이면 config.LEAN_BROWSER)
+
+    Returns:
+        명령행 인자 리스트
+    """
+    host, port = split_address(address)
+    lean = lean if lean is not None else config.LEAN_BROWSER
+
+    command = [
+        find_chrome_binary(),
+        f'--remote-debugging-address={host}',
+        f'--remote-debugging-port={port}',
+        f'--user-data-dir={os.path.abspath(profile_dir)}',
+        f'--disk-cache-dir={os.path.abspath(os.path.join(profile_dir, "cache"))}',
+        '--no-first-run',
+        '--no-default-browser-check',
+        '--no-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-gpu',
+        '--window-size=1920,1080',
+        '--lang=ko-KR',
+        # 연결한 세션도 새로 실행한 브라우저(IkpecScraper.setup_driver)와 같은 User-Agent를 보내도록 함
+        f'--user-agent={config.USER_AGENT}',
+    ]
+    if headless:
+        command.append('--headless')
+    if lean:
+        command.append('--blink-settings=imagesEnabled=false')
+
+    # 첫 탭에서 사이트를 열어 연결/디스크 캐시를 미리 채움
+    command.append(config.BASE_URL)
+    return command
+
+
+def _read_state() -> Optional[Dict]:
+    """상태 파일(pid, 주소) 읽기"""
+    try:
+        with open(config.BROWSER_DAEMON_STATE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_state(state: Dict):
+    """상태 파일 기록"""
+    directory = os.path.dirname(config.BROWSER_DAEMON_STATE)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(config.BROWSER_DAEMON_STATE, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+
+
+def _remove_state():
+    """상태 파일 삭제"""
+    try:
+        os.remove(config.BROWSER_DAEMON_STATE)
+    except FileNotFoundError:
+        pass
+
+
+def start_daemon(address: str = None, profile_dir: str = None, headless: bool = None,
+                 foreground: bool = False, startup_timeout: float = 15.0) -> int:
+    """
+    상시 실행 브라우저를 시작합니다. 이미 응답하는 브라우저가 있으면 새로 시작하지 않습니다.
+
+    Args:
+        address: 원격 디버깅 '호스트:포트' (None이면 config.BROWSER_DAEMON_ADDRESS)
+        profile_dir: 영구 프로필 디렉토리 (None이면 config.BROWSER_PROFILE_DIR)
+        headless: 창 없이 실행 (None이면 config.HEADLESS_MODE)
+        foreground: True이면 브라우저가 종료될 때까지 기다림
+        startup_timeout: 원격 디버깅 엔드포인트가 응답할 때까지 기다릴 최대 시간 (초)
+
+    Returns:
+        브라우저 프로세스 ID
+
+    Raises:
+        FileNotFoundError: Chrome 실행 파일을 찾지 못한 경우
+        RuntimeError: 브라우저가 바로 종료되었거나 제한 시간 안에 엔드포인트가 응답하지 않은 경우
+    """
+    address = address or config.BROWSER_DAEMON_ADDRESS
+    profile_dir = profile_dir or config.BROWSER_PROFILE_DIR
+    headless = headless if headless is not None else config.HEADLESS_MODE
+
+    if browser_version(address):
+        state = _read_state() or {}
+        logger.info(f"이미 실행 중인 브라우저가 있습니다: {address}")
+        return state.get('pid', 0)
+
+    command = chrome_command(address, profile_dir, headless)
+    os.makedirs(profile_dir, exist_ok=True)
+    log_path = os.path.join(profile_dir, 'chrome.log')
+    with open(log_path, 'ab') as log_file:
+        process = subprocess.Popen(
+            command,
+            stdout=log_file, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+            start_new_session=True
+        )
+
+    deadline = time.monotonic() + startup_timeout
+    while browser_version(address) is None:
+        if process.poll() is not None:
+            raise RuntimeError(f"브라우저가 시작 직후 종료되었습니다 (종료 코드 {process.returncode}, 로그: {log_path})")
+        if time.monotonic() > deadline:
+            process.terminate()
+            raise RuntimeError(f"브라우저 원격 디버깅 엔드포인트가 응답하지 않습니다: {address}")
+        time.sleep(0.1)
+
+    _write_state({'pid': process.pid, 'address': address, 'profile_dir': profile_dir, 'started_at': time.time()})
+    logger.info(f"상시 실행 브라우저 시작: {address} (pid {process.pid}, 프로필 {profile_dir})")
+
+    if foreground:
+        try:
+            process.wait()
+        except KeyboardInterrupt:
+            process.terminate()
+            process.wait()
+        finally:
+            _remove_state()
+    return process.pid
+
+
+def stop_daemon(timeout: float = 10.0) -> bool:
+    """
+    start_daemon으로 시작한 브라우저를 종료합니다.
+
+    Args:
+        timeout: 정상 종료를 기다릴 최대 시간 (초, 지나면 강제 종료)
+
+    Returns:
+        종료한 프로세스가 있으면 True
+    """
+    state = _read_state()
+    if not state:
+        return False
+
+    pid = state['pid']
+    try:
+        os.kill(pid, signal.SIGTERM)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            os.kill(pid, 0)
+            time.sleep(0.1)
+        os.kill(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    finally:
+        _remove_state()
+
+    logger.info(f"상시 실행 브라우저 종료 (pid {pid})")
+    return True
+
+
+def main(argv: Optional[List[str]] = None):
+    """상시 실행 브라우저 관리 명령행"""
+    arg_parser = argparse.ArgumentParser(description="상시 실행 브라우저 관리")
+    arg_parser.add_argument('command', choices=['start', 'stop', 'status'])
+    arg_parser.add_argument('--address', default=config.BROWSER_DAEMON_ADDRESS,
+                            help=f"원격 디버깅 주소 (기본값: {config.BROWSER_DAEMON_ADDRESS})")
+    arg_parser.add_argument('--profile-dir', default=config.BROWSER_PROFILE_DIR,
+                            help=f"영구 프로필 디렉토리 (기본값: {config.BROWSER_PROFILE_DIR})")
+    arg_parser.add_argument('--foreground', action='store_true', help="브라우저가 종료될 때까지 기다림")
+    args = arg_parser.parse_args(argv)
+
+    setup_logging()
+
+    if not args.address:
+        print("원격 디버깅 주소가 없습니다 (config.BROWSER_DAEMON_ADDRESS 또는 --address)", file=sys.stderr)
+        sys.exit(1)
+
+    if args.command == 'start':
+        try:
+            start_daemon(args.address, args.profile_dir, foreground=args.foreground)
+        except (FileNotFoundError, RuntimeError) as e:
+            print(f"브라우저 시작 실패: {e}", file=sys.stderr)
+            sys.exit(1)
+    elif args.command == 'stop':
+        if not stop_daemon():
+            print("실행 중인 브라우저 상태 파일이 없습니다.", file=sys.stderr)
+            sys.exit(1)
+    else:
+        version = browser_version(args.address)
+        if version is None:
+            print(f"응답 없음: {args.address}")
+            sys.exit(1)
+        state = _read_state() or {}
+        print(f"실행 중: {args.address} ({version.get('Browser', '알 수 없음')}, pid {state.get('pid', '알 수 없음')})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""
+분산 수집 명령행 (코디네이터/작업자)
+공유 파일시스템의 작업 큐(work_queue.py)에 기간을 넣어 두면 여러 노드의 작업자가 기간 목록과
+개별 심의를 나누어 수집하고, 병합 단계에서 각 작업자의 출력을 표준 output/YYYY/MM 구조로 합칩니다.
+
+- init: 대상 기간을 큐에 추가 (config.TARGET_MONTH_URLS 또는 --years/--from으로 찾은 기간)
+- work: 항목을 임대하여 처리 (기간 → 심의 항목 추가, 심의 → 작업자 출력 디렉토리에 마크다운 저장)
+        다른 노드가 처리 중인 항목까지 모두 끝나면 종료
+- status: 종류/상태별 항목 수와 실패 항목 출력
+- merge: 완료된 심의 파일을 출력 디렉토리로 복사하고 매니페스트, 월별/연도별/전체 인덱스 작성
+
+사용법:
+    python cluster.py init --years 2005-2024
+    python cluster.py work                       # 노드마다 실행 (출력: 큐 디렉토리/nodes/<작업자 ID>)
+    python cluster.py status
+    python cluster.py merge --output-dir output
+"""
+
+import os
+import sys
+import time
+import socket
+import logging
+import argparse
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import config
+import metrics
+from logging_setup import setup_logging
+from scraper import IkpecScraper
+from http_fetcher import HttpFetcher
+from rate_limiter import HostRateLimiter
+from page_cache import PageCache
+from period_index import PeriodIndex, parse_year_spec, parse_month_spec
+from archive_index import write_archive_indexes
+from supervisor import DriverSupervisor, FAILURE_SESSION, RETRYABLE_FAILURES, classify_failure
+from manifest import ProgressManifest, STATE_DISCOVERED, STATE_WRITTEN
+from markdown_writer import write_file_if_changed, sync_directories
+from work_queue import (
+    WorkQueue, SharedRequestBudget, KIND_PERIOD, KIND_DECISION, STATUS_DONE, STATUS_FAILED, STATUS_LEASED
+)
+from main import (
+    resolve_target_periods,
+    prepare_decision_links,
+    fetch_decision_serial,
+    build_decision_record,
+    write_decision_record,
+    write_month_index
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+def default_nodes_dir(queue_path: str) -> str:
+    """작업자 출력 디렉토리의 기본 상위 경로 (큐 파일 옆의 nodes 디렉토리)"""
+    return os.path.join(os.path.dirname(os.path.abspath(queue_path)), 'nodes')
+
+
+# ----- init -----
+
+def enqueue_periods(queue: WorkQueue, args: argparse.Namespace) -> int:
+    """
+    대상 기간을 결정하여 큐에 추가합니다. (기간 탐색은 HTTP 페처만 사용하므로 브라우저가 필요 없음)
+
+    Args:
+        queue: 작업 큐
+        args: init 인자 (years, start, end, refresh_periods)
+
+    Returns:
+        새로 추가된 기간 수
+    """
+    rate_limiter = HostRateLimiter(shared_budget=SharedRequestBudget(queue))
+    fetcher = HttpFetcher(rate_limiter=rate_limiter)
+
+    def fetch_year_page(url: str) -> str:
+        rate_limiter.acquire(url)
+        return fetcher.get_page_source(url)
+
+    try:
+        periods = resolve_target_periods(args, PeriodIndex(fetch_func=fetch_year_page))
+    finally:
+        fetcher.close_session()
+
+    added = queue.add_periods(periods)
+    logger.info(f"대상 기간 {len(periods)}개 중 {added}개를 큐에 추가")
+    return added
+
+
+# ----- work -----
+
+def process_period_item(queue: WorkQueue, item: Dict, scraper: IkpecScraper, rate_limiter: HostRateLimiter) -> int:
+    """
+    기간 항목을 처리합니다. (목록 페이지에서 심의 링크를 찾아 심의 항목으로 추가)
+
+    Args:
+        queue: 작업 큐
+        item: 임대한 기간 항목
+        scraper: IkpecScraper 인스턴스
+        rate_limiter: 요청 예산 (공유 예산 포함)
+
+    Returns:
+        목록에서 발견된 심의 수
+    """
+    year, month, url = item['year'], item['month'], item['url']
+    if not scraper.is_cached(url):
+        rate_limiter.acquire(url)
+
+    decision_links = prepare_decision_links(scraper, year, month, url)
+    added = queue.add_decisions(item, decision_links)
+    logger.info(f"{year}년 {month}월: 심의 {len(decision_links)}건 발견, {added}건 큐에 추가")
+    return len(decision_links)
+
+
+def process_decision_item(item: Dict, output_dir: str, scraper: IkpecScraper,
+                          fetcher: Optional[HttpFetcher], rate_limiter: HostRateLimiter) -> Dict:
+    """
+    심의 항목을 처리합니다. (상세 페이지 수집, 파싱, 작업자 출력 디렉토리에 저장)
+
+    Args:
+        item: 임대한 심의 항목
+        output_dir: 작업자 출력 디렉토리
+        scraper: IkpecScraper 인스턴스
+        fetcher: HttpFetcher 인스턴스 (None이면 WebDriver만 사용)
+        rate_limiter: 요청 예산 (공유 예산 포함)
+
+    Returns:
+        complete에 넘길 결과 ('output_path', 'title', 'decision_type', 'newspaper' 키)
+    """
+    year, month = item['year'], item['month']
+    link_info = {
+        'url': item['url'],
+        'title': item['title'] or '',
+        'decision_no': item['item_id'],
+        'list_order': item['list_order'],
+    }
+
+    html_content = fetch_decision_serial(scraper, fetcher, rate_limiter, item['url'])
+    decision = build_decision_record(link_info, html_content)
+
+    month_dir = os.path.join(output_dir, f"{year}", f"{month:02d}")
+    index_entry = write_decision_record(decision, year, month, month_dir)
+
+    # 완료를 기록하기 전에 파일이 디스크에 반영되도록 (완료된 항목은 다른 작업자가 다시 가져가지 않음)
+    sync_directories()
+
+    return {
+        'output_path': os.path.join(f"{year}", f"{month:02d}", index_entry['filename']),
+        'title': index_entry['title'],
+        'decision_type': decision.get('decision_type'),
+        'newspaper': decision.get('newspaper'),
+    }
+
+
+def run_worker(queue: WorkQueue, worker_id: str, output_dir: str, scraper: IkpecScraper,
+               fetcher: Optional[HttpFetcher], rate_limiter: HostRateLimiter,
+               idle_poll: float = None) -> Dict[str, int]:
+    """
+    큐가 빌 때까지 항목을 임대하여 처리합니다.
+
+    Args:
+        queue: 작업 큐
+        worker_id: 작업자 식별자
+        output_dir: 작업자 출력 디렉토리
+        scraper: IkpecScraper 인스턴스 (세션이 끊기면 다시 시작)
+        fetcher: HttpFetcher 인스턴스 (None이면 WebDriver만 사용)
+        rate_limiter: 요청 예산 (공유 예산 포함)
+        idle_poll: 임대할 항목이 없을 때 다시 확인하는 간격 (초, None이면 config.CLUSTER_IDLE_POLL_SECONDS)
+
+    Returns:
+        {'periods': 처리한 기간 수, 'decisions': 저장한 심의 수, 'failures': 실패 횟수}
+    """
+    idle_poll = idle_poll if idle_poll is not None else config.CLUSTER_IDLE_POLL_SECONDS
+    supervisor = DriverSupervisor(scraper)
+    processed = {'periods': 0, 'decisions': 0, 'failures': 0}
+
+    while True:
+        item = queue.lease(worker_id)
+        if item is None:
+            # 다른 노드가 처리 중인 기간에서 심의 항목이 더 추가될 수 있으므로 모두 끝날 때까지 대기
+            if queue.outstanding() == 0:
+                break
+            time.sleep(idle_poll)
+            continue
+
+        try:
+            # 재시도/백오프로 처리가 임대 시간보다 길어져도 다른 작업자가 가져가지 않도록 처리 중 임대 연장
+            with queue.keep_leased(item, worker_id):
+                if item['kind'] == KIND_PERIOD:
+                    count = process_period_item(queue, item, scraper, rate_limiter)
+                else:
+                    result = process_decision_item(item, output_dir, scraper, fetcher, rate_limiter)
+            if item['kind'] == KIND_PERIOD:
+                queue.complete(item, worker_id, decision_count=count)
+                processed['periods'] += 1
+            else:
+                queue.complete(item, worker_id, **result)
+                processed['decisions'] += 1
+        except Exception as e:
+            failure = classify_failure(e)
+            processed['failures'] += 1
+            metrics.inc('errors', stage=item['kind'], type=type(e).__name__)
+            status = queue.release(item, worker_id, f"{type(e).__name__}: {e}", retry=failure in RETRYABLE_FAILURES)
+            if status == STATUS_FAILED:
+                metrics.inc('permanent_failures', failure=failure)
+                logger.error(f"영구 실패 ({failure}, {item['attempts']}회 시도): {item['url']} ({e})")
+            else:
+                metrics.inc('retries', failure=failure)
+                logger.warning(f"재시도 예약 ({item['attempts'] + 1}/{queue.max_attempts}, {failure}): {item['url']}")
+            # 항목을 먼저 돌려준 뒤 재시작 (재시작 횟수를 넘겨 중단되어도 항목이 임대 상태로 남지 않도록)
+            if failure == FAILURE_SESSION:
+                supervisor.restart_driver()
+        finally:
+            metrics.write_textfile()
+
+    logger.info(f"작업자 {worker_id} 종료: 기간 {processed['periods']}개, 심의 {processed['decisions']}건, "
+                f"실패 {processed['failures']}회")
+    return processed
+
+
+def work(queue: WorkQueue, worker_id: str, output_dir: str) -> Dict[str, int]:
+    """
+    스크레이퍼/페처/요청 예산을 준비하고 작업자를 실행합니다.
+
+    Args:
+        queue: 작업 큐
+        worker_id: 작업자 식별자
+        output_dir: 작업자 출력 디렉토리
+
+    Returns:
+        run_worker 결과
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    logger.info(f"작업자 {worker_id} 시작 (큐: {queue.path}, 출력: {output_dir})")
+
+    # 노드 안의 호스트별 예산(적응형)을 통과한 요청도 모든 노드 합계 예산을 기다림
+    rate_limiter = HostRateLimiter(shared_budget=SharedRequestBudget(queue))
+    cache = PageCache() if config.USE_PAGE_CACHE else None
+    fetcher = HttpFetcher(cache=cache, rate_limiter=rate_limiter) if config.USE_HTTP_FETCHER else None
+
+    metrics.registry.reset()
+    try:
+        with IkpecScraper(headless=config.HEADLESS_MODE, cache=cache, rate_limiter=rate_limiter) as scraper:
+            return run_worker(queue, worker_id, output_dir, scraper, fetcher, rate_limiter)
+    finally:
+        if fetcher is not None:
+            fetcher.close_session()
+        if cache is not None:
+            cache.close()
+
+
+# ----- merge -----
+
+def find_worker_output(relative_path: str, owner: Optional[str], inputs: List[str]) -> Optional[str]:
+    """
+    작업자 출력 디렉토리들에서 심의 파일을 찾습니다. (완료를 기록한 작업자의 디렉토리 우선)
+
+    Args:
+        relative_path: 작업자 출력 디렉토리 기준 상대 경로
+        owner: 완료를 기록한 작업자 식별자
+        inputs: 작업자 출력 디렉토리 리스트
+
+    Returns:
+        파일 경로, 찾지 못했으면 None
+    """
+    ordered = sorted(inputs, key=lambda directory: os.path.basename(os.path.normpath(directory)) != owner)
+    for directory in ordered:
+        path = os.path.join(directory, relative_path)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def merge_outputs(queue: WorkQueue, inputs: List[str], output_dir: str,
+                  manifest_path: str = None) -> Dict[str, int]:
+    """
+    완료된 심의 파일을 출력 디렉토리의 output/YYYY/MM 구조로 합치고 인덱스를 작성합니다.
+    여러 번 실행해도 되며, 내용이 같은 파일은 다시 쓰지 않습니다.
+
+    Args:
+        queue: 작업 큐
+        inputs: 작업자 출력 디렉토리 리스트
+        output_dir: 병합 출력 디렉토리
+        manifest_path: 병합 결과를 기록할 매니페스트 경로 (None이면 config.MANIFEST_PATH,
+                       main.py를 다시 실행하면 병합된 심의는 건너뜀)
+
+    Returns:
+        {'periods': 병합한 기간 수, 'decisions': 병합한 심의 수, 'missing': 파일을 찾지 못한 심의 수}
+    """
+    decisions_by_period: Dict[str, List[Dict]] = defaultdict(list)
+    for item in queue.items(KIND_DECISION):
+        decisions_by_period[item['period_url']].append(item)
+
+    manifest = ProgressManifest(manifest_path)
+    merged = {'periods': 0, 'decisions': 0, 'missing': 0}
+    years = set()
+
+    try:
+        for period in queue.items(KIND_PERIOD, STATUS_DONE):
+            url, year, month = period['url'], period['year'], period['month']
+            decisions = decisions_by_period.get(url, [])
+
+            # 이전 병합/실행에서 저장된 심의 (월별 인덱스를 기존 + 새 심의로 재구성,
+            # 한 달에 심의일이 둘 이상이면 같은 달의 다른 기간에서 저장된 심의도 포함)
+            stored = {entry['decision_no']: entry for entry in manifest.month_written_decisions(year, month)}
+
+            manifest.record_discovered(url, [
+                {'decision_no': d['item_id'], 'url': d['url'], 'title': d['title']} for d in decisions
+            ])
+            manifest.mark_period(url, year, month, STATE_DISCOVERED, period['decision_count'])
+
+            month_dir = os.path.join(output_dir, f"{year}", f"{month:02d}")
+            saved_files = []
+            for decision in decisions:
+                if decision['status'] != STATUS_DONE:
+                    continue
+                source = find_worker_output(decision['output_path'], decision['owner'], inputs)
+                if source is None:
+                    logger.warning(f"작업자 출력 파일 없음: {decision['output_path']} ({decision['owner']})")
+                    merged['missing'] += 1
+                    continue
+
+                with open(source, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                os.makedirs(month_dir, exist_ok=True)
+                filepath = os.path.join(month_dir, os.path.basename(source))
+                write_file_if_changed(filepath, content)
+
+                manifest.mark_decision(decision['item_id'], STATE_WRITTEN, output_path=filepath,
+                                       title=decision['title'], decision_type=decision['decision_type'],
+                                       newspaper=decision['newspaper'])
+                saved_files.append({
+                    'decision_no': decision['item_id'],
+                    'manifest_key': decision['item_id'],
+                    'title': decision['title'] or '',
+                    'url': decision['url'],
+                    'filename': os.path.basename(filepath),
+                    'list_order': decision['list_order'],
+                })
+
+            # 다시 병합한 심의는 이번 항목으로 대체 (모두 다시 병합했으면 두 번째 병합도 목록 순서를 유지)
+            for entry in saved_files:
+                stored.pop(entry['manifest_key'], None)
+            write_month_index(saved_files, year, month, month_dir, stored)
+
+            if manifest.pending_count(url) == 0:
+                manifest.mark_period(url, year, month, STATE_WRITTEN)
+
+            merged['periods'] += 1
+            merged['decisions'] += len(saved_files)
+            years.add(year)
+            logger.info(f"{year}년 {month}월 병합: 심의 {len(saved_files)}건")
+
+        manifest.flush()
+        if config.WRITE_ARCHIVE_INDEXES and years:
+            write_archive_indexes(manifest.index_entries(), output_dir, years=years)
+    finally:
+        manifest.close()
+
+    return merged
+
+
+# ----- status -----
+
+def print_status(queue: WorkQueue, limit: int = 20):
+    """
+    종류/상태별 항목 수, 임대 중인 항목, 실패 항목을 출력합니다.
+
+    Args:
+        queue: 작업 큐
+        limit: 출력할 임대/실패 항목 최대 수
+    """
+    counts = queue.counts()
+    for kind, label in ((KIND_PERIOD, '기간'), (KIND_DECISION, '심의')):
+        by_status = counts.get(kind, {})
+        summary = ', '.join(f"{status} {n}" for status, n in sorted(by_status.items())) or '없음'
+        print(f"{label}: {summary}")
+
+    # 임대 만료 시각은 파일 서버 시계 기준이므로 같은 시계로 남은 시간을 계산
+    now = queue.now()
+    for kind in (KIND_PERIOD, KIND_DECISION):
+        for item in queue.items(kind, STATUS_LEASED)[:limit]:
+            remaining = (item['lease_expires'] or now) - now
+            state = f"{remaining:.0f}초 남음" if remaining > 0 else "임대 만료"
+            print(f"  임대 중 [{item['owner']}, {state}] {item['url']}")
+
+    failed = queue.items(KIND_PERIOD, STATUS_FAILED) + queue.items(KIND_DECISION, STATUS_FAILED)
+    if failed:
+        print(f"실패 {len(failed)}건:")
+        for item in failed[:limit]:
+            print(f"  - {item['url']} ({item['attempts']}회 시도): {item['last_error']}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    명령행 인자를 해석합니다.
+
+    Args:
+        argv: 인자 리스트 (None이면 sys.argv 사용)
+
+    Returns:
+        해석된 인자 (command 외 명령별 인자)
+    """
+    arg_parser = argparse.ArgumentParser(description="신문윤리위원회 심의결정 분산 수집")
+    arg_parser.add_argument('--queue', default=config.CLUSTER_QUEUE_PATH,
+                            help=f"공유 작업 큐 경로 (기본값: {config.CLUSTER_QUEUE_PATH})")
+    arg_parser.add_argument('--log-format', choices=('text', 'json'),
+                            help="로그 파일 형식 (생략 시 config.LOG_FORMAT)")
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+
+    init_parser = commands.add_parser('init', help="대상 기간을 큐에 추가")
+    init_parser.add_argument('--years', type=parse_year_spec,
+                             help="대상 연도 (예: 2023, 2019-2022, 2019,2021)")
+    init_parser.add_argument('--from', dest='start', type=parse_month_spec,
+                             help="시작 연월 (YYYY-MM, 포함)")
+    init_parser.add_argument('--to', dest='end', type=parse_month_spec,
+                             help="종료 연월 (YYYY-MM, 포함, 생략 시 이번 달)")
+    init_parser.add_argument('--refresh-periods', action='store_true',
+                             help="저장된 기간 인덱스를 무시하고 연도별 목록 페이지를 다시 요청")
+
+    work_parser = commands.add_parser('work', help="큐의 항목을 임대하여 처리")
+    work_parser.add_argument('--worker-id', default=f"{socket.gethostname()}-{os.getpid()}",
+                             help="작업자 식별자 (기본값: 호스트명-PID)")
+    work_parser.add_argument('--output-dir',
+                             help="작업자 출력 디렉토리 (기본값: 큐 디렉토리/nodes/<작업자 ID>)")
+
+    commands.add_parser('status', help="항목 상태 출력")
+
+    merge_parser = commands.add_parser('merge', help="작업자 출력을 출력 디렉토리로 병합")
+    merge_parser.add_argument('--inputs', nargs='+',
+                              help="작업자 출력 디렉토리 (기본값: 큐 디렉토리/nodes 아래의 모든 디렉토리)")
+    merge_parser.add_argument('--output-dir', default=config.OUTPUT_DIR,
+                              help=f"병합 출력 디렉토리 (기본값: {config.OUTPUT_DIR})")
+    merge_parser.add_argument('--manifest',
+                              help="병합 결과를 기록할 매니페스트 (기본값: 출력 디렉토리/manifest.db)")
+
+    return arg_parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    """분산 수집 명령행"""
+    args = parse_args(argv)
+    setup_logging(log_format=args.log_format)
+
+    queue = WorkQueue(args.queue)
+    try:
+        if args.command == 'init':
+            try:
+                enqueue_periods(queue, args)
+            except Exception as e:
+                print(f"대상 기간 탐색 실패: {e}", file=sys.stderr)
+                sys.exit(1)
+            print_status(queue)
+        elif args.command == 'work':
+            output_dir = args.output_dir or os.path.join(default_nodes_dir(args.queue), args.worker_id)
+            work(queue, args.worker_id, output_dir)
+        elif args.command == 'status':
+            print_status(queue)
+        else:
+            inputs = args.inputs
+            if not inputs:
+                nodes_dir = default_nodes_dir(args.queue)
+                inputs = [os.path.join(nodes_dir, name) for name in sorted(os.listdir(nodes_dir))] \
+                    if os.path.isdir(nodes_dir) else []
+            manifest_path = args.manifest or os.path.join(args.output_dir, 'manifest.db')
+            merged = merge_outputs(queue, inputs, args.output_dir, manifest_path)
+            print(f"병합 완료: 기간 {merged['periods']}개, 심의 {merged['decisions']}건 "
+                  f"(파일 없음 {merged['missing']}건) → {os.path.abspath(args.output_dir)}")
+            if queue.outstanding():
+                print(f"아직 끝나지 않은 항목 {queue.outstanding()}건이 있습니다. 작업자가 끝난 뒤 다시 병합하세요.")
+    finally:
+        queue.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -14,7 +14,15 @@ BASE_URL = "https://www.ikpec.or.kr"
 # 개별 심의 페이지 URL 패턴
 DECISION_DETAIL_URL = f"{BASE_URL}/m2/sub2_1_1.asp"
 
-# 크롤링 대상 월별 목록 페이지 URL
+# 월별/연도별 목록 페이지 URL 패턴 (?Year=YYYY[&DecideBaseNo=Y........])
+MONTH_LIST_URL = f"{BASE_URL}/m2/sub2_1.asp"
+
+# 기간 자동 탐색 (python main.py --years 2019-2022 처럼 실행할 때 사용)
+# 연도별 목록 페이지에서 찾은 심의일(DecideBaseNo)을 저장해 두고 다음 실행에서 다시 사용합니다.
+PERIOD_INDEX_PATH = ".cache/periods.json"
+PERIOD_INDEX_TTL_SECONDS = 24 * 3600  # 해가 끝나기 전에 찾은 심의일 목록의 유효 시간 (해가 끝난 뒤 찾은 연도는 다시 요청하지 않음)
+
+# 크롤링 대상 월별 목록 페이지 URL (명령행에서 --years/--from/--to를 지정하지 않은 경우 사용)
 # 형식: (연도, 월, 해당 월의 목록 페이지 URL)
 # 주의: 2019년, 2020년, 2021년, 2022년 모두 8월은 심의가 없음
 TARGET_MONTH_URLS = [
@@ -78,17 +86,162 @@ TARGET_MONTH_URLS = [
 # Selenium 설정
 SELENIUM_TIMEOUT = 10  # 페이지 로딩 대기 시간 (초)
 HEADLESS_MODE = True   # True: 브라우저 창을 보이지 않게 실행
+CHROMEDRIVER_PATH = "/usr/local/bin/chromedriver"
+
+# 브라우저와 HTTP 페처가 함께 쓰는 User-Agent (봇 차단 방지, headless Chrome 기본값의 HeadlessChrome 대신 사용)
+USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+    'AppleWebKit/537.36 (KHTML, like Gecko) '
+    'Chrome/120.0.0.0 Safari/537.36'
+)
+
+# 상시 실행 브라우저 (python browser_daemon.py start로 미리 띄워 두면 실행마다 Chrome을 새로 시작하지 않고 연결)
+# 영구 프로필과 디스크 캐시를 유지하므로 쿠키/정적 리소스가 실행 사이에 재사용됨
+# 주소에 응답하는 브라우저가 없으면 기존처럼 새 브라우저를 실행 (빈 문자열이면 연결을 시도하지 않음)
+BROWSER_DAEMON_ADDRESS = "127.0.0.1:9222"
+BROWSER_PROFILE_DIR = ".cache/browser-profile"
+BROWSER_DAEMON_STATE = ".cache/browser_daemon.json"
+CHROME_BINARY = None  # None이면 PATH에서 google-chrome/chromium을 찾음
+
+# 페이지 준비 조건 (고정 대기 대신 해당 요소가 나타나면 즉시 진행, 최대 SELENIUM_TIMEOUT초)
+LIST_READY_SELECTOR = "div.rst_list_l li"       # 월별 목록 페이지
+DETAIL_READY_SELECTOR = "div.rst_result_view"   # 개별 심의 페이지
+
+# 경량 브라우저 모드: 파서가 보지 않는 이미지/스타일시트/글꼴을 받지 않고,
+# 하위 리소스를 기다리지 않고 DOM 구성이 끝나면 바로 진행 (pageLoadStrategy='eager')
+# 목록이 JavaScript로 그려지므로 스크립트는 차단하지 않음
+LEAN_BROWSER = True
+LEAN_BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.bmp", "*.webp", "*.svg", "*.ico",
+    "*.css", "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.swf",
+]
+
+# HTTP 페처 설정 (상세 페이지를 requests로 먼저 가져오고, 실패 시 Selenium 사용)
+USE_HTTP_FETCHER = True  # False: 모든 상세 페이지를 Selenium으로 가져옴
+HTTP_TIMEOUT = 10        # HTTP 요청 타임아웃 (초)
+HTTP_POOL_SIZE = 4       # 호스트당 keep-alive 연결 수
+
+# 상세 페이지 수집 방식
+#   "serial": 한 건씩 순차 처리
+#   "pool":   DRIVER_POOL_SIZE개의 WebDriver 작업 스레드로 병렬 처리
+#   "async":  HTTP 페처로 ASYNC_MAX_IN_FLIGHT개의 요청을 동시에 진행 (USE_HTTP_FETCHER 필요)
+FETCH_BACKEND = "async"
+DRIVER_POOL_SIZE = 2      # "pool" 방식의 드라이버 수
+ASYNC_MAX_IN_FLIGHT = 4   # "async" 방식의 최대 동시 요청 수 (HTTP_POOL_SIZE 이하 권장)
+
+# 실패 처리: 일시적 오류(네트워크, 시간 초과, 브라우저 세션 종료)는 재시도 큐에 넣고 지수 백오프 후 다시 시도
+# 세션이 끊기면 드라이버를 다시 시작하며, 재시도 횟수를 넘겼거나 영구 오류인 항목은 실행 끝에 보고
+MAX_FETCH_ATTEMPTS = 4          # 항목당 최대 시도 횟수 (첫 시도 포함)
+RETRY_BACKOFF_BASE = 2.0        # 첫 재시도 대기 시간 (초, 이후 2배씩 증가)
+RETRY_BACKOFF_CAP = 60.0        # 최대 재시도 대기 시간 (초)
+MAX_DRIVER_RESTARTS = 10        # 실행당 최대 드라이버 재시작 횟수 (넘으면 실행 중단)
+
+# 요청 속도 제한 (호스트별 토큰 버킷, 모든 작업자 합계)
+HOST_REQUESTS_PER_SECOND = 0.5  # 초당 평균 요청 수
+HOST_BURST_SIZE = 2             # 연속으로 보낼 수 있는 최대 요청 수
+
+# 적응형 요청 속도 (AIMD): HOST_REQUESTS_PER_SECOND에서 시작하여 응답 지연 평균이 목표 이하이면 응답마다
+# 조금씩 올리고, 시간 초과/연결 오류/403/429/5xx 응답이나 지연 급증 시 절반으로 낮춤 (아래 범위 밖으로는 조정하지 않음)
+# 속도가 시작 값보다 오르면 랜덤 지연(REQUEST_DELAY_RANGE)도 같은 비율로 줄어듦
+ADAPTIVE_PACING = True
+PACING_MIN_RATE = 0.1             # 초당 요청 수 하한
+PACING_MAX_RATE = 2.0             # 초당 요청 수 상한
+PACING_TARGET_LATENCY = 1.0       # 속도를 올릴 수 있는 응답 지연 평균 상한 (초)
+PACING_SPIKE_FACTOR = 3.0         # 응답 하나가 목표의 3배를 넘으면 지연 급증으로 보고 속도를 낮춤
+PACING_INCREASE_STEP = 0.05       # 목표 이하 응답마다 올릴 초당 요청 수
+PACING_DECREASE_FACTOR = 0.5      # 혼잡 신호 시 곱할 비율
+PACING_DECREASE_COOLDOWN = 5.0    # 속도를 낮춘 뒤 조정을 보류할 시간 (초, 이미 보낸 요청의 응답은 반영하지 않음)
+PACING_LOG_INTERVAL = 30.0        # 속도 증가를 로그로 남길 최소 간격 (초, 감소는 항상 기록)
+
+# 응답 캐시 설정 (목록/상세 페이지를 디스크에 압축 저장하여 재실행 시 다시 요청하지 않음)
+USE_PAGE_CACHE = True
+CACHE_DIR = ".cache/pages"
+CACHE_TTL_SECONDS = 7 * 24 * 3600      # 최근 페이지의 유효 시간 (7일)
+CACHE_IMMUTABLE_AFTER_DAYS = 90        # 심의일(DecideBaseNo)로부터 90일이 지난 페이지는 만료되지 않음
+CACHE_MAX_BYTES = 500 * 1024 * 1024    # 캐시 전체 크기 한도, 초과 시 오래 사용하지 않은 항목부터 삭제
 
 # 출력 디렉토리
 OUTPUT_DIR = "output"
 
-# 요청 간 대기 시간 설정 (초) - 서버 부하 방지 및 탐지 회피
-# (최소, 최대) 초 사이의 임의의 시간만큼 대기합니다.
-REQUEST_DELAY_RANGE = (2.0, 4.0)  # 2초에서 4초 사이 랜덤 대기
+# 마크다운 저장: 내용(생성 시간 제외)이 기존 파일과 같으면 다시 쓰지 않고, 임시 파일에 쓴 뒤 이름을 바꿔 교체
+# 디렉토리 fsync는 월 단위로 한 번 수행하며, True이면 파일마다 내용도 fsync (느리지만 전원 차단에도 안전)
+MARKDOWN_FSYNC_FILES = False
+
+# 진행 상황 매니페스트 (중단 후 재실행 시 완료된 기간/심의를 건너뜀)
+USE_MANIFEST = True
+MANIFEST_PATH = f"{OUTPUT_DIR}/manifest.db"
+MANIFEST_COMMIT_INTERVAL = 20  # 심의 단위 변경은 20건마다 커밋 (종료 신호 수신 시 즉시 기록)
+
+# 실패 보고서: 재시도 후에도 가져오지 못한 심의/기간 목록 (실행마다 갱신)
+FAILURE_REPORT_PATH = f"{OUTPUT_DIR}/failures.json"
+
+# 코퍼스 저장소: 심의 레코드를 SQLite에도 기록 (결정유형/언론사/기간 색인, 마크다운 파일은 그대로 저장)
+USE_CORPUS_STORE = False
+CORPUS_DB_PATH = f"{OUTPUT_DIR}/corpus.db"
+CORPUS_COMMIT_INTERVAL = 100  # 100건마다 한 트랜잭션으로 커밋 (월 처리가 끝나면 즉시 커밋)
+USE_SEARCH_INDEX = True      # 코퍼스 저장소에 전문 검색 색인(바이그램 FTS5)도 유지 (search_index.py로 검색)
+
+# 증분 모드: 완료된 기간도 목록 페이지를 새로 받아 저장되지 않은 심의만 수집
+# (출력 디렉토리의 기존 파일과 매니페스트를 모두 확인하며, 월별 인덱스는 기존 + 새 심의로 재작성)
+INCREMENTAL_MODE = False
+
+# 연도별/전체 인덱스 (output/YYYY/INDEX_YYYY.md, output/INDEX.md - 결정유형별/언론사별 집계 포함)
+# 매니페스트에 기록된 정보로 만들며, 기간 처리가 끝날 때마다 해당 연도와 전체 인덱스만 갱신 (USE_MANIFEST 필요)
+WRITE_ARCHIVE_INDEXES = True
+
+# 파이프라인 처리: 페이지가 도착하는 대로 파싱/저장 (False: 한 달치를 모두 받은 뒤 저장)
+USE_PIPELINE = True
+PIPELINE_PARSE_WORKERS = 2      # 파싱 작업 스레드 수
+PIPELINE_QUEUE_SIZE = 16        # 단계 사이 큐의 최대 크기 (가득 차면 앞 단계가 대기)
+PIPELINE_MONITOR_INTERVAL = 10  # 단계별 큐 깊이를 로그로 남길 주기 (초, 0이면 기록 안 함)
+PIPELINE_SHUTDOWN_TIMEOUT = 30  # 중단 시 진행 중인 파싱/저장이 끝나기를 기다리는 최대 시간 (초)
+
+# 파싱 프로세스 풀: 파싱 단계를 작업 프로세스에서 실행하여 여러 코어 사용 (GIL로 막히지 않음)
+# 파싱 큐에 쌓인 페이지를 최대 PARSE_CHUNK_SIZE개씩 묶어 보내 프로세스 간 통신 횟수를 줄임
+# 평소 수집은 요청 속도 제한 때문에 파싱이 병목이 아니고 페이지를 프로세스 사이로 보내는 비용이 더 크므로 기본은 사용 안 함
+# (파싱 큐가 계속 차 있을 때만 켜고, 캐시된 페이지 재파싱은 reparse.py가 모든 코어를 사용)
+PARSE_PROCESSES = 0     # 파이프라인 파싱 프로세스 수 (0이면 파싱 스레드에서 직접 파싱)
+PARSE_CHUNK_SIZE = 16   # 한 번에 보낼 최대 페이지 수 (reparse.py도 같은 값 사용)
+
+# 분산 수집 (python cluster.py): 공유 파일시스템의 작업 큐로 여러 노드가 기간/심의를 나누어 수집한 뒤 병합
+# 작업자마다 HOST_REQUESTS_PER_SECOND 예산(적응형 조정 포함)을 따로 지키고, 모든 노드 합계는 CLUSTER_REQUESTS_PER_SECOND를 넘지 않음
+# 임대 만료와 전역 요청 시각은 파일 서버 시계 기준 (큐 파일 옆 시계 파일의 수정 시각으로 노드 시계와의 차이를 구함)
+CLUSTER_QUEUE_PATH = "cluster/queue.db"   # 모든 노드가 접근하는 공유 경로 (예: /mnt/shared/ikpec/queue.db)
+CLUSTER_LEASE_SECONDS = 300               # 작업자가 완료를 기록하거나 임대를 연장하지 않으면 항목을 다시 내주기까지의 시간 (초)
+                                          # 처리 중에는 이 시간의 1/3마다 임대를 연장 (작업자가 죽으면 연장이 멈춤)
+CLUSTER_REQUESTS_PER_SECOND = None        # 모든 노드 합계 호스트당 초당 요청 수
+                                          # (None이면 노드 하나의 상한과 같음: ADAPTIVE_PACING이면 PACING_MAX_RATE)
+CLUSTER_CLOCK_SYNC_SECONDS = 60.0         # 파일 서버 시계와의 차이를 다시 구하는 간격 (초)
+CLUSTER_LOCK_TIMEOUT = 30.0               # 큐 파일 잠금 대기 시간 (초)
+CLUSTER_IDLE_POLL_SECONDS = 5.0           # 임대할 항목이 없지만 다른 노드가 처리 중일 때 다시 확인하는 간격 (초)
+
+# 로그 설정 (로그는 큐를 거쳐 백그라운드 스레드에서 기록되며, 수집 작업은 로그 파일 쓰기를 기다리지 않음)
+LOG_FILE = "scraper.log"
+LOG_FORMAT = "text"                 # "text": 한 줄 텍스트, "json": JSON Lines (url, decision_no, stage, duration_ms 필드)
+LOG_MAX_BYTES = 10 * 1024 * 1024    # 로그 파일이 10MB를 넘으면 회전 (0이면 회전하지 않음)
+LOG_BACKUP_COUNT = 5                # 보관할 회전 파일 수 (scraper.log.1.gz ~ scraper.log.5.gz, gzip 압축)
+
+# 실행 지표: 단계별 처리 시간(이동, 대기, 소스 전송, 파싱, 렌더링, 저장), 바이트 수, 오류 유형별 건수
+METRICS_TEXTFILE = f"{OUTPUT_DIR}/metrics.prom"           # Prometheus 텍스트 파일 (기간마다 갱신, None이면 기록 안 함)
+METRICS_SUMMARY_PATH = f"{OUTPUT_DIR}/run_summary.json"   # 실행 종료 시 요약 JSON (None이면 기록 안 함)
+METRICS_HTTP_PORT = 0                                     # 로컬 /metrics 엔드포인트 포트 (0이면 사용 안 함, 예: 9108)
+
+# 요청별 랜덤 지연 설정 (초) - 탐지 회피
+# 토큰 버킷 대기에 (최소, 최대) 초 사이의 임의의 시간이 더해집니다.
+# 비동기/풀 방식에서는 한 요청의 지연이 다른 요청의 네트워크 시간과 겹쳐 진행됩니다.
+USE_RANDOM_DELAY = True           # False: 토큰 버킷 간격만 사용
+REQUEST_DELAY_RANGE = (2.0, 4.0)  # 2초에서 4초 사이 랜덤 지연 (토큰 버킷 도입 전 요청 간 대기와 같은 하한)
 
 # 인코딩 설정
 ENCODING = "euc-kr"  # 신문윤리위원회 웹사이트는 EUC-KR 사용
 
+# HTML 파서 방식
+# "lxml": 미리 컴파일한 XPath로 목록/본문 컨테이너만 탐색 (기본값, html.parser보다 10배 이상 빠름)
+# "html.parser": 기존 BeautifulSoup 트리 탐색 (목록/본문 컨테이너만 트리로 만듦)
+# 두 방식의 결과는 같습니다. 캐시된 페이지로 확인하려면 benchmark_parser.py를 실행하세요.
+PARSER_BACKEND = "lxml"
+
 
 def get_random_delay():
     """
@@ -0,0 +1,196 @@
+"""
+심의 결정 코퍼스 저장소 모듈
+파싱한 심의 레코드를 마크다운 파일과 함께 SQLite 데이터베이스에도 기록하여,
+후속 작업이 마크다운 파일을 다시 읽고 파싱하지 않고 색인된 열로 바로 조회할 수 있도록 합니다.
+
+조회 예:
+    with CorpusStore() as store:
+        store.find(decision_type='경고', newspaper='OO일보')
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Dict, List, Optional
+
+import config
+
+
+# 레코드에서 데이터베이스에 기록하는 본문 필드
+RECORD_FIELDS = (
+    'decision_no', 'decision_type', 'title', 'newspaper', 'publisher',
+    'decision_text', 'reason', 'applied_rules', 'full_content', 'url',
+)
+
+
+def record_hash(record: Dict[str, any]) -> str:
+    """
+    레코드 본문 필드의 해시를 반환합니다. (변경 여부 확인용)
+
+    Args:
+        record: 심의 데이터
+
+    Returns:
+        SHA-256 16진수 문자열
+    """
+    payload = json.dumps([record.get(field) or '' for field in RECORD_FIELDS], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class CorpusStore:
+    """심의 레코드를 보관하는 SQLite 코퍼스 저장소"""
+
+    def __init__(self, path: str = None, commit_interval: int = None):
+        """
+        저장소 초기화
+
+        Args:
+            path: SQLite 파일 경로
+            commit_interval: 몇 건의 기록마다 커밋할지 (한 트랜잭션으로 묶음)
+        """
+        self.path = path or config.CORPUS_DB_PATH
+        self.commit_interval = commit_interval if commit_interval is not None else config.CORPUS_COMMIT_INTERVAL
+        self.logger = logging.getLogger(__name__)
+        self._pending = 0
+        self._lock = threading.RLock()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS decisions (
+                decision_no TEXT PRIMARY KEY,
+                decision_type TEXT,
+                title TEXT,
+                newspaper TEXT,
+                publisher TEXT,
+                decision_text TEXT,
+                reason TEXT,
+                applied_rules TEXT,
+                full_content TEXT,
+                url TEXT,
+                year INTEGER NOT NULL,
+                month INTEGER NOT NULL,
+                content_hash TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_corpus_type_newspaper ON decisions (decision_type, newspaper);
+            CREATE INDEX IF NOT EXISTS idx_corpus_newspaper ON decisions (newspaper);
+            CREATE INDEX IF NOT EXISTS idx_corpus_period ON decisions (year, month);
+        ''')
+        self._conn.commit()
+
+    def _changed(self):
+        """기록 건수를 세고 커밋 주기에 도달하면 커밋"""
+        with self._lock:
+            self._pending += 1
+            if self._pending >= self.commit_interval:
+                self.flush()
+
+    def flush(self):
+        """보류 중인 기록을 디스크에 반영"""
+        with self._lock:
+            if self._conn is not None and self._pending:
+                self._conn.commit()
+                self._pending = 0
+
+    def close(self):
+        """기록을 반영하고 연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self.flush()
+                self._conn.close()
+                self._conn = None
+
+    def upsert(self, record: Dict[str, any], year: int, month: int) -> bool:
+        """
+        심의 레코드를 추가하거나 갱신합니다. 내용이 같으면 기록하지 않습니다.
+
+        Args:
+            record: 심의 데이터 (parse_decision_detail 결과 + url)
+            year: 연도
+            month: 월
+
+        Returns:
+            새로 기록했으면 True, 내용이 같아 건너뛰었으면 False
+        """
+        decision_no = record.get('decision_no') or record.get('manifest_key')
+        if not decision_no:
+            raise ValueError(f"결정번호가 없는 레코드는 저장할 수 없습니다: {record.get('url')}")
+
+        values = {field: record.get(field) or '' for field in RECORD_FIELDS}
+        values.update(decision_no=decision_no, year=year, month=month,
+                      content_hash=record_hash(record), updated_at=time.time())
+
+        columns = ', '.join(values)
+        placeholders = ', '.join(f':{name}' for name in values)
+        updates = ', '.join(f'{name} = excluded.{name}' for name in values if name != 'decision_no')
+
+        with self._lock:
+            cursor = self._conn.execute(
+                f'INSERT INTO decisions ({columns}) VALUES ({placeholders}) '
+                f'ON CONFLICT(decision_no) DO UPDATE SET {updates} '
+                f'WHERE decisions.content_hash != excluded.content_hash',
+                values
+            )
+            if cursor.rowcount == 0:
+                return False
+            self._changed()
+        return True
+
+    def find(self, decision_type: str = None, newspaper: str = None, year: int = None,
+             month: int = None, limit: int = None) -> List[Dict[str, any]]:
+        """
+        조건에 맞는 심의 레코드를 조회합니다. (지정한 조건만 적용, 결정번호 내림차순)
+
+        Args:
+            decision_type: 결정유형 (예: '경고')
+            newspaper: 언론사
+            year: 연도
+            month: 월
+            limit: 최대 건수
+
+        Returns:
+            심의 레코드 딕셔너리 리스트
+        """
+        conditions = []
+        params = []
+        for column, value in (('decision_type', decision_type), ('newspaper', newspaper),
+                              ('year', year), ('month', month)):
+            if value is not None:
+                conditions.append(f'{column} = ?')
+                params.append(value)
+
+        query = 'SELECT * FROM decisions'
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY year DESC, month DESC, decision_no DESC'
+        if limit is not None:
+            query += ' LIMIT ?'
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def count(self) -> int:
+        """저장된 심의 수를 반환합니다."""
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM decisions').fetchone()[0]
+
+    def __enter__(self):
+        """컨텍스트 매니저 진입"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """컨텍스트 매니저 종료"""
+        self.close()
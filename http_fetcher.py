@@ -0,0 +1,183 @@
+"""
+requests 기반 HTTP 페처
+서버에서 렌더링된 심의 상세 페이지를 브라우저 없이 가져옵니다.
+
+keep-alive 연결 풀과 gzip 압축을 사용하는 requests.Session 하나를 재사용하며,
+페이지 구조 검사에 실패하면 None을 반환하여 호출 측이 Selenium 경로로
+대체할 수 있도록 합니다. 요청 실패(네트워크 오류, 시간 초과, 403/429/5xx 등)는
+그대로 예외로 전달하여 요청 속도 조절과 재시도 백오프를 거치게 합니다.
+"""
+
+import time
+import logging
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import config
+import metrics
+from parser import is_valid_detail_page
+from page_cache import PageCache
+from rate_limiter import HostRateLimiter
+
+
+# 브라우저를 모방한 헤더 (test_html_with_headers.py에서 확인된 구성)
+DEFAULT_HEADERS = {
+    'User-Agent': config.USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Referer': f'{config.BASE_URL}/',
+}
+
+
+class HttpFetcher:
+    """requests.Session 기반 페이지 페처"""
+
+    def __init__(self, timeout: float = None, pool_size: int = None, cache: Optional[PageCache] = None,
+                 rate_limiter: Optional[HostRateLimiter] = None):
+        """
+        페처 초기화
+
+        Args:
+            timeout: 요청 타임아웃 (초)
+            pool_size: 호스트당 유지할 keep-alive 연결 수
+            cache: 페이지 응답 캐시 (None이면 캐시 사용 안 함)
+            rate_limiter: 응답 지연/오류를 알려 줄 요청 예산 (적응형 속도 조절용, None이면 알리지 않음)
+        """
+        self.timeout = timeout if timeout is not None else config.HTTP_TIMEOUT
+        self.pool_size = pool_size if pool_size is not None else config.HTTP_POOL_SIZE
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.session = None
+        self.logger = logging.getLogger(__name__)
+
+    def setup_session(self):
+        """연결 풀을 사용하는 requests.Session 설정"""
+        session = requests.Session()
+        session.headers.update(DEFAULT_HEADERS)
+
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        self.session = session
+        self.logger.info("HTTP 세션 설정 완료")
+
+    def close_session(self):
+        """HTTP 세션 종료"""
+        if self.session:
+            self.session.close()
+            self.session = None
+            self.logger.info("HTTP 세션 종료")
+
+    def get_page_source(self, url: str) -> str:
+        """
+        URL에 HTTP GET 요청을 보내 페이지 소스를 가져옵니다.
+
+        Args:
+            url: 접근할 URL
+
+        Returns:
+            디코딩된 HTML 소스
+
+        Raises:
+            requests.RequestException: 네트워크 오류 또는 HTTP 오류 상태 코드
+        """
+        if self.session is None:
+            self.setup_session()
+
+        start = time.perf_counter()
+        response = None
+        error = None
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            error = e
+            metrics.inc('errors', stage='http_fetch', type=type(e).__name__)
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            metrics.observe('stage_seconds', elapsed, stage='http_fetch')
+            if self.rate_limiter is not None:
+                # 응답 지연과 상태 코드를 요청 속도 조절에 반영 (응답을 받지 못했으면 지연 없이 오류만)
+                self.rate_limiter.record_response(
+                    url, elapsed if response is not None else None,
+                    status=response.status_code if response is not None else None, error=error
+                )
+
+        self.logger.info(f"HTTP 요청: {url} ({response.status_code}, {elapsed * 1000:.0f}ms)",
+                         extra={'url': url, 'stage': 'http_fetch', 'duration_ms': round(elapsed * 1000, 1)})
+
+        metrics.inc('bytes_fetched', len(response.content), source='http')
+
+        # Content-Type에 charset이 없으면 requests는 ISO-8859-1로 가정하므로 직접 지정
+        if 'charset' not in response.headers.get('Content-Type', '').lower():
+            response.encoding = config.ENCODING
+
+        # EUC-KR 페이지에 섞인 확장 한글을 처리하기 위해 상위 호환인 CP949로 디코딩
+        if response.encoding and response.encoding.lower().replace('_', '-') in ('euc-kr', 'ks-c-5601-1987'):
+            response.encoding = 'cp949'
+
+        return response.text
+
+    def is_cached(self, url: str) -> bool:
+        """
+        URL이 캐시에 있어 요청 없이 처리되는지 확인합니다.
+
+        Args:
+            url: 확인할 URL
+
+        Returns:
+            캐시 적중 여부
+        """
+        return self.cache is not None and self.cache.contains(url)
+
+    def get_decision_detail(self, url: str) -> Optional[str]:
+        """
+        개별 심의 페이지를 가져오고 구조를 검사합니다.
+        구조 검사를 통과한 페이지만 캐시에 저장하고, 캐시에 있으면 요청하지 않습니다.
+
+        Args:
+            url: 심의 페이지 URL
+
+        Returns:
+            페이지 HTML 소스 (구조 검사 실패 시 None)
+
+        Raises:
+            requests.RequestException: 네트워크 오류 또는 HTTP 오류 상태 코드
+                (서버가 요청을 줄이라고 응답한 경우이므로 WebDriver로 바로 다시 요청하지 않도록 전달)
+        """
+        if self.cache is not None:
+            cached = self.cache.get(url)
+            if cached is not None and is_valid_detail_page(cached):
+                self.logger.info(f"캐시 사용: {url}")
+                metrics.inc('pages', kind='detail', source='cache')
+                return cached
+
+        html_content = self.get_page_source(url)
+
+        if not is_valid_detail_page(html_content):
+            self.logger.warning(f"상세 페이지 구조 검사 실패 (rst_result_view 없음): {url}")
+            metrics.inc('errors', stage='http_fetch', type='InvalidDetailPage')
+            return None
+
+        metrics.inc('pages', kind='detail', source='http')
+
+        if self.cache is not None:
+            self.cache.put(url, html_content)
+
+        return html_content
+
+    def __enter__(self):
+        """컨텍스트 매니저 진입"""
+        self.setup_session()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """컨텍스트 매니저 종료"""
+        self.close_session()
@@ -0,0 +1,193 @@
+"""
+로깅 설정 모듈
+로그 기록을 큐에 넣고 백그라운드 스레드가 콘솔/파일에 쓰도록 하여,
+수집 작업 스레드(풀, 비동기 크롤러)가 로그 파일 I/O 때문에 멈추지 않도록 합니다.
+
+- 텍스트 형식: 기존과 같은 한 줄 형식 (제목 등에 섞인 줄바꿈은 공백으로 바꿔 한 줄로 기록)
+- JSON Lines 형식: 한 줄에 하나의 JSON 객체 (url, decision_no, stage, duration_ms 필드 포함)
+- 로그 파일이 LOG_MAX_BYTES를 넘으면 회전하고, 회전된 파일은 gzip으로 압축 (scraper.log.1.gz ...)
+
+구조화 필드는 logging의 extra 인자로 전달합니다:
+    logger.info("저장 완료", extra={'url': url, 'decision_no': no, 'stage': 'write'})
+"""
+
+import os
+import re
+import sys
+import copy
+import gzip
+import json
+import queue
+import atexit
+import shutil
+import logging
+import logging.handlers
+import multiprocessing
+from datetime import datetime
+from typing import Optional
+
+import config
+
+
+# JSON Lines 형식에서 별도 필드로 기록하는 extra 키
+STRUCTURED_FIELDS = ('url', 'decision_no', 'stage', 'duration_ms')
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# 줄바꿈을 포함한 공백 (한 줄로 합칠 대상)
+MULTILINE_WHITESPACE_PATTERN = re.compile(r'\s*[\r\n]+\s*')
+
+# 현재 사용 중인 큐 리스너 (다시 설정하거나 종료할 때 사용)
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.Handler] = None
+
+
+def _single_line(text: str) -> str:
+    """줄바꿈을 공백 하나로 바꾼 한 줄 문자열"""
+    return MULTILINE_WHITESPACE_PATTERN.sub(' ', text)
+
+
+class SingleLineFormatter(logging.Formatter):
+    """메시지의 줄바꿈을 공백으로 바꾸는 텍스트 포매터 (예외 추적 정보는 그대로 여러 줄로 기록)"""
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        record.message = _single_line(record.message)
+        return super().formatMessage(record)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """로그 기록 하나를 JSON 객체 한 줄로 변환하는 포매터"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': _single_line(record.getMessage()),
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _DeferredFormatQueueHandler(logging.handlers.QueueHandler):
+    """
+    메시지 인자만 합쳐서 큐에 넣는 핸들러
+    (기본 QueueHandler는 호출 스레드에서 전체 형식화를 하고 예외 정보를 메시지에 붙이므로,
+    형식화는 리스너 스레드의 포매터에 맡기고 예외 추적 문자열만 미리 만들어 둠)
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _gzip_rotator(source: str, dest: str):
+    """회전된 로그 파일을 gzip으로 압축하여 저장"""
+    with open(source, 'rb') as src, gzip.open(dest, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+def create_file_handler(path: str, max_bytes: int, backup_count: int) -> logging.Handler:
+    """
+    크기 기준으로 회전하고 회전된 파일을 압축하는 파일 핸들러를 만듭니다.
+
+    Args:
+        path: 로그 파일 경로
+        max_bytes: 회전 기준 크기 (0이면 회전하지 않음)
+        backup_count: 보관할 회전 파일 수
+
+    Returns:
+        파일 핸들러
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    handler = logging.handlers.RotatingFileHandler(
+        path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8'
+    )
+    handler.namer = lambda name: f"{name}.gz"
+    handler.rotator = _gzip_rotator
+    return handler
+
+
+def setup_logging(log_format: str = None, log_path: str = None, max_bytes: int = None,
+                  backup_count: int = None, level: int = logging.INFO):
+    """
+    큐 기반 로깅을 설정합니다. 다시 호출하면 이전 설정을 정리하고 새로 설정합니다.
+
+    Args:
+        log_format: 'text' 또는 'json' (None이면 config.LOG_FORMAT, 콘솔은 항상 텍스트)
+        log_path: 로그 파일 경로 (None이면 config.LOG_FILE)
+        max_bytes: 회전 기준 크기 (None이면 config.LOG_MAX_BYTES)
+        backup_count: 보관할 회전 파일 수 (None이면 config.LOG_BACKUP_COUNT)
+        level: 로그 레벨
+
+    Raises:
+        ValueError: 지원하지 않는 형식인 경우
+    """
+    global _listener, _queue_handler
+
+    # 파싱 작업 프로세스(spawn)가 실행 스크립트를 다시 읽을 때는 로그 파일을 열지 않음 (부모 프로세스만 기록)
+    if multiprocessing.parent_process() is not None:
+        return
+
+    log_format = log_format or config.LOG_FORMAT
+    if log_format not in ('text', 'json'):
+        raise ValueError(f"지원하지 않는 로그 형식입니다: {log_format}")
+    log_path = log_path or config.LOG_FILE
+    max_bytes = max_bytes if max_bytes is not None else config.LOG_MAX_BYTES
+    backup_count = backup_count if backup_count is not None else config.LOG_BACKUP_COUNT
+
+    shutdown_logging()
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(SingleLineFormatter(TEXT_FORMAT))
+
+    file_handler = create_file_handler(log_path, max_bytes, backup_count)
+    file_handler.setFormatter(JsonLinesFormatter() if log_format == 'json' else SingleLineFormatter(TEXT_FORMAT))
+
+    # 호출 스레드는 큐에 넣기만 하고, 콘솔/파일 쓰기와 회전/압축은 리스너 스레드에서 처리
+    log_queue = queue.SimpleQueue()
+    _queue_handler = _DeferredFormatQueueHandler(log_queue)
+    _listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _listener.start()
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(_queue_handler)
+
+
+def shutdown_logging():
+    """큐에 남은 로그를 모두 기록하고 리스너와 핸들러를 정리합니다."""
+    global _listener, _queue_handler
+
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
@@ -3,160 +3,692 @@
 신문윤리위원회 심의결정 스크레이퍼 메인 실행 스크립트 (URL 직접 지정 방식)
 
 사용법:
-    python main.py
+    python main.py                          # config.TARGET_MONTH_URLS 사용
+    python main.py --years 2019-2022        # 연도별 목록 페이지에서 기간 자동 탐색
+    python main.py --from 2023-03 --to 2024-02
+    python main.py --years 2024 --refresh-periods
 """
 
 import os
 import sys
-import time
+import signal
+import argparse
+import hashlib
 import logging
-from typing import List, Dict
+from collections import Counter
+from datetime import datetime
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple, Union
 
 import config
+import metrics
+from logging_setup import setup_logging
 from scraper import IkpecScraper
-from parser import parse_decision_list, parse_decision_detail
+from http_fetcher import HttpFetcher
+from scraper_pool import ScraperPool
+from async_crawler import AsyncCrawler
+from rate_limiter import HostRateLimiter
+from page_cache import PageCache
+from pipeline import StreamingPipeline
+from period_index import PeriodIndex, parse_year_spec, parse_month_spec
+from archive_index import write_archive_indexes
+from corpus_store import CorpusStore
+from search_index import SearchIndex
+from supervisor import DriverSupervisor, IncompletePage, RetryQueue
+from manifest import ProgressManifest, STATE_DISCOVERED, STATE_FETCHED, STATE_PARSED, STATE_WRITTEN
+from parser import parse_decision_list, extract_decide_no, is_valid_detail_page
+from parse_pool import ParsePool, compact_detail
 from markdown_writer import (
     create_decision_markdown,
     save_markdown_file,
     create_index_markdown,
-    sanitize_filename
+    sanitize_filename,
+    load_existing_decisions,
+    decision_sort_key,
+    sync_directories
 )
 
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('scraper.log', encoding='utf-8')
-    ]
-)
 logger = logging.getLogger(__name__)
 
 
-def scrape_monthly_decisions_from_url(scraper: IkpecScraper, year: int, month: int, url: str) -> List[Dict]:
+def log_fields(decision: Dict, stage: str) -> Dict[str, str]:
     """
-    특정 연월의 심의 결정을 스크레이핑합니다. (URL 직접 지정 방식)
+    심의 단위 로그에 붙일 구조화 필드를 반환합니다. (JSON Lines 로그의 url, decision_no, stage)
+
+    Args:
+        decision: 심의 링크 정보 또는 심의 데이터
+        stage: 처리 단계 ('fetch', 'parse', 'write')
+
+    Returns:
+        logging extra 딕셔너리
+    """
+    return {'url': decision.get('url'), 'decision_no': decision.get('decision_no'), 'stage': stage}
+
+
+def fetch_decision_html(scraper: IkpecScraper, fetcher: Optional[HttpFetcher], url: str,
+                        rate_limiter: Optional[HostRateLimiter] = None) -> str:
+    """
+    심의 상세 페이지 HTML을 가져옵니다.
+    HTTP 페처를 먼저 사용하고, 구조 검사에 실패한 경우에만 WebDriver 경로로 대체합니다.
+    HTTP 요청 실패는 감독자가 분류하고 백오프 후 재시도하도록 그대로 전달합니다.
+
+    Args:
+        scraper: IkpecScraper 인스턴스 (대체 경로)
+        fetcher: HttpFetcher 인스턴스 (None이면 WebDriver만 사용)
+        url: 심의 페이지 URL
+        rate_limiter: 호스트별 요청 예산 (HTTP 요청 뒤 WebDriver로 다시 요청할 때 토큰을 받음,
+                      None이면 대기 없음)
+
+    Returns:
+        페이지 HTML 소스
+
+    Raises:
+        requests.RequestException: HTTP 요청 실패 (네트워크 오류, 시간 초과, HTTP 오류 상태 코드)
+        IncompletePage: WebDriver 경로에서도 본문 컨테이너가 없는 페이지를 받은 경우 (재시도 대상)
+    """
+    if fetcher is not None:
+        html_content = fetcher.get_decision_detail(url)
+        if html_content is not None:
+            return html_content
+        logger.info(f"WebDriver 경로로 대체: {url}")
+        # 사이트에 한 번 더 요청하므로 호출 측이 받은 토큰과 별도로 토큰을 받음
+        if rate_limiter is not None:
+            rate_limiter.acquire(url)
+
+    html_content = scraper.get_decision_detail(url)
+    if not is_valid_detail_page(html_content):
+        raise IncompletePage(f"준비 대기 시간 안에 본문이 나타나지 않았습니다: {url}")
+    return html_content
+
+
+def fetch_list_page(scraper: IkpecScraper, fetcher: Optional[HttpFetcher],
+                    rate_limiter: HostRateLimiter, url: str) -> str:
+    """
+    목록 페이지 소스를 가져옵니다. (기간 탐색용, HTTP 우선, 실패 시 WebDriver)
+
+    Args:
+        scraper: IkpecScraper 인스턴스 (대체 경로)
+        fetcher: HttpFetcher 인스턴스 (None이면 WebDriver만 사용)
+        rate_limiter: 호스트별 요청 예산
+        url: 목록 페이지 URL
+
+    Returns:
+        페이지 HTML 소스
+    """
+    rate_limiter.acquire(url)
+
+    if fetcher is not None:
+        try:
+            return fetcher.get_page_source(url)
+        except Exception as e:
+            logger.warning(f"HTTP 요청 실패, WebDriver 경로로 대체: {url} ({e})")
+            # 대체 요청도 같은 예산을 사용 (혼잡 응답이었으면 낮아진 속도로 대기)
+            rate_limiter.acquire(url)
+
+    return scraper.get_page_source(url)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    명령행 인자를 해석합니다.
+
+    Args:
+        argv: 인자 리스트 (None이면 sys.argv 사용)
+
+    Returns:
+        해석된 인자 (years, start, end, refresh_periods, log_format)
+    """
+    arg_parser = argparse.ArgumentParser(description="신문윤리위원회 심의결정 스크레이퍼")
+    arg_parser.add_argument('--years', type=parse_year_spec,
+                            help="대상 연도 (예: 2023, 2019-2022, 2019,2021)")
+    arg_parser.add_argument('--from', dest='start', type=parse_month_spec,
+                            help="시작 연월 (YYYY-MM, 포함)")
+    arg_parser.add_argument('--to', dest='end', type=parse_month_spec,
+                            help="종료 연월 (YYYY-MM, 포함, 생략 시 이번 달)")
+    arg_parser.add_argument('--refresh-periods', action='store_true',
+                            help="저장된 기간 인덱스를 무시하고 연도별 목록 페이지를 다시 요청")
+    arg_parser.add_argument('--log-format', choices=('text', 'json'),
+                            help="로그 파일 형식 (json: 한 줄에 하나의 JSON 객체, 생략 시 config.LOG_FORMAT)")
+    return arg_parser.parse_args(argv)
+
+
+def resolve_target_periods(args: argparse.Namespace, period_index: PeriodIndex) -> List[Tuple[int, int, str]]:
+    """
+    스크레이핑 대상 기간을 결정합니다.
+    연도/기간 인자가 없으면 config.TARGET_MONTH_URLS를, 있으면 기간 인덱스에서 찾은 기간을 사용합니다.
+
+    Args:
+        args: parse_args 결과
+        period_index: 기간 인덱스
+
+    Returns:
+        [(연도, 월, 월별 목록 URL), ...]
+    """
+    if not (args.years or args.start or args.end):
+        return list(config.TARGET_MONTH_URLS)
+
+    now = datetime.now()
+    start = args.start
+    end = args.end or ((now.year, now.month) if args.years is None else None)
+
+    if args.years:
+        years = args.years
+    elif start is not None:
+        years = list(range(start[0], end[0] + 1))
+    else:
+        raise ValueError("--to만 지정할 수 없습니다. --from 또는 --years를 함께 지정해주세요.")
+
+    return period_index.periods(years, start, end, refresh=args.refresh_periods)
+
+
+def get_month_output_dir(year: int, month: int) -> str:
+    """
+    연월별 출력 디렉토리 경로를 반환합니다.
+
+    Args:
+        year: 연도
+        month: 월
+
+    Returns:
+        출력 디렉토리 경로 (예: output/2025/07)
+    """
+    return os.path.join(config.OUTPUT_DIR, f"{year}", f"{month:02d}")
+
+
+def collect_stored_decisions(year: int, month: int, period_url: str,
+                             manifest: Optional[ProgressManifest] = None,
+                             scan_output: bool = False) -> Dict[str, Dict]:
+    """
+    이미 저장된 심의를 결정번호 기준으로 수집합니다.
+    한 달에 심의일(DecideBaseNo)이 둘 이상이면 월별 인덱스를 함께 쓰므로, 같은 연월의 다른 기간에서
+    저장된 심의도 포함하여 나중에 처리한 기간이 앞 기간의 인덱스 항목을 덮어쓰지 않도록 합니다.
+
+    Args:
+        year: 연도
+        month: 월
+        period_url: 월별 목록 페이지 URL (매니페스트 키)
+        manifest: 진행 상황 매니페스트 (저장 완료 기록 사용)
+        scan_output: True이면 출력 디렉토리의 기존 마크다운 파일도 확인
+
+    Returns:
+        {결정번호: 'title', 'url', 'filename' 등을 가진 인덱스 항목} 딕셔너리
+    """
+    stored = {}
+
+    if scan_output:
+        stored.update(load_existing_decisions(get_month_output_dir(year, month)))
+
+    if manifest is not None:
+        for entry in manifest.month_written_decisions(year, month):
+            stored[entry['decision_no']] = entry
+
+    return stored
+
+
+def prepare_decision_links(scraper: IkpecScraper, year: int, month: int, url: str,
+                           manifest: Optional[ProgressManifest] = None,
+                           stored: Optional[Dict[str, Dict]] = None,
+                           refresh_list: bool = False) -> List[Dict]:
+    """
+    월별 목록 페이지에서 새로 가져올 심의 링크를 준비합니다.
 
     Args:
         scraper: IkpecScraper 인스턴스
         year: 연도
         month: 월
         url: 월별 목록 페이지 URL
+        manifest: 진행 상황 매니페스트 (발견된 심의 기록)
+        stored: 이미 저장되어 다시 가져오지 않을 심의 {결정번호: 인덱스 항목}
+        refresh_list: True이면 목록 페이지를 캐시 대신 새로 가져옴
 
     Returns:
-        추출된 심의 데이터 리스트
+        'title', 'url', 'decision_no', 'list_order' 키를 가진 심의 링크 리스트
     """
-    logger.info(f"=== {year}년 {month}월 심의 결정 스크레이핑 시작 ===")
-
-    # 1. 지정된 URL에서 링크 추출
-    decision_links = scraper.get_decision_links_from_url(url, year, month)
+    # 지정된 URL에서 링크 추출
+    decision_links = scraper.get_decision_links_from_url(url, year, month, use_cache=not refresh_list)
 
     if not decision_links:
         logger.warning(f"{year}년 {month}월에 심의 결정이 없습니다.")
+        # 목록 페이지를 받았고 심의가 없는 달도 기록 (저장할 심의가 없으므로 기간 완료로 처리됨)
+        if manifest is not None:
+            manifest.mark_period(url, year, month, STATE_DISCOVERED, 0)
         return []
 
     logger.info(f"총 {len(decision_links)}건의 심의 발견")
 
-    # 2. 각 심의 페이지에서 상세 내용 추출
-    decisions_data = []
+    # 결정번호는 URL의 DecideNo 파라미터 기준 (없으면 URL 자체를 키로 사용)
+    # 목록 순서는 병렬 수집 결과가 완료 순서로 도착해도 인덱스를 목록 순서대로 만들기 위해 보관
+    for order, link_info in enumerate(decision_links, 1):
+        link_info['decision_no'] = extract_decide_no(link_info['url']) or link_info['url']
+        link_info['list_order'] = order
+
+    if manifest is not None:
+        manifest.record_discovered(url, decision_links)
+        manifest.mark_period(url, year, month, STATE_DISCOVERED, len(decision_links))
+
+    # 이미 저장된 심의는 건너뛰고 새로 추가되었거나 누락된 심의만 가져옴
+    if stored:
+        total = len(decision_links)
+        decision_links = [link_info for link_info in decision_links if link_info['decision_no'] not in stored]
+        logger.info(f"저장된 {total - len(decision_links)}건 건너뜀, 새로 가져올 심의 {len(decision_links)}건")
 
-    for idx, link_info in enumerate(decision_links, 1):
-        logger.info(f"[{idx}/{len(decision_links)}] 처리 중: {link_info['title']}")
+    return decision_links
+
+
+def iter_decision_pages(scraper: IkpecScraper, decision_links: List[Dict],
+                        fetcher: Optional[HttpFetcher] = None,
+                        backend: Optional[Union[ScraperPool, AsyncCrawler]] = None,
+                        rate_limiter: Optional[HostRateLimiter] = None,
+                        manifest: Optional[ProgressManifest] = None,
+                        supervisor: Optional[DriverSupervisor] = None) -> Iterator[Tuple[Dict, str]]:
+    """
+    심의 상세 페이지를 가져와 순서대로 내보냅니다. (수집 단계)
+    병렬 수집 방식은 완료되는 순서대로 결과가 도착하므로 URL로 링크 정보를 찾습니다.
+    감독자가 있으면 일시적으로 실패한 심의를 재시도 큐에 넣고, 첫 수집이 끝난 뒤 순차적으로 다시 가져옵니다.
+
+    Args:
+        scraper: IkpecScraper 인스턴스 (대체 경로)
+        decision_links: prepare_decision_links가 반환한 심의 링크 리스트
+        fetcher: 상세 페이지용 HttpFetcher 인스턴스 (None이면 WebDriver만 사용)
+        backend: 상세 페이지를 병렬로 가져올 ScraperPool 또는 AsyncCrawler (None이면 순차 처리)
+        rate_limiter: 순차 처리 시 사용할 호스트별 요청 예산
+        manifest: 진행 상황 매니페스트
+        supervisor: 실패 분류/드라이버 재시작/재시도를 담당하는 감독자 (None이면 실패한 심의는 건너뜀)
+
+    Yields:
+        (심의 링크 정보, HTML 소스) 튜플 - 가져오지 못한 심의는 건너뜀
+    """
+    total = len(decision_links)
+
+    if backend is not None:
+        links_by_url = {link_info['url']: link_info for link_info in decision_links}
+        results = ((links_by_url[detail_url], html_content, error)
+                   for detail_url, html_content, error in backend.fetch_all(list(links_by_url)))
+    else:
+        results = ((link_info, None, None) for link_info in decision_links)
+
+    for idx, (link_info, html_content, error) in enumerate(results, 1):
+        logger.info(f"[{idx}/{total}] 처리 중: {link_info['title']}", extra=log_fields(link_info, 'fetch'))
 
         try:
             # 개별 페이지 접근
-            html_content = scraper.get_decision_detail(link_info['url'])
+            if backend is not None:
+                if error is not None:
+                    raise error
+                if html_content is None:
+                    # HTTP 구조 검사 실패 → WebDriver 경로로 대체 (새 요청이므로 토큰을 다시 받음)
+                    logger.info(f"WebDriver 경로로 대체: {link_info['url']}")
+                    html_content = fetch_decision_serial(scraper, None, rate_limiter, link_info['url'])
+            else:
+                html_content = fetch_decision_serial(scraper, fetcher, rate_limiter, link_info['url'])
+
+            mark_fetched(manifest, link_info, html_content)
+
+        except Exception as e:
+            logger.error(f"심의 페이지 처리 중 오류: {link_info['url']} ({e})", extra=log_fields(link_info, 'fetch'))
+            metrics.inc('errors', stage='fetch', type=type(e).__name__)
+            if supervisor is not None:
+                # 풀 작업 스레드에서 난 오류는 해당 작업 스레드가 자기 드라이버를 다시 시작함
+                supervisor.handle_failure(link_info, e, 1, restart=error is None)
+            continue
+
+        yield link_info, html_content
+
+    if supervisor is None:
+        return
+
+    # 일시적으로 실패한 심의 재시도 (백오프 시각까지 대기, 감독 중인 드라이버로 순차 처리)
+    for link_info, attempt in supervisor.retries():
+        logger.info(f"재시도 ({attempt}/{supervisor.max_attempts}): {link_info['title']}",
+                    extra=log_fields(link_info, 'fetch'))
+        try:
+            html_content = fetch_decision_serial(scraper, fetcher, rate_limiter, link_info['url'])
+            mark_fetched(manifest, link_info, html_content)
+        except Exception as e:
+            logger.error(f"심의 페이지 재시도 중 오류: {link_info['url']} ({e})", extra=log_fields(link_info, 'fetch'))
+            metrics.inc('errors', stage='fetch', type=type(e).__name__)
+            supervisor.handle_failure(link_info, e, attempt)
+            continue
+
+        yield link_info, html_content
+
+
+def fetch_decision_serial(scraper: IkpecScraper, fetcher: Optional[HttpFetcher],
+                          rate_limiter: Optional[HostRateLimiter], url: str) -> str:
+    """
+    요청 예산을 기다린 뒤 심의 상세 페이지 하나를 가져옵니다. (순차 처리, 재시도)
+
+    Args:
+        scraper: IkpecScraper 인스턴스 (대체 경로)
+        fetcher: HttpFetcher 인스턴스 (None이면 WebDriver만 사용)
+        rate_limiter: 호스트별 요청 예산 (None이면 대기 없음)
+        url: 심의 페이지 URL
+
+    Returns:
+        페이지 HTML 소스
+    """
+    # 서버 부하 방지를 위해 요청 전 토큰 대기 (랜덤 지연 포함, 캐시 적중 시 생략)
+    if rate_limiter is not None and not scraper.is_cached(url):
+        delay = rate_limiter.acquire(url)
+        if delay > 0:
+            logger.info(f"요청 전 {delay:.2f}초 대기")
+    return fetch_decision_html(scraper, fetcher, url, rate_limiter)
+
+
+def mark_fetched(manifest: Optional[ProgressManifest], link_info: Dict, html_content: str):
+    """가져온 심의를 페이지 해시와 함께 매니페스트에 기록"""
+    if manifest is not None:
+        content_hash = hashlib.sha256(html_content.encode('utf-8')).hexdigest()
+        manifest.mark_decision(link_info['decision_no'], STATE_FETCHED, content_hash=content_hash)
 
-            # HTML 파싱
-            detail_data = parse_decision_detail(html_content)
 
-            # 링크 정보 추가
-            detail_data['url'] = link_info['url']
-            detail_data['list_title'] = link_info['title']
+def build_decision_record(link_info: Dict, html_content: Optional[str],
+                          manifest: Optional[ProgressManifest] = None,
+                          detail_data: Optional[Dict] = None) -> Dict:
+    """
+    심의 페이지 HTML을 파싱하여 저장할 레코드를 만듭니다. (파싱 단계)
+
+    Args:
+        link_info: 심의 링크 정보
+        html_content: 페이지 HTML 소스 (detail_data를 넘기면 사용하지 않음)
+        manifest: 진행 상황 매니페스트
+        detail_data: 파싱 프로세스 풀에서 이미 파싱한 결과 (None이면 여기서 파싱)
+
+    Returns:
+        심의 데이터 딕셔너리 (주문/이유/적용 조항을 찾은 경우 full_content는 비움)
+    """
+    # HTML 파싱
+    if detail_data is None:
+        detail_data = compact_detail(html_content)
 
-            # 제목이 없으면 리스트의 제목 사용
-            if not detail_data.get('title'):
-                detail_data['title'] = link_info['title']
+    # 링크 정보 추가
+    detail_data['url'] = link_info['url']
+    detail_data['list_title'] = link_info['title']
+    detail_data['list_order'] = link_info.get('list_order', 0)
 
-            decisions_data.append(detail_data)
+    # 제목이 없으면 리스트의 제목 사용
+    if not detail_data.get('title'):
+        detail_data['title'] = link_info['title']
 
-            # 서버 부하 방지 및 탐지 회피를 위한 랜덤 대기
-            delay = config.get_random_delay()
-            logger.info(f"다음 요청까지 {delay:.2f}초 대기...")
-            time.sleep(delay)
+    # 매니페스트 키 (파싱된 결정번호와 형식이 다를 수 있으므로 별도 보관)
+    detail_data['manifest_key'] = link_info['decision_no']
+
+    if manifest is not None:
+        manifest.mark_decision(link_info['decision_no'], STATE_PARSED, title=detail_data['title'])
+
+    return detail_data
+
+
+def write_decision_record(decision: Dict, year: int, month: int, output_dir: str,
+                          manifest: Optional[ProgressManifest] = None,
+                          corpus: Optional[CorpusStore] = None) -> Dict:
+    """
+    심의 레코드를 마크다운 파일로 저장합니다. (저장 단계)
+
+    Args:
+        decision: 심의 데이터
+        year: 연도
+        month: 월
+        output_dir: 출력 디렉토리
+        manifest: 진행 상황 매니페스트 (저장 완료 기록에 사용)
+        corpus: 코퍼스 저장소 (None이면 마크다운 파일만 저장)
+
+    Returns:
+        인덱스 항목 ('decision_no', 'manifest_key', 'title', 'url', 'filename', 'list_order' 키,
+        본문은 포함하지 않으므로 호출 측은 심의 데이터를 바로 해제할 수 있음)
+    """
+    # 마크다운 생성
+    md_content = create_decision_markdown(decision)
+
+    # 파일명 생성
+    order = decision.get('list_order', 0)
+    title = decision.get('title', f'decision_{order}')
+    decision_no = decision.get('decision_no', '')
+
+    if decision_no:
+        filename = f"{decision_no}_{title}"
+    else:
+        filename = f"{year}{month:02d}_{order:03d}_{title}"
+
+    # 파일 저장
+    filepath = save_markdown_file(md_content, filename, output_dir)
+    logger.info(f"저장 완료: {os.path.basename(filepath)}", extra=log_fields(decision, 'write'))
+
+    # 인덱스 생성에 필요한 정보만 남김
+    index_entry = {
+        'decision_no': decision_no,
+        'manifest_key': decision.get('manifest_key'),
+        'title': title,
+        'url': decision.get('url', ''),
+        'filename': os.path.basename(filepath),
+        'list_order': order,
+    }
+
+    # 코퍼스 저장소에도 기록 (파싱된 필드를 마크다운을 다시 읽지 않고 조회할 수 있도록)
+    if corpus is not None:
+        corpus.upsert(decision, year, month)
+
+    if manifest is not None and decision.get('manifest_key'):
+        manifest.mark_decision(decision['manifest_key'], STATE_WRITTEN, output_path=filepath,
+                               decision_type=decision.get('decision_type'), newspaper=decision.get('newspaper'))
+
+    return index_entry
+
+
+def write_month_index(saved_files: List[Dict], year: int, month: int, output_dir: str,
+                      stored: Optional[Dict[str, Dict]] = None):
+    """
+    월별 인덱스 파일을 작성합니다.
 
+    Args:
+        saved_files: 이번 실행에서 저장한 심의 인덱스 항목
+        year: 연도
+        month: 월
+        output_dir: 출력 디렉토리
+        stored: 이전에 저장된 심의 {결정번호: 인덱스 항목}
+    """
+    # 인덱스 항목: 이번에 저장한 심의는 목록 순서, 이전 저장분과 합칠 때는 결정번호 내림차순
+    index_entries = sorted(saved_files, key=lambda d: d.get('list_order', 0))
+    if stored:
+        merged = dict(stored)
+        for decision in saved_files:
+            merged[decision.get('manifest_key') or decision.get('decision_no') or decision['filename']] = decision
+        index_entries = sorted(merged.values(), key=lambda d: decision_sort_key(d.get('decision_no', '')),
+                               reverse=True)
+
+    # 새로 저장한 심의가 있거나 인덱스 파일이 없을 때만 인덱스 재작성
+    index_path = os.path.join(output_dir, f"INDEX_{year}_{month:02d}.md")
+    if index_entries and (saved_files or not os.path.exists(index_path)):
+        try:
+            index_path = create_index_markdown(index_entries, year, month, output_dir)
+            logger.info(f"인덱스 파일 생성: {index_path}")
         except Exception as e:
-            logger.error(f"심의 페이지 처리 중 오류: {link_info['url']}")
-            logger.error(f"오류 내용: {e}")
+            logger.error(f"인덱스 파일 생성 중 오류: {e}")
+
+    # 이번 달에 교체한 파일의 디렉토리 항목을 한 번에 디스크에 반영
+    sync_directories()
+
+
+def scrape_monthly_decisions_from_url(scraper: IkpecScraper, year: int, month: int, url: str,
+                                      fetcher: Optional[HttpFetcher] = None,
+                                      backend: Optional[Union[ScraperPool, AsyncCrawler]] = None,
+                                      rate_limiter: Optional[HostRateLimiter] = None,
+                                      manifest: Optional[ProgressManifest] = None,
+                                      stored: Optional[Dict[str, Dict]] = None,
+                                      refresh_list: bool = False,
+                                      supervisor: Optional[DriverSupervisor] = None) -> Iterator[Dict]:
+    """
+    특정 연월의 심의 결정을 스크레이핑합니다. (URL 직접 지정 방식)
+    한 달치를 모아 두지 않고 파싱한 심의를 하나씩 내보내므로, 저장 측이 기록 후 바로 해제할 수 있습니다.
+
+    Args:
+        scraper: IkpecScraper 인스턴스
+        year: 연도
+        month: 월
+        url: 월별 목록 페이지 URL
+        fetcher: 상세 페이지용 HttpFetcher 인스턴스 (None이면 WebDriver만 사용)
+        backend: 상세 페이지를 병렬로 가져올 ScraperPool 또는 AsyncCrawler (None이면 순차 처리)
+        rate_limiter: 순차 처리 시 사용할 호스트별 요청 예산
+        manifest: 진행 상황 매니페스트
+        stored: 이미 저장되어 다시 가져오지 않을 심의 {결정번호: 인덱스 항목}
+        refresh_list: True이면 목록 페이지를 캐시 대신 새로 가져옴
+        supervisor: 실패 분류/재시도 감독자 (None이면 실패한 심의는 건너뜀)
+
+    Yields:
+        추출된 심의 데이터 (페이지가 도착한 순서, 목록 순서는 'list_order' 키)
+    """
+    logger.info(f"=== {year}년 {month}월 심의 결정 스크레이핑 시작 ===")
+
+    # 1. 지정된 URL에서 링크 추출
+    decision_links = prepare_decision_links(scraper, year, month, url, manifest, stored, refresh_list)
+
+    # 2. 각 심의 페이지에서 상세 내용 추출
+    count = 0
+
+    for link_info, html_content in iter_decision_pages(scraper, decision_links, fetcher, backend,
+                                                       rate_limiter, manifest, supervisor):
+        try:
+            decision = build_decision_record(link_info, html_content, manifest)
+        except Exception as e:
+            logger.error(f"심의 페이지 처리 중 오류: {link_info['url']} ({e})", extra=log_fields(link_info, 'parse'))
+            metrics.inc('errors', stage='parse', type=type(e).__name__)
             continue
 
-    logger.info(f"=== {year}년 {month}월 스크레이핑 완료: {len(decisions_data)}건 ===")
-    return decisions_data
+        count += 1
+        yield decision
+
+    logger.info(f"=== {year}년 {month}월 스크레이핑 완료: {count}건 ===")
 
 
-def save_decisions_as_markdown(decisions_data: List[Dict], year: int, month: int):
+def save_decisions_as_markdown(decisions_data: Iterable[Dict], year: int, month: int,
+                               manifest: Optional[ProgressManifest] = None,
+                               stored: Optional[Dict[str, Dict]] = None,
+                               corpus: Optional[CorpusStore] = None):
     """
     추출한 심의 데이터를 마크다운 파일로 저장합니다.
+    심의마다 파일을 쓴 뒤 인덱스 항목만 남기므로, 제너레이터를 넘기면 한 달치 본문을 메모리에 모아 두지 않습니다.
 
     Args:
-        decisions_data: 심의 데이터 리스트
+        decisions_data: 심의 데이터 리스트 또는 제너레이터
         year: 연도
         month: 월
+        manifest: 진행 상황 매니페스트 (저장 완료 기록에 사용)
+        stored: 이전에 저장된 심의 {결정번호: 인덱스 항목} (인덱스 재구성에 함께 사용)
+        corpus: 코퍼스 저장소 (None이면 마크다운 파일만 저장)
     """
-    if not decisions_data:
+    # 출력 디렉토리 (연도/월별, 첫 파일을 저장할 때 생성)
+    output_dir = get_month_output_dir(year, month)
+
+    logger.info(f"마크다운 파일 저장 시작: {output_dir}")
+
+    saved_files = []
+
+    for decision in decisions_data:
+        try:
+            saved_files.append(write_decision_record(decision, year, month, output_dir, manifest, corpus))
+        except Exception as e:
+            logger.error(f"마크다운 저장 중 오류: {decision.get('title', 'unknown')} ({e})",
+                         extra=log_fields(decision, 'write'))
+            metrics.inc('errors', stage='write', type=type(e).__name__)
+            continue
+
+    if not saved_files and not stored:
         logger.warning("저장할 데이터가 없습니다.")
         return
 
+    write_month_index(saved_files, year, month, output_dir, stored)
+    if corpus is not None:
+        corpus.flush()
+
+    logger.info(f"총 {len(saved_files)}개 파일 저장 완료")
+
+
+def process_month_pipelined(scraper: IkpecScraper, year: int, month: int, url: str,
+                            fetcher: Optional[HttpFetcher] = None,
+                            backend: Optional[Union[ScraperPool, AsyncCrawler]] = None,
+                            rate_limiter: Optional[HostRateLimiter] = None,
+                            manifest: Optional[ProgressManifest] = None,
+                            stored: Optional[Dict[str, Dict]] = None,
+                            refresh_list: bool = False,
+                            corpus: Optional[CorpusStore] = None,
+                            supervisor: Optional[DriverSupervisor] = None,
+                            parse_pool: Optional[ParsePool] = None):
+    """
+    특정 연월의 심의를 수집 → 파싱 → 저장 파이프라인으로 처리합니다.
+    페이지가 도착하는 대로 파싱과 파일 저장이 진행되어 네트워크 대기와 겹치고,
+    월 중간에 중단되어도 이미 저장된 심의는 남습니다.
+
+    Args:
+        scraper: IkpecScraper 인스턴스
+        year: 연도
+        month: 월
+        url: 월별 목록 페이지 URL
+        fetcher: 상세 페이지용 HttpFetcher 인스턴스 (None이면 WebDriver만 사용)
+        backend: 상세 페이지를 병렬로 가져올 ScraperPool 또는 AsyncCrawler (None이면 순차 처리)
+        rate_limiter: 순차 처리 시 사용할 호스트별 요청 예산
+        manifest: 진행 상황 매니페스트
+        stored: 이미 저장되어 다시 가져오지 않을 심의 {결정번호: 인덱스 항목}
+        refresh_list: True이면 목록 페이지를 캐시 대신 새로 가져옴
+        corpus: 코퍼스 저장소 (None이면 마크다운 파일만 저장)
+        supervisor: 실패 분류/재시도 감독자 (None이면 실패한 심의는 건너뜀)
+        parse_pool: 파싱 프로세스 풀 (None이면 파이프라인 작업 스레드에서 파싱)
+    """
+    logger.info(f"=== {year}년 {month}월 심의 결정 스크레이핑 시작 (파이프라인) ===")
+
+    decision_links = prepare_decision_links(scraper, year, month, url, manifest, stored, refresh_list)
+    if not decision_links and not stored:
+        return
+
     # 출력 디렉토리 생성 (연도/월별)
-    output_dir = os.path.join(config.OUTPUT_DIR, f"{year}", f"{month:02d}")
+    output_dir = get_month_output_dir(year, month)
     os.makedirs(output_dir, exist_ok=True)
 
-    logger.info(f"마크다운 파일 저장 시작: {output_dir}")
-
-    saved_files = []
+    pipeline = StreamingPipeline(
+        parse_func=lambda item, detail_data=None: build_decision_record(item[0], item[1], manifest, detail_data),
+        write_func=lambda decision: write_decision_record(decision, year, month, output_dir, manifest, corpus),
+        parse_pool=parse_pool,
+        pool_input=lambda item: item[1].encode('utf-8')
+    )
+    saved_files = pipeline.run(
+        iter_decision_pages(scraper, decision_links, fetcher, backend, rate_limiter, manifest, supervisor)
+    )
 
-    for idx, decision in enumerate(decisions_data, 1):
-        try:
-            # 마크다운 생성
-            md_content = create_decision_markdown(decision)
+    write_month_index(saved_files, year, month, output_dir, stored)
+    if corpus is not None:
+        corpus.flush()
 
-            # 파일명 생성
-            title = decision.get('title', f'decision_{idx}')
-            decision_no = decision.get('decision_no', '')
+    logger.info(f"=== {year}년 {month}월 처리 완료: {len(saved_files)}개 파일 저장 ===")
 
-            if decision_no:
-                filename = f"{decision_no}_{title}"
-            else:
-                filename = f"{year}{month:02d}_{idx:03d}_{title}"
 
-            # 파일 저장
-            filepath = save_markdown_file(md_content, filename, output_dir)
-            logger.info(f"[{idx}/{len(decisions_data)}] 저장 완료: {os.path.basename(filepath)}")
+def install_shutdown_handlers(manifest: ProgressManifest):
+    """
+    SIGINT/SIGTERM 수신 시 매니페스트를 기록하고 정상 종료 경로로 빠져나가도록 합니다.
 
-            # 인덱스 생성을 위한 정보 저장
-            decision['filename'] = os.path.basename(filepath)
-            saved_files.append(decision)
+    Args:
+        manifest: 진행 상황 매니페스트
+    """
+    def handle_signal(signum, frame):
+        logger.warning(f"종료 신호 수신 ({signal.Signals(signum).name}): 진행 상황을 저장하고 종료합니다.")
+        manifest.flush()
+        # with 블록을 따라 드라이버와 세션이 정리되도록 KeyboardInterrupt로 전환
+        raise KeyboardInterrupt
 
-        except Exception as e:
-            logger.error(f"마크다운 저장 중 오류: {decision.get('title', 'unknown')}")
-            logger.error(f"오류 내용: {e}")
-            continue
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
 
-    # 인덱스 파일 생성
-    if saved_files:
-        try:
-            index_path = create_index_markdown(saved_files, year, month, output_dir)
-            logger.info(f"인덱스 파일 생성: {index_path}")
-        except Exception as e:
-            logger.error(f"인덱스 파일 생성 중 오류: {e}")
 
-    logger.info(f"총 {len(saved_files)}개 파일 저장 완료")
+def main(argv: Optional[List[str]] = None):
+    """
+    메인 실행 함수
 
+    Args:
+        argv: 명령행 인자 리스트 (None이면 sys.argv 사용)
+    """
+    args = parse_args(argv)
+    # 로깅 설정 (큐 기반, 모듈을 가져오기만 하는 테스트/다른 명령이 로그 파일을 건드리지 않도록 실행 시에만 설정)
+    setup_logging(log_format=args.log_format)
+    discover_periods = bool(args.years or args.start or args.end)
 
-def main():
-    """메인 실행 함수"""
     logger.info("===== 신문윤리위원회 심의결정 스크레이퍼 시작 (URL 직접 지정 방식) =====")
 
     # 출력 디렉토리 확인
@@ -164,31 +696,182 @@ def main():
         os.makedirs(config.OUTPUT_DIR)
         logger.info(f"출력 디렉토리 생성: {config.OUTPUT_DIR}")
 
-    # 스크레이핑 대상 확인
-    if not config.TARGET_MONTH_URLS:
-        logger.error("config.py에서 TARGET_MONTH_URLS를 설정해주세요.")
+    # 스크레이핑 대상 확인 (기간 자동 탐색 시에는 탐색 후 확인)
+    if not discover_periods and not config.TARGET_MONTH_URLS:
+        logger.error("config.py에서 TARGET_MONTH_URLS를 설정하거나 --years/--from을 지정해주세요.")
         sys.exit(1)
 
-    logger.info(f"스크레이핑 대상: {len(config.TARGET_MONTH_URLS)}개 기간")
-    for year, month, url in config.TARGET_MONTH_URLS:
-        logger.info(f"  - {year}년 {month}월")
+    # 진행 상황 매니페스트 (중단된 실행 재개용)
+    manifest = None
+    if config.USE_MANIFEST:
+        manifest = ProgressManifest()
+        install_shutdown_handlers(manifest)
+
+    # 심의 레코드를 SQLite에도 기록 (마크다운 파일과 함께)
+    corpus = CorpusStore() if config.USE_CORPUS_STORE else None
+
+    # 코퍼스 저장소의 전문 검색 색인 (기간마다 새로 저장된 심의만 반영)
+    search_index = SearchIndex() if corpus is not None and config.USE_SEARCH_INDEX else None
+
+    # 목록/상세 페이지 응답 캐시 (모든 수집 경로가 공유)
+    cache = PageCache() if config.USE_PAGE_CACHE else None
+
+    # 모든 수집 방식이 공유하는 호스트별 요청 예산 (적응형이면 응답 지연/오류로 속도 조정)
+    rate_limiter = HostRateLimiter()
+
+    # 상세 페이지용 HTTP 페처 (Selenium은 목록 페이지와 대체 경로에만 사용)
+    fetcher = HttpFetcher(cache=cache, rate_limiter=rate_limiter) if config.USE_HTTP_FETCHER else None
+
+    # 상세 페이지 수집 방식 선택
+    backend = None
+    if config.FETCH_BACKEND == "pool":
+        backend = ScraperPool(
+            rate_limiter=rate_limiter,
+            scraper_factory=lambda: IkpecScraper(headless=config.HEADLESS_MODE, cache=cache,
+                                                 rate_limiter=rate_limiter),
+            fetch_func=lambda worker_scraper, detail_url: fetch_decision_html(worker_scraper, fetcher, detail_url,
+                                                                              rate_limiter)
+        )
+        backend.start()
+    elif config.FETCH_BACKEND == "async":
+        if fetcher is not None:
+            backend = AsyncCrawler(fetcher, rate_limiter=rate_limiter)
+        else:
+            logger.warning("async 방식은 USE_HTTP_FETCHER가 필요합니다. 순차 처리로 진행합니다.")
+
+    # 파이프라인 파싱 단계를 작업 프로세스에서 실행 (수집 스레드와 GIL을 나눠 쓰지 않도록)
+    parse_pool = ParsePool() if config.USE_PIPELINE and config.PARSE_PROCESSES else None
+
+    # 실행 지표 (기간마다 텍스트 파일 갱신, 종료 시 실행 요약 기록)
+    metrics.registry.reset()
+    metrics_server = None
+    if config.METRICS_HTTP_PORT:
+        metrics_server = metrics.MetricsServer()
+        metrics_server.start()
+    target_periods = []
+    supervisor = None
 
     # 스크레이퍼 실행
-    with IkpecScraper(headless=config.HEADLESS_MODE) as scraper:
-        for year, month, url in config.TARGET_MONTH_URLS:
+    try:
+        with IkpecScraper(headless=config.HEADLESS_MODE, cache=cache, rate_limiter=rate_limiter) as scraper:
+            # 실패 분류, 드라이버 재시작, 재시도 예약 (기간 단위 실패는 별도 큐에서 재시도)
+            supervisor = DriverSupervisor(scraper)
+            period_retries = RetryQueue()
+
+            # 대상 기간 결정 (자동 탐색 시 연도마다 목록 페이지 한 번, 기간 인덱스에 있으면 요청 없음)
+            period_index = PeriodIndex(
+                fetch_func=lambda list_url: fetch_list_page(scraper, fetcher, rate_limiter, list_url)
+            )
             try:
-                # 월별 심의 스크레이핑
-                decisions_data = scrape_monthly_decisions_from_url(scraper, year, month, url)
-
-                # 마크다운 파일로 저장
-                save_decisions_as_markdown(decisions_data, year, month)
-
-                # 다음 월 처리 전 대기
-                time.sleep(1)
-
+                target_periods = resolve_target_periods(args, period_index)
             except Exception as e:
-                logger.error(f"{year}년 {month}월 처리 중 오류 발생: {e}")
-                continue
+                logger.error(f"대상 기간 탐색 중 오류: {e}")
+                return
+
+            if not target_periods:
+                logger.error("스크레이핑 대상 기간이 없습니다.")
+                return
+
+            logger.info(f"스크레이핑 대상: {len(target_periods)}개 기간")
+            for year, month, url in target_periods:
+                logger.info(f"  - {year}년 {month}월")
+
+            # 심의일이 둘 이상인 연월 (같은 출력 디렉토리와 월별 인덱스를 함께 씀)
+            month_counts = Counter((year, month) for year, month, _ in target_periods)
+            shared_months = {year_month for year_month, count in month_counts.items() if count > 1}
+
+            def period_attempts() -> Iterator[Tuple[Tuple[int, int, str], int]]:
+                """대상 기간을 차례로 내보낸 뒤, 실패하여 재시도 큐에 들어간 기간을 이어서 내보냄"""
+                for period in target_periods:
+                    yield period, 1
+                for period, attempt in period_retries.drain():
+                    yield period['period'], attempt
+
+            for (year, month, url), attempt in period_attempts():
+                # 이전 실행에서 모두 저장된 기간은 건너뜀 (증분 모드에서는 새 심의가 있는지 다시 확인)
+                if manifest is not None and manifest.is_period_complete(url) and not config.INCREMENTAL_MODE:
+                    logger.info(f"{year}년 {month}월: 이전 실행에서 완료됨, 건너뜀")
+                    continue
+
+                try:
+                    # 이미 저장된 심의 (매니페스트 기록, 증분 모드에서는 출력 파일도 확인)
+                    # 매니페스트 없이 한 달에 기간이 둘 이상이면 앞 기간의 출력 파일을 인덱스에 합치기 위해 확인
+                    scan_output = config.INCREMENTAL_MODE or (manifest is None and (year, month) in shared_months)
+                    stored = collect_stored_decisions(year, month, url, manifest, scan_output=scan_output)
+
+                    # 목록 페이지 요청도 같은 예산을 사용 (월 사이 고정 대기 대신)
+                    if config.INCREMENTAL_MODE or not scraper.is_cached(url):
+                        rate_limiter.acquire(url)
+
+                    if config.USE_PIPELINE:
+                        # 수집, 파싱, 저장을 동시에 진행 (인덱스는 기존 + 새 심의로 재구성)
+                        process_month_pipelined(
+                            scraper, year, month, url, fetcher, backend, rate_limiter, manifest,
+                            stored, refresh_list=config.INCREMENTAL_MODE, corpus=corpus, supervisor=supervisor,
+                            parse_pool=parse_pool
+                        )
+                    else:
+                        # 월별 심의 스크레이핑 (심의를 하나씩 받아 바로 저장)
+                        decisions_data = scrape_monthly_decisions_from_url(
+                            scraper, year, month, url, fetcher, backend, rate_limiter, manifest,
+                            stored, refresh_list=config.INCREMENTAL_MODE, supervisor=supervisor
+                        )
+
+                        # 마크다운 파일로 저장 (인덱스는 기존 + 새 심의로 재구성)
+                        save_decisions_as_markdown(decisions_data, year, month, manifest, stored, corpus)
+
+                    if search_index is not None:
+                        search_index.update()
+
+                    # 발견된 심의가 모두 저장되었으면 기간 완료로 기록
+                    if manifest is not None and manifest.period_state(url) is not None \
+                            and manifest.pending_count(url) == 0:
+                        manifest.mark_period(url, year, month, STATE_WRITTEN)
+
+                    # 연도별/전체 인덱스 갱신 (매니페스트 집계, 이번 연도와 전체만 다시 만듦)
+                    if manifest is not None and config.WRITE_ARCHIVE_INDEXES:
+                        write_archive_indexes(manifest.index_entries(), years=[year])
+
+                except Exception as e:
+                    logger.error(f"{year}년 {month}월 처리 중 오류 발생: {e}")
+                    metrics.inc('errors', stage='period', type=type(e).__name__)
+                    # 목록 페이지 실패 등 일시적인 오류는 기간 전체를 나중에 다시 시도
+                    period = {'url': url, 'title': f"{year}년 {month}월", 'period': (year, month, url)}
+                    supervisor.handle_failure(period, e, attempt, retry_queue=period_retries)
+                    continue
+                finally:
+                    # 기간마다 지표 파일 갱신 (긴 실행 중에도 진행 상황 확인 가능)
+                    metrics.write_textfile()
+    finally:
+        if isinstance(backend, ScraperPool):
+            backend.close()
+        if parse_pool is not None:
+            parse_pool.close()
+        if fetcher is not None:
+            fetcher.close_session()
+        if cache is not None:
+            cache.close()
+        if manifest is not None:
+            manifest.close()
+        if search_index is not None:
+            search_index.close()
+        if corpus is not None:
+            corpus.close()
+
+        # 재시도 후에도 실패한 심의/기간 보고
+        failures = supervisor.report() if supervisor is not None else []
+
+        metrics.write_textfile()
+        summary = metrics.write_summary(
+            periods=len(target_periods), fetch_backend=config.FETCH_BACKEND,
+            parser_backend=config.PARSER_BACKEND, pipeline=config.USE_PIPELINE,
+            parse_processes=parse_pool.processes if parse_pool is not None else 0,
+            permanent_failures=len(failures)
+        )
+        if metrics_server is not None:
+            metrics_server.stop()
+        logger.info(f"실행 요약: {summary['duration_seconds']}초, "
+                    f"상세 페이지 {summary['detail_pages_per_second']}건/초")
 
     logger.info("===== 스크레이핑 완료 =====")
     logger.info(f"결과 파일 위치: {os.path.abspath(config.OUTPUT_DIR)}")
@@ -0,0 +1,326 @@
+"""
+진행 상황 매니페스트 모듈
+기간(월별 목록 URL)과 개별 심의(DecideNo)의 처리 단계를 SQLite에 기록하여
+중단된 실행을 이어서 진행할 수 있도록 합니다.
+파이프라인의 여러 단계 스레드에서 함께 사용할 수 있도록 하나의 잠금으로 연결을 보호합니다.
+
+처리 단계: discovered(목록에서 발견) → fetched(페이지 수집) → parsed(파싱) → written(파일 저장)
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from typing import Dict, List, Optional
+
+import config
+
+
+# 처리 단계
+STATE_DISCOVERED = 'discovered'
+STATE_FETCHED = 'fetched'
+STATE_PARSED = 'parsed'
+STATE_WRITTEN = 'written'
+
+
+class ProgressManifest:
+    """기간/심의별 처리 단계를 기록하는 SQLite 매니페스트"""
+
+    def __init__(self, path: str = None, commit_interval: int = None):
+        """
+        매니페스트 초기화
+
+        Args:
+            path: SQLite 파일 경로
+            commit_interval: 몇 건의 변경마다 커밋할지 (기간 단위 변경은 즉시 커밋)
+        """
+        self.path = path or config.MANIFEST_PATH
+        self.commit_interval = commit_interval if commit_interval is not None else config.MANIFEST_COMMIT_INTERVAL
+        self.logger = logging.getLogger(__name__)
+        self._pending = 0
+        self._lock = threading.RLock()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS periods (
+                url TEXT PRIMARY KEY,
+                year INTEGER NOT NULL,
+                month INTEGER NOT NULL,
+                state TEXT NOT NULL,
+                decision_count INTEGER,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS decisions (
+                decision_no TEXT PRIMARY KEY,
+                period_url TEXT NOT NULL,
+                url TEXT NOT NULL,
+                title TEXT,
+                state TEXT NOT NULL,
+                output_path TEXT,
+                content_hash TEXT,
+                decision_type TEXT,
+                newspaper TEXT,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_decisions_period ON decisions (period_url, state);
+        ''')
+        self._migrate()
+        self._conn.commit()
+
+    def _migrate(self):
+        """이전 버전에서 만든 매니페스트에 없는 열 추가"""
+        columns = {row['name'] for row in self._conn.execute('PRAGMA table_info(decisions)')}
+        for column in ('decision_type', 'newspaper'):
+            if column not in columns:
+                self._conn.execute(f'ALTER TABLE decisions ADD COLUMN {column} TEXT')
+
+    def _changed(self, immediate: bool = False):
+        """변경 건수를 세고 커밋 주기에 도달하면 커밋"""
+        with self._lock:
+            self._pending += 1
+            if immediate or self._pending >= self.commit_interval:
+                self.flush()
+
+    def flush(self):
+        """보류 중인 변경 사항을 디스크에 기록"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.commit()
+                self._pending = 0
+
+    def close(self):
+        """변경 사항을 기록하고 연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self.flush()
+                self._conn.close()
+                self._conn = None
+
+    # ----- 기간 -----
+
+    def period_state(self, url: str) -> Optional[str]:
+        """
+        기간의 처리 단계를 반환합니다.
+
+        Args:
+            url: 월별 목록 페이지 URL
+
+        Returns:
+            처리 단계 (기록이 없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute('SELECT state FROM periods WHERE url = ?', (url,)).fetchone()
+        return row['state'] if row else None
+
+    def is_period_complete(self, url: str) -> bool:
+        """기간의 모든 심의가 저장되었는지 확인합니다."""
+        return self.period_state(url) == STATE_WRITTEN
+
+    def mark_period(self, url: str, year: int, month: int, state: str, decision_count: int = None):
+        """
+        기간의 처리 단계를 기록합니다. (즉시 커밋)
+
+        Args:
+            url: 월별 목록 페이지 URL
+            year: 연도
+            month: 월
+            state: 처리 단계
+            decision_count: 목록에서 발견된 심의 수
+        """
+        with self._lock:
+            self._conn.execute(
+                'INSERT INTO periods (url, year, month, state, decision_count, updated_at) VALUES (?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT(url) DO UPDATE SET state = excluded.state, '
+                'decision_count = COALESCE(excluded.decision_count, periods.decision_count), '
+                'updated_at = excluded.updated_at',
+                (url, year, month, state, decision_count, time.time())
+            )
+            self._changed(immediate=True)
+
+    # ----- 개별 심의 -----
+
+    def record_discovered(self, period_url: str, decisions: List[Dict[str, str]]):
+        """
+        목록에서 발견된 심의를 기록합니다. (이미 기록된 심의의 단계는 유지)
+
+        Args:
+            period_url: 월별 목록 페이지 URL
+            decisions: 'decision_no', 'url', 'title' 키를 가진 심의 링크 리스트
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO decisions (decision_no, period_url, url, title, state, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                [(d['decision_no'], period_url, d['url'], d.get('title'), STATE_DISCOVERED, now) for d in decisions]
+            )
+            self._changed(immediate=True)
+
+    def decision_state(self, decision_no: str) -> Optional[str]:
+        """
+        심의의 처리 단계를 반환합니다.
+
+        Args:
+            decision_no: 결정번호 (DecideNo)
+
+        Returns:
+            처리 단계 (기록이 없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute('SELECT state FROM decisions WHERE decision_no = ?', (decision_no,)).fetchone()
+        return row['state'] if row else None
+
+    def decision_link(self, decision_no: str) -> Optional[Dict[str, str]]:
+        """
+        목록에서 발견될 때 기록된 심의 링크 정보를 반환합니다.
+
+        Args:
+            decision_no: 결정번호 (DecideNo)
+
+        Returns:
+            'decision_no', 'url', 'title', 'period_url', 'discovered_order' 키를 가진 딕셔너리
+            (발견 순서는 같은 기간 안에서 목록 순서와 같음, 기록이 없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT decision_no, url, title, period_url, rowid AS discovered_order FROM decisions '
+                'WHERE decision_no = ?', (decision_no,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def is_decision_written(self, decision_no: str) -> bool:
+        """
+        심의가 저장되었고 출력 파일이 아직 남아 있는지 확인합니다.
+
+        Args:
+            decision_no: 결정번호 (DecideNo)
+
+        Returns:
+            저장 완료 여부
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT state, output_path FROM decisions WHERE decision_no = ?', (decision_no,)
+            ).fetchone()
+        return bool(row and row['state'] == STATE_WRITTEN and row['output_path']
+                    and os.path.exists(row['output_path']))
+
+    def mark_decision(self, decision_no: str, state: str, content_hash: str = None,
+                      output_path: str = None, title: str = None,
+                      decision_type: str = None, newspaper: str = None):
+        """
+        심의의 처리 단계를 기록합니다.
+
+        Args:
+            decision_no: 결정번호 (DecideNo)
+            state: 처리 단계
+            content_hash: 수집한 페이지의 해시
+            output_path: 저장된 마크다운 파일 경로
+            title: 심의 제목
+            decision_type: 결정유형 (연도별/전체 인덱스 집계용)
+            newspaper: 언론사 (연도별/전체 인덱스 집계용)
+        """
+        with self._lock:
+            self._conn.execute(
+                'UPDATE decisions SET state = ?, content_hash = COALESCE(?, content_hash), '
+                'output_path = COALESCE(?, output_path), title = COALESCE(?, title), '
+                'decision_type = COALESCE(?, decision_type), newspaper = COALESCE(?, newspaper), updated_at = ? '
+                'WHERE decision_no = ?',
+                (state, content_hash, output_path, title, decision_type, newspaper, time.time(), decision_no)
+            )
+            self._changed()
+
+    def written_decisions(self, period_url: str) -> List[Dict[str, str]]:
+        """
+        기간에서 저장이 끝나고 출력 파일이 남아 있는 심의 목록을 반환합니다. (인덱스 재구성용)
+
+        Args:
+            period_url: 월별 목록 페이지 URL
+
+        Returns:
+            'decision_no', 'title', 'url', 'filename' 키를 가진 딕셔너리 리스트
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT decision_no, title, url, output_path FROM decisions '
+                'WHERE period_url = ? AND state = ? ORDER BY rowid',
+                (period_url, STATE_WRITTEN)
+            ).fetchall()
+        return self._written_entries(rows)
+
+    def month_written_decisions(self, year: int, month: int) -> List[Dict[str, str]]:
+        """
+        연월의 모든 기간에서 저장이 끝나고 출력 파일이 남아 있는 심의 목록을 반환합니다.
+        한 달에 심의일(DecideBaseNo)이 둘 이상이면 같은 월별 인덱스를 함께 쓰므로 기간을 합쳐서 조회합니다.
+
+        Args:
+            year: 연도
+            month: 월
+
+        Returns:
+            'decision_no', 'title', 'url', 'filename' 키를 가진 딕셔너리 리스트
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT d.decision_no, d.title, d.url, d.output_path '
+                'FROM decisions d JOIN periods p ON p.url = d.period_url '
+                'WHERE p.year = ? AND p.month = ? AND d.state = ? ORDER BY d.rowid',
+                (year, month, STATE_WRITTEN)
+            ).fetchall()
+        return self._written_entries(rows)
+
+    @staticmethod
+    def _written_entries(rows: List[sqlite3.Row]) -> List[Dict[str, str]]:
+        """저장 완료 행을 인덱스 항목으로 변환 (출력 파일이 지워진 심의는 제외)"""
+        return [
+            {
+                'decision_no': row['decision_no'],
+                'title': row['title'] or '',
+                'url': row['url'],
+                'filename': os.path.basename(row['output_path']),
+            }
+            for row in rows
+            if row['output_path'] and os.path.exists(row['output_path'])
+        ]
+
+    def index_entries(self) -> List[Dict[str, any]]:
+        """
+        저장이 끝난 모든 심의의 인덱스 항목을 반환합니다. (연도별/전체 인덱스용, 출력 파일은 확인하지 않음)
+
+        Returns:
+            'decision_no', 'title', 'decision_type', 'newspaper', 'output_path', 'year', 'month' 키를 가진
+            딕셔너리 리스트 (기간, 결정번호 순)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT d.decision_no, d.title, d.decision_type, d.newspaper, d.output_path, p.year, p.month '
+                'FROM decisions d JOIN periods p ON p.url = d.period_url '
+                'WHERE d.state = ? AND d.output_path IS NOT NULL '
+                'ORDER BY p.year, p.month, d.rowid',
+                (STATE_WRITTEN,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def pending_count(self, period_url: str) -> int:
+        """
+        기간에서 아직 저장되지 않은 심의 수를 반환합니다.
+
+        Args:
+            period_url: 월별 목록 페이지 URL
+
+        Returns:
+            written 단계가 아닌 심의 수
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT COUNT(*) FROM decisions WHERE period_url = ? AND state != ?', (period_url, STATE_WRITTEN)
+            ).fetchone()
+        return row[0]
@@ -4,10 +4,29 @@
 """
 
 import os
+import hashlib
+import logging
+import threading
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Set, Tuple
 import re
 
+import config
+import metrics
+
+
+# 저장된 심의 파일명 패턴: <결정번호>_<제목>.md (예: 2019-4114_대구 여고생....md)
+DECISION_FILENAME_PATTERN = re.compile(r'^(\d{4}-\d+)_.*\.md$')
+
+# 생성 시간 줄 (심의 파일 푸터, 인덱스 메타 정보) - 내용 비교에서 제외
+GENERATED_AT_PATTERN = re.compile(r'^(?:\*생성 시간: .*\*|- \*\*생성 시간\*\*: .*)$', re.MULTILINE)
+
+logger = logging.getLogger(__name__)
+
+# 파일을 교체한 뒤 아직 fsync하지 않은 디렉토리 (월 단위로 모아서 sync_directories에서 처리)
+_dirty_directories: Set[str] = set()
+_dirty_lock = threading.Lock()
+
 
 def sanitize_filename(filename: str) -> str:
     """
@@ -31,6 +50,7 @@ def sanitize_filename(filename: str) -> str:
     return filename
 
 
+@metrics.timed('render')
 def create_decision_markdown(decision_data: Dict[str, any]) -> str:
     """
     심의 데이터를 마크다운 형식으로 변환합니다.
@@ -102,9 +122,88 @@ def create_decision_markdown(decision_data: Dict[str, any]) -> str:
     return "\n".join(md_content)
 
 
+def content_fingerprint(content: str) -> str:
+    """
+    생성 시간 줄을 제외한 마크다운 내용의 해시를 반환합니다.
+
+    Args:
+        content: 마크다운 내용
+
+    Returns:
+        SHA-256 16진수 문자열
+    """
+    return hashlib.sha256(GENERATED_AT_PATTERN.sub('', content).encode('utf-8')).hexdigest()
+
+
+def write_file_if_changed(filepath: str, content: str) -> bool:
+    """
+    기존 파일과 내용(생성 시간 제외)이 다를 때만 파일을 기록합니다.
+    임시 파일에 쓴 뒤 이름을 바꾸므로 중단되어도 잘린 파일이 남지 않습니다.
+
+    Args:
+        filepath: 파일 경로
+        content: 기록할 내용
+
+    Returns:
+        파일을 새로 기록했으면 True, 내용이 같아 건너뛰었으면 False
+    """
+    if os.path.exists(filepath):
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                existing = f.read()
+        except (OSError, UnicodeDecodeError):
+            existing = None
+        if existing is not None and content_fingerprint(existing) == content_fingerprint(content):
+            metrics.inc('files_unchanged')
+            logger.debug(f"내용 변경 없음, 건너뜀: {filepath}")
+            return False
+
+    directory, name = os.path.split(filepath)
+    tmp_path = os.path.join(directory, f".{name}.tmp")
+    encoded = content.encode('utf-8')
+
+    with metrics.timer('write'):
+        with open(tmp_path, 'wb') as f:
+            f.write(encoded)
+            if config.MARKDOWN_FSYNC_FILES:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+
+    with _dirty_lock:
+        _dirty_directories.add(directory or '.')
+
+    metrics.inc('files_written')
+    metrics.inc('bytes_written', len(encoded))
+    return True
+
+
+def sync_directories():
+    """
+    파일을 교체한 디렉토리를 fsync하여 이름 변경을 디스크에 반영합니다.
+    (파일마다 하지 않고 월 단위로 모아서 호출, 디렉토리 fsync를 지원하지 않는 플랫폼에서는 무시)
+    """
+    with _dirty_lock:
+        directories = sorted(_dirty_directories)
+        _dirty_directories.clear()
+
+    for directory in directories:
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
 def save_markdown_file(content: str, filename: str, output_dir: str) -> str:
     """
     마크다운 내용을 파일로 저장합니다.
+    기존 파일과 내용이 같으면(생성 시간 제외) 다시 쓰지 않습니다.
 
     Args:
         content: 마크다운 내용
@@ -125,9 +224,8 @@ def save_markdown_file(content: str, filename: str, output_dir: str) -> str:
     # 전체 경로
     filepath = os.path.join(output_dir, safe_filename)
 
-    # 파일 저장
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    # 파일 저장 (변경된 경우에만, 임시 파일 + 이름 변경)
+    write_file_if_changed(filepath, content)
 
     return filepath
 
@@ -175,3 +273,77 @@ def create_index_markdown(decisions: List[Dict[str, any]], year: int, month: int
     filepath = save_markdown_file("\n".join(md_content), index_filename, output_dir)
 
     return filepath
+
+
+def read_decision_markdown_summary(filepath: str) -> Dict[str, str]:
+    """
+    저장된 심의 마크다운 파일에서 인덱스에 필요한 정보만 읽습니다.
+    (제목 줄과 기본 정보 목록까지만 읽고 본문은 읽지 않음)
+
+    Args:
+        filepath: 마크다운 파일 경로
+
+    Returns:
+        'title', 'url', 'decision_no', 'filename' 키를 가진 딕셔너리
+    """
+    summary = {'title': '', 'url': '', 'decision_no': '', 'filename': os.path.basename(filepath)}
+
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if line.startswith('# ') and not summary['title']:
+                summary['title'] = line[2:].strip()
+            elif line.startswith('- **결정번호**:'):
+                summary['decision_no'] = line.split(':', 1)[1].strip()
+            elif line.startswith('- **원문 URL**:'):
+                summary['url'] = line.split(':', 1)[1].strip()
+            elif line.startswith('## ') and summary['title']:
+                # 본문 섹션 시작 (기본 정보 이후)
+                if line != '## 기본 정보':
+                    break
+
+    return summary
+
+
+def load_existing_decisions(output_dir: str) -> Dict[str, Dict[str, str]]:
+    """
+    출력 디렉토리에 이미 저장된 심의 파일을 결정번호 기준으로 수집합니다.
+
+    Args:
+        output_dir: 월별 출력 디렉토리 (예: output/2025/07)
+
+    Returns:
+        {결정번호: 요약 정보} 딕셔너리 (디렉토리가 없으면 빈 딕셔너리)
+    """
+    existing = {}
+
+    if not os.path.isdir(output_dir):
+        return existing
+
+    for name in os.listdir(output_dir):
+        match = DECISION_FILENAME_PATTERN.match(name)
+        if not match:
+            continue
+
+        summary = read_decision_markdown_summary(os.path.join(output_dir, name))
+        decision_no = summary['decision_no'] or match.group(1)
+        summary['decision_no'] = decision_no
+        existing[decision_no] = summary
+
+    return existing
+
+
+def decision_sort_key(decision_no: str) -> Tuple[int, int]:
+    """
+    결정번호(예: 2019-4114)를 숫자 기준으로 정렬하기 위한 키를 반환합니다.
+
+    Args:
+        decision_no: 결정번호
+
+    Returns:
+        (연도, 일련번호) 튜플 (형식이 다르면 (0, 0))
+    """
+    match = re.match(r'^(\d{4})-(\d+)$', decision_no or '')
+    if not match:
+        return (0, 0)
+    return (int(match.group(1)), int(match.group(2)))
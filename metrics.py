@@ -0,0 +1,404 @@
+"""
+실행 지표 모듈
+단계별 처리 시간(히스토그램)과 건수/바이트/오류(카운터)를 기록하고,
+Prometheus 텍스트 형식(파일 또는 로컬 /metrics 엔드포인트)과 실행 요약 JSON으로 내보냅니다.
+
+외부 패키지 없이 동작하며, 여러 작업 스레드에서 함께 기록할 수 있도록 하나의 잠금으로 보호합니다.
+
+기록 예:
+    with metrics.timer('navigation'):
+        driver.get(url)
+    metrics.inc('bytes_fetched', len(body), source='http')
+    metrics.inc('errors', stage='fetch', type=type(e).__name__)
+"""
+
+import os
+import json
+import time
+import functools
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import config
+
+
+# 지표 이름 접두사 (Prometheus 이름 규칙: <접두사>_<이름>)
+METRIC_PREFIX = 'ikpec'
+
+# 단계별 처리 시간 히스토그램의 구간 상한 (초)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# 관측값이 이 수 이하이면 분위수를 구간 보간 대신 실제 관측값으로 계산 (넘으면 관측값은 버림)
+EXACT_QUANTILE_SAMPLES = 1000
+
+# 지표 설명 (Prometheus HELP 줄)
+METRIC_HELP = {
+    'stage_seconds': '단계별 처리 시간 (navigation, wait, page_source, http_fetch, parse, render, write 등)',
+    'pages': '가져온 페이지 수 (kind: list/detail, source: browser/http/cache)',
+    'bytes_fetched': '가져온 페이지 본문 바이트 수',
+    'bytes_written': '디스크에 기록한 바이트 수',
+    'files_written': '기록한 파일 수',
+    'files_unchanged': '내용이 같아 다시 쓰지 않은 파일 수',
+    'errors': '단계/예외 유형별 오류 수',
+    'retries': '실패 유형별 재시도 예약 수',
+    'driver_restarts': 'WebDriver 재시작 수',
+    'permanent_failures': '재시도하지 않거나 재시도 횟수를 넘긴 실패 수',
+    'pacing_adjustments': '적응형 요청 속도 조정 횟수 (direction: up/down)',
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    """레이블 딕셔너리를 정렬된 튜플 키로 변환"""
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    """Prometheus 레이블 문자열 ({a="1",b="2"})"""
+    pairs = key + extra
+    if not pairs:
+        return ''
+    escaped = []
+    for name, value in pairs:
+        value = value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+        escaped.append(f'{name}="{value}"')
+    return '{' + ','.join(escaped) + '}'
+
+
+class _Histogram:
+    """구간별 누적 건수와 합계를 보관하는 히스토그램 한 계열"""
+
+    __slots__ = ('buckets', 'counts', 'count', 'total', 'minimum', 'maximum', 'samples')
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = 0.0
+        self.maximum = 0.0
+        self.samples: Optional[List[float]] = []
+
+    def observe(self, value: float):
+        for index, upper in enumerate(self.buckets):
+            if value <= upper:
+                self.counts[index] += 1
+                break
+        self.minimum = min(self.minimum, value) if self.count else value
+        self.count += 1
+        self.total += value
+        self.maximum = max(self.maximum, value)
+
+        if self.samples is not None:
+            if self.count <= EXACT_QUANTILE_SAMPLES:
+                self.samples.append(value)
+            else:
+                self.samples = None
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        """
+        분위수를 반환합니다. (관측값이 없으면 None)
+        관측값이 적으면 실제 관측값 사이를 보간하고, 많으면 구간 안에서 선형 보간합니다.
+        보간 범위는 관측된 최솟값~최댓값으로 좁혀, 빠른 단계의 분위수가 최댓값으로 잘리지 않도록 합니다.
+        """
+        if self.count == 0:
+            return None
+
+        if self.samples is not None:
+            ordered = sorted(self.samples)
+            position = fraction * (len(ordered) - 1)
+            index = int(position)
+            if index + 1 >= len(ordered):
+                return ordered[-1]
+            return ordered[index] + (ordered[index + 1] - ordered[index]) * (position - index)
+
+        target = fraction * self.count
+        cumulative = 0
+        lower = 0.0
+        for upper, bucket_count in zip(self.buckets, self.counts):
+            if bucket_count and cumulative + bucket_count >= target:
+                low = max(lower, self.minimum)
+                high = min(upper, self.maximum)
+                return low + (high - low) * (target - cumulative) / bucket_count
+            cumulative += bucket_count
+            lower = upper
+        # 마지막 구간을 넘는 값은 최댓값으로 대신함
+        return self.maximum
+
+
+class MetricsRegistry:
+    """카운터와 히스토그램을 보관하는 지표 저장소"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        저장소 초기화
+
+        Args:
+            buckets: 히스토그램 구간 상한 (초)
+        """
+        self.buckets = buckets
+        self.started_at = time.time()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """모든 지표 초기화"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self.started_at = time.time()
+
+    def inc(self, name: str, amount: float = 1, **labels):
+        """
+        카운터를 증가시킵니다.
+
+        Args:
+            name: 지표 이름 (접두사 제외)
+            amount: 증가량
+            **labels: 레이블
+        """
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels):
+        """
+        히스토그램에 관측값을 기록합니다.
+
+        Args:
+            name: 지표 이름 (접두사 제외)
+            value: 관측값 (초)
+            **labels: 레이블
+        """
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(self.buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, stage: str, **labels) -> Iterator[None]:
+        """
+        블록 실행 시간을 stage_seconds 히스토그램에 기록합니다. (예외가 발생해도 기록)
+
+        Args:
+            stage: 단계 이름
+            **labels: 추가 레이블
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe('stage_seconds', time.perf_counter() - start, stage=stage, **labels)
+
+    def timed(self, stage: str, **labels) -> Callable:
+        """
+        함수 실행 시간을 stage_seconds 히스토그램에 기록하는 데코레이터
+
+        Args:
+            stage: 단계 이름
+            **labels: 추가 레이블
+        """
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timer(stage, **labels):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def render_prometheus(self) -> str:
+        """
+        Prometheus 텍스트 형식으로 지표를 반환합니다.
+
+        Returns:
+            텍스트 형식 문자열
+        """
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted(self._counters):
+                full_name = f"{METRIC_PREFIX}_{name}_total"
+                lines.append(f"# HELP {full_name} {METRIC_HELP.get(name, name)}")
+                lines.append(f"# TYPE {full_name} counter")
+                for key, value in sorted(self._counters[name].items()):
+                    lines.append(f"{full_name}{_format_labels(key)} {value:g}")
+
+            for name in sorted(self._histograms):
+                full_name = f"{METRIC_PREFIX}_{name}"
+                lines.append(f"# HELP {full_name} {METRIC_HELP.get(name, name)}")
+                lines.append(f"# TYPE {full_name} histogram")
+                for key, histogram in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    for upper, bucket_count in zip(histogram.buckets, histogram.counts):
+                        cumulative += bucket_count
+                        lines.append(f"{full_name}_bucket{_format_labels(key, (('le', f'{upper:g}'),))} {cumulative}")
+                    lines.append(f"{full_name}_bucket{_format_labels(key, (('le', '+Inf'),))} {histogram.count}")
+                    lines.append(f"{full_name}_sum{_format_labels(key)} {histogram.total:.6f}")
+                    lines.append(f"{full_name}_count{_format_labels(key)} {histogram.count}")
+
+            lines.append(f"# TYPE {METRIC_PREFIX}_run_started_timestamp_seconds gauge")
+            lines.append(f"{METRIC_PREFIX}_run_started_timestamp_seconds {self.started_at:.3f}")
+
+        return '\n'.join(lines) + '\n'
+
+    def summary(self) -> Dict:
+        """
+        실행 요약을 딕셔너리로 반환합니다.
+
+        Returns:
+            {'started_at', 'finished_at', 'duration_seconds', 'counters', 'stages'} 딕셔너리
+        """
+        now = time.time()
+        with self._lock:
+            counters = {
+                name: {self._summary_label(key): value for key, value in sorted(series.items())}
+                for name, series in sorted(self._counters.items())
+            }
+            stages = {
+                self._summary_label(key): {
+                    'count': histogram.count,
+                    'total_seconds': round(histogram.total, 4),
+                    'mean_ms': round(histogram.total / histogram.count * 1000, 3) if histogram.count else None,
+                    'p50_ms': round(histogram.quantile(0.50) * 1000, 3) if histogram.count else None,
+                    'p95_ms': round(histogram.quantile(0.95) * 1000, 3) if histogram.count else None,
+                    'max_ms': round(histogram.maximum * 1000, 3),
+                }
+                for key, histogram in sorted(self._histograms.get('stage_seconds', {}).items())
+            }
+
+            pages = sum(value for key, value in self._counters.get('pages', {}).items()
+                        if ('kind', 'detail') in key)
+
+        duration = now - self.started_at
+        return {
+            'started_at': datetime.fromtimestamp(self.started_at).isoformat(timespec='seconds'),
+            'finished_at': datetime.fromtimestamp(now).isoformat(timespec='seconds'),
+            'duration_seconds': round(duration, 3),
+            'detail_pages_per_second': round(pages / duration, 3) if duration > 0 else None,
+            'counters': counters,
+            'stages': stages,
+        }
+
+    @staticmethod
+    def _summary_label(key: LabelKey) -> str:
+        """요약 JSON에서 사용할 레이블 문자열 (예: 'stage=parse' 또는 'total')"""
+        return ','.join(f"{name}={value}" for name, value in key) or 'total'
+
+
+def _atomic_write(path: str, content: str):
+    """임시 파일에 쓴 뒤 교체 (읽는 쪽이 부분 기록된 파일을 보지 않도록)"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def write_textfile(path: str = None, target: Optional[MetricsRegistry] = None):
+    """
+    Prometheus 텍스트 파일을 기록합니다. (node_exporter textfile collector용)
+
+    Args:
+        path: 파일 경로 (None이면 config.METRICS_TEXTFILE, 설정이 없으면 기록 안 함)
+        target: 지표 저장소 (None이면 기본 저장소)
+    """
+    path = path or config.METRICS_TEXTFILE
+    if not path:
+        return
+    _atomic_write(path, (target or registry).render_prometheus())
+
+
+def write_summary(path: str = None, target: Optional[MetricsRegistry] = None, **extra) -> Dict:
+    """
+    실행 요약 JSON을 기록합니다.
+
+    Args:
+        path: 파일 경로 (None이면 config.METRICS_SUMMARY_PATH, 설정이 없으면 기록 안 함)
+        target: 지표 저장소 (None이면 기본 저장소)
+        **extra: 요약에 함께 기록할 값 (예: 대상 기간 수)
+
+    Returns:
+        요약 딕셔너리
+    """
+    summary = (target or registry).summary()
+    summary.update(extra)
+    path = path or config.METRICS_SUMMARY_PATH
+    if path:
+        _atomic_write(path, json.dumps(summary, ensure_ascii=False, indent=2))
+    return summary
+
+
+class MetricsServer:
+    """로컬 /metrics 엔드포인트를 제공하는 HTTP 서버 (백그라운드 스레드)"""
+
+    def __init__(self, port: int = None, host: str = '127.0.0.1', target: Optional[MetricsRegistry] = None):
+        """
+        서버 초기화
+
+        Args:
+            port: 수신 포트 (None이면 config.METRICS_HTTP_PORT)
+            host: 수신 주소 (기본값은 로컬에서만 접근)
+            target: 지표 저장소 (None이면 기본 저장소)
+        """
+        self.port = port if port is not None else config.METRICS_HTTP_PORT
+        self.host = host
+        self.target = target or registry
+        self.httpd = None
+        self.thread = None
+        self.logger = logging.getLogger(__name__)
+
+    def start(self):
+        """서버 시작"""
+        target = self.target
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != '/metrics':
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                body = target.render_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="metrics-server", daemon=True)
+        self.thread.start()
+        self.logger.info(f"지표 엔드포인트 시작: http://{self.host}:{self.httpd.server_address[1]}/metrics")
+
+    def stop(self):
+        """서버 종료"""
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.thread.join()
+            self.httpd = None
+
+
+# 기본 지표 저장소 (모든 모듈이 공유)
+registry = MetricsRegistry()
+
+# 기본 저장소에 기록하는 단축 함수
+inc = registry.inc
+observe = registry.observe
+timer = registry.timer
+timed = registry.timed
@@ -0,0 +1,294 @@
+"""
+디스크 응답 캐시 모듈
+목록/상세 페이지 HTML을 정규화된 URL 기준으로 압축 저장하여 재실행 시 다시 요청하지 않습니다.
+
+- 본문: <캐시 디렉토리>/<키 앞 2자리>/<키>.html.gz (키는 정규화 URL의 SHA-256)
+- 메타데이터: <캐시 디렉토리>/index.db (URL, 수집 시각, 마지막 사용 시각, 크기, 만료 시각, 본문 해시)
+- 만료: 심의일(DecideBaseNo)이 충분히 지난 페이지는 내용이 바뀌지 않으므로 만료되지 않음
+- 용량 제한: 전체 크기가 한도를 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+"""
+
+import os
+import re
+import gzip
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Iterator, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import config
+
+
+# 목록/상세 URL의 심의일 파라미터 (예: DecideBaseNo=Y20190109)
+DECIDE_BASE_NO_PATTERN = re.compile(r'DecideBaseNo=Y(\d{8})', re.IGNORECASE)
+
+# 기본 포트 (정규화 시 제거)
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    캐시 키로 사용할 수 있도록 URL을 정규화합니다.
+    스킴/호스트 소문자화, 기본 포트와 프래그먼트 제거, 쿼리 파라미터 정렬을 수행합니다.
+
+    Args:
+        url: 원본 URL
+
+    Returns:
+        정규화된 URL
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or '/', query, ''))
+
+
+def cache_key(url: str) -> str:
+    """
+    URL의 캐시 키를 계산합니다.
+
+    Args:
+        url: 원본 URL
+
+    Returns:
+        정규화된 URL의 SHA-256 16진수 문자열
+    """
+    return hashlib.sha256(normalize_url(url).encode('utf-8')).hexdigest()
+
+
+class PageCache:
+    """TTL과 LRU 용량 제한을 지원하는 디스크 페이지 캐시"""
+
+    def __init__(self, cache_dir: str = None, ttl_seconds: float = None,
+                 immutable_after_days: int = None, max_bytes: int = None):
+        """
+        캐시 초기화
+
+        Args:
+            cache_dir: 캐시 디렉토리
+            ttl_seconds: 최근 페이지의 유효 시간 (초)
+            immutable_after_days: 심의일로부터 이 기간이 지난 페이지는 만료되지 않음 (일)
+            max_bytes: 압축 본문 전체 크기 한도 (바이트)
+        """
+        self.cache_dir = cache_dir or config.CACHE_DIR
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else config.CACHE_TTL_SECONDS
+        self.immutable_after_days = (immutable_after_days if immutable_after_days is not None
+                                     else config.CACHE_IMMUTABLE_AFTER_DAYS)
+        self.max_bytes = max_bytes if max_bytes is not None else config.CACHE_MAX_BYTES
+        self.logger = logging.getLogger(__name__)
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # 작업 스레드들이 함께 사용하므로 연결 하나를 잠금으로 보호
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(self.cache_dir, 'index.db'), check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL,
+                content_hash TEXT NOT NULL
+            )
+        ''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries (last_access)')
+        self._conn.commit()
+
+        row = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()
+        self._total_bytes = row[0]
+
+    def ttl_for(self, url: str) -> Optional[float]:
+        """
+        URL의 유효 시간을 결정합니다.
+
+        Args:
+            url: 페이지 URL
+
+        Returns:
+            유효 시간 (초), 만료되지 않는 페이지는 None
+        """
+        match = DECIDE_BASE_NO_PATTERN.search(url)
+        if match:
+            try:
+                decided = datetime.strptime(match.group(1), '%Y%m%d')
+            except ValueError:
+                decided = None
+            if decided and datetime.now() - decided > timedelta(days=self.immutable_after_days):
+                return None
+        return self.ttl_seconds
+
+    def _body_path(self, key: str) -> str:
+        """캐시 키에 해당하는 본문 파일 경로"""
+        return os.path.join(self.cache_dir, key[:2], f"{key}.html.gz")
+
+    def contains(self, url: str) -> bool:
+        """
+        만료되지 않은 캐시 항목이 있는지 확인합니다. (마지막 사용 시각은 갱신하지 않음)
+
+        Args:
+            url: 페이지 URL
+
+        Returns:
+            캐시 적중 여부
+        """
+        key = cache_key(url)
+        with self._lock:
+            row = self._conn.execute('SELECT expires_at FROM entries WHERE key = ?', (key,)).fetchone()
+        return row is not None and (row[0] is None or row[0] > time.time())
+
+    def get(self, url: str) -> Optional[str]:
+        """
+        캐시된 페이지 HTML을 반환합니다.
+
+        Args:
+            url: 페이지 URL
+
+        Returns:
+            HTML 소스 (없거나 만료된 경우 None)
+        """
+        key = cache_key(url)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute('SELECT expires_at FROM entries WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            if row[0] is not None and row[0] <= now:
+                self._delete(key)
+                self._conn.commit()
+                return None
+
+            try:
+                with gzip.open(self._body_path(key), 'rb') as f:
+                    body = f.read()
+            except (OSError, EOFError):
+                # 본문 파일이 손상되었거나 지워진 경우 항목 제거
+                self._delete(key)
+                self._conn.commit()
+                return None
+
+            self._conn.execute('UPDATE entries SET last_access = ? WHERE key = ?', (now, key))
+            self._conn.commit()
+
+        return body.decode('utf-8')
+
+    def iter_raw(self, url_filter: str = None) -> Iterator[Tuple[str, bytes]]:
+        """
+        캐시에 저장된 모든 페이지의 압축된 본문을 그대로 반환합니다. (압축 해제를 다른 프로세스에 맡길 때)
+        만료된 항목도 포함하며, 마지막 사용 시각은 갱신하지 않습니다.
+
+        Args:
+            url_filter: URL에 이 문자열이 포함된 항목만 반환 (예: 'sub2_1_1.asp')
+
+        Yields:
+            (정규화된 URL, gzip 압축 본문) 튜플
+        """
+        with self._lock:
+            rows = self._conn.execute('SELECT key, url FROM entries ORDER BY url').fetchall()
+
+        for key, url in rows:
+            if url_filter and url_filter not in url:
+                continue
+            try:
+                with open(self._body_path(key), 'rb') as f:
+                    yield url, f.read()
+            except OSError:
+                continue
+
+    def iter_pages(self, url_filter: str = None) -> Iterator[Tuple[str, str]]:
+        """
+        캐시에 저장된 모든 페이지를 반환합니다. (재파싱/벤치마크용)
+        만료된 항목도 포함하며, 마지막 사용 시각은 갱신하지 않습니다.
+
+        Args:
+            url_filter: URL에 이 문자열이 포함된 항목만 반환 (예: 'sub2_1_1.asp')
+
+        Yields:
+            (정규화된 URL, HTML 소스) 튜플
+        """
+        for url, compressed in self.iter_raw(url_filter):
+            try:
+                body = gzip.decompress(compressed)
+            except (OSError, EOFError):
+                continue
+            yield url, body.decode('utf-8')
+
+    def put(self, url: str, html_content: str):
+        """
+        페이지 HTML을 캐시에 저장합니다.
+
+        Args:
+            url: 페이지 URL
+            html_content: HTML 소스
+        """
+        key = cache_key(url)
+        body = html_content.encode('utf-8')
+        compressed = gzip.compress(body)
+        now = time.time()
+        ttl = self.ttl_for(url)
+        expires_at = now + ttl if ttl is not None else None
+
+        # 임시 파일에 쓴 뒤 교체하여 부분 기록된 본문이 남지 않도록 함
+        path = self._body_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(compressed)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            row = self._conn.execute('SELECT size FROM entries WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                self._total_bytes -= row[0]
+
+            self._conn.execute(
+                'INSERT OR REPLACE INTO entries (key, url, fetched_at, last_access, size, expires_at, content_hash) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (key, normalize_url(url), now, now, len(compressed), expires_at, hashlib.sha256(body).hexdigest())
+            )
+            self._total_bytes += len(compressed)
+
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """전체 크기가 한도를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (잠금 보유 상태에서 호출)"""
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        evicted = 0
+        rows = self._conn.execute('SELECT key FROM entries ORDER BY last_access ASC').fetchall()
+        for (key,) in rows:
+            if self._total_bytes <= self.max_bytes:
+                break
+            self._delete(key)
+            evicted += 1
+
+        self.logger.info(f"캐시 용량 초과로 {evicted}개 항목 삭제")
+
+    def _delete(self, key: str):
+        """캐시 항목과 본문 파일 삭제 (잠금 보유 상태에서 호출)"""
+        row = self._conn.execute('SELECT size FROM entries WHERE key = ?', (key,)).fetchone()
+        if row is not None:
+            self._total_bytes -= row[0]
+        self._conn.execute('DELETE FROM entries WHERE key = ?', (key,))
+        try:
+            os.remove(self._body_path(key))
+        except FileNotFoundError:
+            pass
+
+    def close(self):
+        """메타데이터 연결 종료"""
+        with self._lock:
+            self._conn.close()
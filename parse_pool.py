@@ -0,0 +1,213 @@
+"""
+프로세스 풀 파싱 모듈
+상세 페이지 파싱은 CPU를 쓰는 작업이라 작업 스레드를 늘려도 GIL 때문에 코어 하나를 나눠 씁니다.
+ParsePool은 HTML 바이트를 묶음(chunk) 단위로 작업 프로세스에 보내고, 저장에 필요한 필드만 담은
+레코드를 돌려받습니다. 묶음 단위로 보내므로 페이지마다 프로세스 간 통신을 하지 않습니다.
+
+- 파이프라인 파싱 단계 (PARSE_PROCESSES > 0일 때만, 기본값 0): 파싱 큐에 쌓인 페이지를 최대 PARSE_CHUNK_SIZE개씩 묶어 파싱
+- 오프라인 재파싱 (reparse.py): 캐시의 gzip 본문을 그대로 보내 압축 해제까지 작업 프로세스에서 수행
+"""
+
+import os
+import gzip
+import time
+import logging
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import config
+import metrics
+from parser import get_parser_backend, parse_decision_detail
+
+
+# gzip 본문 시작 바이트 (캐시 본문은 압축된 채로 보냄)
+GZIP_MAGIC = b'\x1f\x8b'
+
+# 작업 프로세스에 넘길 파서 관련 설정 (실행 중에 바꾼 값도 작업 프로세스에 반영)
+WORKER_SETTINGS = ('BASE_URL', 'PARSER_BACKEND')
+
+# 작업 프로세스가 돌려주는 항목별 결과: (레코드, 오류 설명, 파싱 시간)
+ParseResult = Tuple[Optional[Dict[str, Any]], Optional[str], float]
+
+
+def compact_detail(html_content: str, backend: str = None) -> Dict[str, Any]:
+    """
+    심의 페이지를 파싱하여 저장할 필드만 남긴 레코드를 만듭니다.
+
+    Args:
+        html_content: 페이지 HTML 소스
+        backend: 파서 방식 (None이면 config.PARSER_BACKEND)
+
+    Returns:
+        파싱 결과 (주문/이유/적용 조항을 찾은 경우 full_content는 비움)
+    """
+    detail_data = parse_decision_detail(html_content, backend=backend)
+
+    # 섹션을 찾았으면 전체 내용은 마크다운에 쓰이지 않으므로 보관하지 않음 (본문을 두 벌 들고 있지 않도록)
+    if detail_data.get('decision_text') or detail_data.get('reason') or detail_data.get('applied_rules'):
+        detail_data['full_content'] = ''
+    return detail_data
+
+
+def _init_worker(settings: Dict[str, Any]):
+    """작업 프로세스 초기화: 부모 프로세스의 파서 관련 설정 적용"""
+    for name, value in settings.items():
+        setattr(config, name, value)
+
+
+def parse_payloads(payloads: List[bytes], backend: str) -> List[ParseResult]:
+    """
+    작업 프로세스에서 HTML 바이트 묶음을 파싱합니다. (gzip 본문은 먼저 압축 해제)
+    한 페이지의 오류가 묶음 전체를 실패시키지 않도록 오류는 항목별로 돌려줍니다.
+
+    Args:
+        payloads: UTF-8 HTML 바이트 또는 gzip 압축 바이트 리스트
+        backend: 파서 방식
+
+    Returns:
+        [(레코드, 오류 설명, 파싱 시간), ...] - payloads와 같은 순서
+    """
+    results = []
+    for payload in payloads:
+        start = time.perf_counter()
+        try:
+            if payload[:2] == GZIP_MAGIC:
+                payload = gzip.decompress(payload)
+            record = compact_detail(payload.decode('utf-8'), backend=backend)
+            results.append((record, None, time.perf_counter() - start))
+        except Exception as e:
+            results.append((None, f"{type(e).__name__}: {e}", time.perf_counter() - start))
+    return results
+
+
+class ParsePool:
+    """HTML 바이트 묶음을 작업 프로세스에서 파싱하는 프로세스 풀"""
+
+    def __init__(self, processes: int = None, chunk_size: int = None, backend: str = None):
+        """
+        파싱 풀 초기화
+
+        Args:
+            processes: 작업 프로세스 수 (None이면 config.PARSE_PROCESSES, 0이면 CPU 코어 수)
+            chunk_size: 한 번에 보낼 최대 페이지 수 (None이면 config.PARSE_CHUNK_SIZE)
+            backend: 파서 방식 (None이면 config.PARSER_BACKEND, 작업 프로세스에도 같은 방식을 넘김)
+        """
+        processes = processes if processes is not None else config.PARSE_PROCESSES
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size if chunk_size is not None else config.PARSE_CHUNK_SIZE
+        self.backend = get_parser_backend(backend)
+        self.logger = logging.getLogger(__name__)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.RLock()
+
+    def start(self):
+        """작업 프로세스 시작"""
+        with self._lock:
+            if self._executor is not None:
+                return
+            # 로그/지표 스레드가 도는 프로세스를 fork하지 않도록 spawn 방식으로 시작
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=({name: getattr(config, name) for name in WORKER_SETTINGS},)
+            )
+            self.logger.info(f"파싱 프로세스 풀 시작: {self.processes}개 프로세스, 묶음 크기 {self.chunk_size}")
+
+    def close(self):
+        """작업 프로세스 종료"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _submit(self, payloads: List[bytes]) -> Tuple[ProcessPoolExecutor, Future]:
+        """묶음 하나를 작업 프로세스에 보냄 (보낸 풀과 Future 반환)"""
+        with self._lock:
+            self.start()
+            executor = self._executor
+        return executor, executor.submit(parse_payloads, payloads, self.backend)
+
+    def _record_timings(self, results: List[ParseResult]):
+        """작업 프로세스에서 잰 파싱 시간을 이 프로세스의 지표에 기록"""
+        for _, _, elapsed in results:
+            metrics.observe('stage_seconds', elapsed, stage='parse', kind='detail', backend=self.backend)
+
+    def _result(self, submitted: Tuple[ProcessPoolExecutor, Future], payloads: List[bytes]) -> List[ParseResult]:
+        """
+        묶음 결과를 기다립니다.
+        작업 프로세스가 비정상 종료되어 풀이 깨졌으면 풀을 다시 만들고 그 묶음을 한 번 더 보냅니다.
+        """
+        executor, future = submitted
+        try:
+            results = future.result()
+        except BrokenProcessPool:
+            self.logger.warning(f"파싱 프로세스가 비정상 종료되었습니다. 풀을 다시 시작합니다 ({len(payloads)}건 재시도)")
+            metrics.inc('errors', stage='parse', type='BrokenProcessPool')
+            with self._lock:
+                # 다른 스레드가 이미 새 풀을 만들었으면 그대로 사용
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+            results = self._submit(payloads)[1].result()
+        self._record_timings(results)
+        return results
+
+    def parse_chunk(self, payloads: List[bytes]) -> List[ParseResult]:
+        """
+        HTML 바이트 묶음을 파싱하고 결과를 기다립니다. (파이프라인 파싱 단계용)
+
+        Args:
+            payloads: UTF-8 HTML 바이트 또는 gzip 압축 바이트 리스트
+
+        Returns:
+            [(레코드, 오류 설명, 파싱 시간), ...] - payloads와 같은 순서
+        """
+        return self._result(self._submit(payloads), payloads)
+
+    def map(self, items: Iterable[Any], payload_func: Callable[[Any], bytes]) -> Iterator[Tuple[Any, ParseResult]]:
+        """
+        항목을 묶음으로 나누어 모든 작업 프로세스에서 파싱합니다. (오프라인 재파싱용)
+        진행 중인 묶음은 프로세스 수의 2배까지만 유지하므로 입력 전체를 메모리에 올리지 않습니다.
+
+        Args:
+            items: 파싱할 항목 반복자
+            payload_func: 항목에서 보낼 HTML 바이트를 꺼내는 함수 (작업 프로세스에는 바이트만 보냄)
+
+        Yields:
+            (항목, (레코드, 오류 설명, 파싱 시간)) 튜플 - 입력 순서
+        """
+        in_flight: deque = deque()
+        max_in_flight = self.processes * 2
+
+        def drain_one() -> Iterator[Tuple[Any, ParseResult]]:
+            chunk_items, chunk_payloads, future = in_flight.popleft()
+            yield from zip(chunk_items, self._result(future, chunk_payloads))
+
+        chunk_items: List[Any] = []
+        for item in items:
+            chunk_items.append(item)
+            if len(chunk_items) < self.chunk_size:
+                continue
+            chunk_payloads = [payload_func(chunk_item) for chunk_item in chunk_items]
+            in_flight.append((chunk_items, chunk_payloads, self._submit(chunk_payloads)))
+            chunk_items = []
+            if len(in_flight) >= max_in_flight:
+                yield from drain_one()
+
+        if chunk_items:
+            chunk_payloads = [payload_func(chunk_item) for chunk_item in chunk_items]
+            in_flight.append((chunk_items, chunk_payloads, self._submit(chunk_payloads)))
+        while in_flight:
+            yield from drain_one()
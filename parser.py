@@ -1,23 +1,292 @@
 """
 HTML 파싱 모듈
-BeautifulSoup을 사용하여 HTML에서 필요한 데이터를 추출합니다.
+HTML에서 필요한 데이터를 추출합니다.
+
+- lxml 방식 (기본값): 미리 컴파일한 XPath로 목록/본문 컨테이너만 탐색
+- html.parser 방식: BeautifulSoup 트리 탐색 (기존 구현, 목록/본문 컨테이너만 트리로 만듦)
+
+두 방식은 같은 딕셔너리를 반환합니다. (benchmark_parser.py, tests/test_parser.py로 확인)
 """
 
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+import re
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+from typing import Iterator, List, Dict, Optional
+
+import config
+import metrics
+
+
+# 상세 페이지 본문 컨테이너 (<div class="rst_result_view">) 존재 여부 검사용
+DETAIL_CONTAINER_PATTERN = re.compile(r'<div[^>]*class=["\']?[^"\'>]*\brst_result_view\b', re.IGNORECASE)
+
+# 월별 목록 페이지 목록 컨테이너 (<div class="rst_list_l">) 존재 여부 검사용
+LIST_CONTAINER_PATTERN = re.compile(r'<div[^>]*class=["\']?[^"\'>]*\brst_list_l\b', re.IGNORECASE)
+
+# 심의 페이지 URL의 결정번호 파라미터
+DECIDE_NO_PATTERN = re.compile(r'[?&]DecideNo=([^&#]+)', re.IGNORECASE)
+
+# 연도별 목록 페이지의 심의일 값 (링크의 DecideBaseNo 파라미터 또는 선택 상자의 value, 예: Y20190109)
+DECIDE_BASE_NO_VALUE_PATTERN = re.compile(r'(?:DecideBaseNo=|value=["\']?)(Y\d{8})\b', re.IGNORECASE)
+
+# lxml HTML 파서 (문자열을 UTF-8로 넘기므로 페이지의 meta charset은 무시)
+LXML_HTML_PARSER = etree.HTMLParser(encoding='utf-8')
+
+# BeautifulSoup의 get_text()가 건너뛰는 태그 (문자열이 텍스트로 취급되지 않음)
+NON_TEXT_TAGS = frozenset(['script', 'style', 'template'])
+
+# lxml(libxml2)은 <p> 안에서 블록 요소(<div>, <table> 등)나 다른 <p>를 만나면 <p>를 자동으로 닫고
+# 남은 </p>는 버리지만, html.parser는 </p>까지 <p> 안에 둠.
+# libxml2가 모르는 태그는 자동으로 닫지 않으므로 파싱 전에 <p>/</p>의 이름을 바꿔 html.parser와 같은 트리를 만듦
+PARAGRAPH_TAG_PATTERN = re.compile(r'<(/?)p(?=[\s/>])', re.IGNORECASE)
+LXML_PARAGRAPH_TAG = 'x-p'
+
+# html.parser 방식에서 트리로 만들 범위 (컨테이너 밖의 요소는 객체를 만들지 않음)
+LIST_STRAINER = SoupStrainer('div', class_='rst_list_l')
+DETAIL_STRAINER = SoupStrainer('div', class_='rst_result_view')
+
+
+def _has_class(name: str) -> str:
+    """class 속성에 해당 클래스가 포함되었는지 확인하는 XPath 조건 (BeautifulSoup의 class_ 검색과 동일)"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# 미리 컴파일한 XPath (모두 문서 순서상 첫 번째 요소를 찾는 find()에 대응)
+XPATH_LIST_CONTAINER = etree.XPath(f"(//div[{_has_class('rst_list_l')}])[1]")
+XPATH_LIST_ITEMS = etree.XPath(".//li")
+XPATH_LIST_LINK = etree.XPath("(.//a[contains(@href, 'sub2_1_1.asp')])[1]")
+XPATH_FIRST_SPAN = etree.XPath("(.//span)[1]")
+XPATH_FIRST_STRONG = etree.XPath("(.//strong)[1]")
+XPATH_DECISION_TYPE = etree.XPath(f"(.//u[{_has_class('rl_btn')}])[1]")
+
+XPATH_RESULT_VIEW = etree.XPath(f"(//div[{_has_class('rst_result_view')}])[1]")
+XPATH_TITLE_AREA = etree.XPath(f"(.//div[{_has_class('rst_titleW')}])[1]")
+XPATH_SECTION_TITLE = etree.XPath(f"(.//h3[{_has_class('type01')}])[1]")
+XPATH_FIRST_I = etree.XPath("(.//i)[1]")
+XPATH_FIRST_DD = etree.XPath("(.//dd)[1]")
+XPATH_CONTENT_AREA = etree.XPath(f"(.//div[{_has_class('rst_contW')}])[1]")
+XPATH_FIRST_P = etree.XPath(f"(.//{LXML_PARAGRAPH_TAG})[1]")
+
+
+def is_valid_detail_page(html_content: str) -> bool:
+    """
+    상세 페이지 HTML에 본문 컨테이너가 있는지 빠르게 검사합니다.
+    (트리를 만들지 않고 정규식으로만 확인)
+
+    Args:
+        html_content: 페이지의 HTML 내용
+
+    Returns:
+        rst_result_view 컨테이너 존재 여부
+    """
+    if not html_content:
+        return False
+    return DETAIL_CONTAINER_PATTERN.search(html_content) is not None
+
+
+def is_valid_list_page(html_content: str) -> bool:
+    """
+    월별 목록 페이지 HTML에 목록 컨테이너가 있는지 빠르게 검사합니다.
+    (심의가 없는 달은 항목 없이 컨테이너만 있으므로, 빈 목록과 불러오지 못한 페이지를 구분하는 데 사용)
+
+    Args:
+        html_content: 페이지의 HTML 내용
+
+    Returns:
+        rst_list_l 컨테이너 존재 여부
+    """
+    if not html_content:
+        return False
+    return LIST_CONTAINER_PATTERN.search(html_content) is not None
 
 
-def parse_decision_list(html_content: str) -> List[Dict[str, str]]:
+def extract_decide_no(url: str) -> str:
+    """
+    심의 페이지 URL에서 결정번호(DecideNo 파라미터)를 추출합니다.
+
+    Args:
+        url: 심의 페이지 URL (예: ...sub2_1_1.asp?Year=2025&DecideBaseNo=Y20250709&DecideNo=2025-1268)
+
+    Returns:
+        결정번호 (없으면 빈 문자열)
+    """
+    match = DECIDE_NO_PATTERN.search(url or '')
+    return match.group(1) if match else ''
+
+
+def extract_decide_base_nos(html_content: str) -> List[str]:
+    """
+    연도별 목록 페이지에서 심의일(DecideBaseNo) 값을 모두 추출합니다.
+    (트리를 만들지 않고 정규식으로만 확인)
+
+    Args:
+        html_content: sub2_1.asp?Year=YYYY 페이지의 HTML 내용
+
+    Returns:
+        중복을 제거하고 날짜순으로 정렬한 DecideBaseNo 리스트 (예: ['Y20190109', 'Y20190213'])
+    """
+    values = {match.upper() for match in DECIDE_BASE_NO_VALUE_PATTERN.findall(html_content or '')}
+    return sorted(values)
+
+
+def get_parser_backend(backend: str = None) -> str:
+    """
+    사용할 파서 방식을 결정합니다.
+
+    Args:
+        backend: 'lxml' 또는 'html.parser' (None이면 config.PARSER_BACKEND)
+
+    Returns:
+        파서 방식 이름
+    """
+    backend = backend or config.PARSER_BACKEND
+    if backend not in ('lxml', 'html.parser'):
+        raise ValueError(f"지원하지 않는 파서 방식입니다: {backend}")
+    return backend
+
+
+def _absolute_url(url: str) -> str:
+    """목록 페이지의 상대 경로 링크를 절대 경로로 변환"""
+    if url and not url.startswith('http'):
+        if url.startswith('/'):
+            url = config.BASE_URL + url
+        else:
+            url = config.BASE_URL + '/m2/' + url
+    return url
+
+
+def _parse_tree(html_content: str, keep_paragraphs: bool = False) -> Optional[etree._Element]:
+    """
+    lxml로 HTML 트리를 만듭니다.
+
+    Args:
+        html_content: 페이지의 HTML 내용
+        keep_paragraphs: True이면 <p>를 LXML_PARAGRAPH_TAG로 바꿔 html.parser처럼 </p>까지 <p> 안에 둠
+
+    Returns:
+        문서 루트 요소 (빈 문서는 None)
+    """
+    if not html_content:
+        return None
+    if keep_paragraphs:
+        html_content = PARAGRAPH_TAG_PATTERN.sub(rf'<\1{LXML_PARAGRAPH_TAG}', html_content)
+    return etree.fromstring(html_content.encode('utf-8'), LXML_HTML_PARSER)
+
+
+def _iter_strings(element: etree._Element, skip: etree._Element = None) -> Iterator[str]:
+    """
+    요소 하위의 텍스트 조각을 문서 순서대로 반환합니다.
+    BeautifulSoup의 get_text()와 같이 주석과 script/style 내용은 제외합니다.
+
+    Args:
+        element: 시작 요소
+        skip: 하위 트리를 제외할 요소 (꼬리 텍스트는 포함)
+    """
+    if element.text and element.tag not in NON_TEXT_TAGS:
+        yield element.text
+    for child in element:
+        # 주석/처리 지시문은 tag가 문자열이 아님
+        if isinstance(child.tag, str) and child is not skip:
+            yield from _iter_strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def _get_text(element: etree._Element, separator: str = '', skip: etree._Element = None) -> str:
+    """BeautifulSoup의 get_text(separator, strip=True)와 같은 결과를 반환합니다."""
+    return separator.join(
+        text for text in (s.strip() for s in _iter_strings(element, skip)) if text
+    )
+
+
+def _first(xpath: etree.XPath, element: etree._Element) -> Optional[etree._Element]:
+    """XPath 결과의 첫 번째 요소 (없으면 None)"""
+    result = xpath(element)
+    return result[0] if result else None
+
+
+def parse_decision_list(html_content: str, backend: str = None) -> List[Dict[str, str]]:
     """
     월별 심의 결정 목록 페이지에서 개별 심의 링크를 추출합니다.
 
     Args:
         html_content: 페이지의 HTML 내용
+        backend: 파서 방식 ('lxml' 또는 'html.parser', None이면 config.PARSER_BACKEND)
 
     Returns:
         심의 정보 리스트 [{'title': '...', 'url': '...', 'decision_no': '...', 'decision_type': '...'}, ...]
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
+    backend = get_parser_backend(backend)
+    with metrics.timer('parse', kind='list', backend=backend):
+        if backend == 'lxml':
+            decisions = _parse_decision_list_lxml(html_content)
+        else:
+            decisions = _parse_decision_list_soup(html_content)
+        return dedupe_decision_links(decisions)
+
+
+def dedupe_decision_links(decisions: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """
+    같은 심의를 가리키는 링크를 결정번호(DecideNo 파라미터) 기준으로 하나만 남깁니다.
+    처음 나온 링크를 유지하고, 비어 있는 값은 뒤에 나온 중복 링크의 값으로 채웁니다.
+
+    Args:
+        decisions: 목록 페이지에서 추출한 심의 정보 리스트
+
+    Returns:
+        중복이 제거된 심의 정보 리스트 (처음 나온 순서 유지)
+    """
+    unique: Dict[str, Dict[str, str]] = {}
+    for decision in decisions:
+        key = extract_decide_no(decision['url']) or decision['url']
+        kept = unique.get(key)
+        if kept is None:
+            unique[key] = decision
+            continue
+        for field, value in decision.items():
+            if value and not kept.get(field):
+                kept[field] = value
+    return list(unique.values())
+
+
+def _parse_decision_list_lxml(html_content: str) -> List[Dict[str, str]]:
+    """parse_decision_list의 lxml 구현"""
+    decisions = []
+
+    root = _parse_tree(html_content)
+    if root is None:
+        return decisions
+
+    list_container = _first(XPATH_LIST_CONTAINER, root)
+    if list_container is None:
+        return decisions
+
+    for item in XPATH_LIST_ITEMS(list_container):
+        link = _first(XPATH_LIST_LINK, item)
+        if link is None:
+            continue
+
+        decision_no_elem = _first(XPATH_FIRST_SPAN, link)
+        title_elem = _first(XPATH_FIRST_STRONG, link)
+        decision_type_elem = _first(XPATH_DECISION_TYPE, link)
+
+        title = _get_text(title_elem) if title_elem is not None else ''
+        if not title:
+            title = link.get('title', '')
+
+        decisions.append({
+            'title': title,
+            'url': _absolute_url(link.get('href', '')),
+            'decision_no': _get_text(decision_no_elem) if decision_no_elem is not None else '',
+            'decision_type': _get_text(decision_type_elem) if decision_type_elem is not None else '',
+        })
+
+    return decisions
+
+
+def _parse_decision_list_soup(html_content: str) -> List[Dict[str, str]]:
+    """parse_decision_list의 BeautifulSoup 구현"""
+    soup = BeautifulSoup(html_content, 'html.parser', parse_only=LIST_STRAINER)
     decisions = []
 
     # HTML 구조:
@@ -52,12 +321,7 @@ def parse_decision_list(html_content: str) -> List[Dict[str, str]]:
         url = link.get('href', '')
 
         # 상대 경로를 절대 경로로 변환
-        if url and not url.startswith('http'):
-            from config import BASE_URL
-            if url.startswith('/'):
-                url = BASE_URL + url
-            else:
-                url = BASE_URL + '/m2/' + url
+        url = _absolute_url(url)
 
         # 결정번호 추출 (span 태그)
         decision_no_elem = link.find('span')
@@ -85,17 +349,111 @@ def parse_decision_list(html_content: str) -> List[Dict[str, str]]:
     return decisions
 
 
-def parse_decision_detail(html_content: str) -> Dict[str, any]:
+def parse_decision_detail(html_content: str, backend: str = None) -> Dict[str, any]:
     """
     개별 심의 페이지에서 상세 내용을 추출합니다.
 
     Args:
         html_content: 페이지의 HTML 내용
+        backend: 파서 방식 ('lxml' 또는 'html.parser', None이면 config.PARSER_BACKEND)
 
     Returns:
         심의 상세 정보 딕셔너리
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
+    backend = get_parser_backend(backend)
+    with metrics.timer('parse', kind='detail', backend=backend):
+        if backend == 'lxml':
+            return _parse_decision_detail_lxml(html_content)
+        return _parse_decision_detail_soup(html_content)
+
+
+def _empty_detail() -> Dict[str, any]:
+    """상세 정보 딕셔너리의 기본값"""
+    return {
+        'title': '',
+        'decision_no': '',
+        'decision_type': '',
+        'newspaper': '',
+        'publisher': '',
+        'decision_text': '',      # 주문
+        'reason': '',             # 이유
+        'applied_rules': '',      # 적용 조항
+        'full_content': '',       # 전체 내용
+    }
+
+
+def _split_newspaper(detail: Dict[str, any], dd_text: str):
+    """"중부매일      발행인  한  인  섭" 형태의 텍스트를 언론사와 발행인으로 분리"""
+    parts = dd_text.split('발행인')
+    if len(parts) >= 1:
+        detail['newspaper'] = parts[0].strip()
+    if len(parts) >= 2:
+        detail['publisher'] = '발행인 ' + parts[1].strip()
+
+
+def _assign_section(detail: Dict[str, any], section_title: str, section_content: str):
+    """섹션 제목에 따라 주문/이유/적용 조항으로 분류"""
+    if '주문' in section_title or '주 문' in section_title:
+        detail['decision_text'] = section_content
+    elif '이유' in section_title or '이 유' in section_title:
+        detail['reason'] = section_content
+    elif '적용' in section_title or '조항' in section_title:
+        detail['applied_rules'] = section_content
+
+
+def _parse_decision_detail_lxml(html_content: str) -> Dict[str, any]:
+    """parse_decision_detail의 lxml 구현 (본문 컨테이너 하위만 탐색)"""
+    detail = _empty_detail()
+
+    root = _parse_tree(html_content, keep_paragraphs=True)
+    if root is None:
+        return detail
+
+    result_view = _first(XPATH_RESULT_VIEW, root)
+    if result_view is None:
+        return detail
+
+    # 1. 제목 영역 파싱 (rst_titleW)
+    title_area = _first(XPATH_TITLE_AREA, result_view)
+    if title_area is not None:
+        decision_type_elem = _first(XPATH_DECISION_TYPE, title_area)
+        if decision_type_elem is not None:
+            detail['decision_type'] = _get_text(decision_type_elem)
+
+        h3_elem = _first(XPATH_SECTION_TITLE, title_area)
+        if h3_elem is not None:
+            # 결정번호는 <i> 태그 안에, 나머지 텍스트가 제목
+            decision_no_elem = _first(XPATH_FIRST_I, h3_elem)
+            if decision_no_elem is not None:
+                detail['decision_no'] = _get_text(decision_no_elem)
+            detail['title'] = _get_text(h3_elem, skip=decision_no_elem)
+
+        dd_elem = _first(XPATH_FIRST_DD, title_area)
+        if dd_elem is not None:
+            _split_newspaper(detail, _get_text(dd_elem))
+
+    # 2. 본문 영역 파싱 (rst_contW)
+    content_area = _first(XPATH_CONTENT_AREA, result_view)
+    if content_area is not None:
+        for item in XPATH_LIST_ITEMS(content_area):
+            section_title_elem = _first(XPATH_SECTION_TITLE, item)
+            if section_title_elem is None:
+                continue
+
+            section_content_elem = _first(XPATH_FIRST_P, item)
+            if section_content_elem is None:
+                continue
+
+            _assign_section(detail, _get_text(section_title_elem), _get_text(section_content_elem))
+
+        detail['full_content'] = _get_text(content_area, separator='\n')
+
+    return detail
+
+
+def _parse_decision_detail_soup(html_content: str) -> Dict[str, any]:
+    """parse_decision_detail의 BeautifulSoup 구현"""
+    soup = BeautifulSoup(html_content, 'html.parser', parse_only=DETAIL_STRAINER)
 
     # HTML 구조:
     # <div class="rst_result_view">
@@ -113,17 +471,7 @@ def parse_decision_detail(html_content: str) -> Dict[str, any]:
     #   </div>
     # </div>
 
-    detail = {
-        'title': '',
-        'decision_no': '',
-        'decision_type': '',
-        'newspaper': '',
-        'publisher': '',
-        'decision_text': '',      # 주문
-        'reason': '',             # 이유
-        'applied_rules': '',      # 적용 조항
-        'full_content': '',       # 전체 내용
-    }
+    detail = _empty_detail()
 
     # 메인 컨테이너 찾기
     result_view = soup.find('div', class_='rst_result_view')
@@ -154,14 +502,8 @@ def parse_decision_detail(html_content: str) -> Dict[str, any]:
         # 언론사 및 발행인 추출 (dd)
         dd_elem = title_area.find('dd')
         if dd_elem:
-            dd_text = dd_elem.get_text(strip=True)
-            # "중부매일      발행인  한  인  섭" 형태
-            # 언론사와 발행인을 분리
-            parts = dd_text.split('발행인')
-            if len(parts) >= 1:
-                detail['newspaper'] = parts[0].strip()
-            if len(parts) >= 2:
-                detail['publisher'] = '발행인 ' + parts[1].strip()
+            # "중부매일      발행인  한  인  섭" 형태에서 언론사와 발행인을 분리
+            _split_newspaper(detail, dd_elem.get_text(strip=True))
 
     # 2. 본문 영역 파싱 (rst_contW)
     content_area = result_view.find('div', class_='rst_contW')
@@ -185,12 +527,7 @@ def parse_decision_detail(html_content: str) -> Dict[str, any]:
             section_content = section_content_elem.get_text(strip=True)
 
             # 섹션별로 분류
-            if '주문' in section_title or '주 문' in section_title:
-                detail['decision_text'] = section_content
-            elif '이유' in section_title or '이 유' in section_title:
-                detail['reason'] = section_content
-            elif '적용' in section_title or '조항' in section_title:
-                detail['applied_rules'] = section_content
+            _assign_section(detail, section_title, section_content)
 
         # 전체 본문 내용도 저장
         detail['full_content'] = content_area.get_text(separator='\n', strip=True)
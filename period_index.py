@@ -0,0 +1,206 @@
+"""
+심의 기간(월별 목록 URL) 자동 탐색 모듈
+연도별 목록 페이지(sub2_1.asp?Year=YYYY)를 한 번 요청하여 그 해의 모든 심의일(DecideBaseNo)을 찾고,
+결과를 로컬 기간 인덱스(JSON)에 저장하여 다음 실행에서 다시 사용합니다.
+
+- 해가 끝난 뒤에 찾은 연도: 심의일이 더 이상 바뀌지 않으므로 다시 요청하지 않음
+- 그 밖의 연도 (올해 이후, 또는 해가 끝나기 전에 찾은 지난 연도): PERIOD_INDEX_TTL_SECONDS가 지나면
+  다시 요청하여 새 심의일을 반영
+"""
+
+import os
+import json
+import time
+import logging
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+import config
+from parser import extract_decide_base_nos
+
+
+def year_list_url(year: int) -> str:
+    """
+    연도별 목록 페이지 URL을 반환합니다.
+
+    Args:
+        year: 연도
+
+    Returns:
+        sub2_1.asp?Year=YYYY URL
+    """
+    return f"{config.MONTH_LIST_URL}?Year={year}"
+
+
+def period_url(year: int, decide_base_no: str) -> str:
+    """
+    월별 목록 페이지 URL을 반환합니다.
+
+    Args:
+        year: 연도
+        decide_base_no: 심의일 값 (예: Y20190109)
+
+    Returns:
+        sub2_1.asp?Year=YYYY&DecideBaseNo=... URL (config.TARGET_MONTH_URLS와 같은 형식)
+    """
+    return f"{config.MONTH_LIST_URL}?Year={year}&DecideBaseNo={decide_base_no}"
+
+
+def parse_year_spec(spec: str) -> List[int]:
+    """
+    연도 지정 문자열을 연도 리스트로 변환합니다.
+
+    Args:
+        spec: '2023', '2019-2022', '2019,2021,2023-2024' 형식
+
+    Returns:
+        오름차순 연도 리스트
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    years = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            start, end = (int(value) for value in part.split('-', 1))
+            if start > end:
+                raise ValueError(f"연도 범위가 잘못되었습니다: {part}")
+            years.update(range(start, end + 1))
+        else:
+            years.add(int(part))
+
+    if not years:
+        raise ValueError(f"연도를 지정해주세요: {spec}")
+    return sorted(years)
+
+
+def parse_month_spec(spec: str) -> Tuple[int, int]:
+    """
+    연월 지정 문자열을 (연도, 월)로 변환합니다.
+
+    Args:
+        spec: 'YYYY-MM' 형식 (예: '2019-03')
+
+    Returns:
+        (연도, 월) 튜플
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    parsed = datetime.strptime(spec.strip(), '%Y-%m')
+    return parsed.year, parsed.month
+
+
+class PeriodIndex:
+    """연도별 심의일 목록을 로컬 JSON 파일에 보관하는 기간 인덱스"""
+
+    def __init__(self, fetch_func: Callable[[str], str], path: str = None, ttl_seconds: float = None):
+        """
+        기간 인덱스 초기화
+
+        Args:
+            fetch_func: URL -> HTML 소스를 반환하는 함수 (연도별 목록 페이지 요청용)
+            path: 인덱스 파일 경로
+            ttl_seconds: 해가 끝나기 전에 찾은 심의일 목록의 유효 시간 (초)
+        """
+        self.fetch_func = fetch_func
+        self.path = path or config.PERIOD_INDEX_PATH
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else config.PERIOD_INDEX_TTL_SECONDS
+        self.logger = logging.getLogger(__name__)
+        self._years: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        """인덱스 파일 읽기 (없거나 손상된 경우 빈 인덱스)"""
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('years', {})
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"기간 인덱스를 읽지 못했습니다. 새로 만듭니다: {e}")
+            return {}
+
+    def _save(self):
+        """인덱스 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'years': self._years}, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def _is_fresh(self, year: int, entry: Dict) -> bool:
+        """저장된 심의일 목록을 다시 요청하지 않고 사용할 수 있는지 확인"""
+        fetched_at = entry.get('fetched_at', 0)
+        # 해가 끝난 뒤에 찾은 목록만 확정 (연중에 찾은 목록에는 이후 심의일이 빠져 있음)
+        if fetched_at >= datetime(year + 1, 1, 1).timestamp():
+            return True
+        return time.time() - fetched_at < self.ttl_seconds
+
+    def decide_base_nos(self, year: int, refresh: bool = False) -> List[str]:
+        """
+        연도의 심의일 목록을 반환합니다. 인덱스에 없거나 오래된 경우에만 목록 페이지를 요청합니다.
+
+        Args:
+            year: 연도
+            refresh: True이면 인덱스를 무시하고 다시 요청
+
+        Returns:
+            DecideBaseNo 리스트 (날짜순, 목록 페이지에서 찾지 못하면 저장된 목록 또는 빈 리스트)
+        """
+        entry = self._years.get(str(year))
+        if entry is not None and not refresh and self._is_fresh(year, entry):
+            return entry['decide_base_nos']
+
+        url = year_list_url(year)
+        self.logger.info(f"{year}년 심의일 탐색: {url}")
+
+        try:
+            html_content = self.fetch_func(url)
+        except Exception as e:
+            if entry is not None:
+                self.logger.warning(f"{year}년 심의일 탐색 실패, 저장된 목록 사용: {e}")
+                return entry['decide_base_nos']
+            raise
+
+        # 같은 연도 페이지에는 해당 연도의 심의일만 남김 (이전/다음 연도 이동 링크 제외)
+        values = [value for value in extract_decide_base_nos(html_content) if value[1:5] == str(year)]
+        if not values:
+            # 일시적인 오류 페이지나 마크업 변경일 수 있으므로 저장하지 않음 (다음 실행에서 다시 요청)
+            self.logger.warning(f"{year}년 목록 페이지에서 심의일을 찾지 못했습니다. 기간 인덱스에 저장하지 않습니다.")
+            return entry['decide_base_nos'] if entry is not None else []
+
+        self._years[str(year)] = {'fetched_at': time.time(), 'decide_base_nos': values}
+        self._save()
+        self.logger.info(f"{year}년 심의일 {len(values)}개 발견")
+        return values
+
+    def periods(self, years: List[int], start: Optional[Tuple[int, int]] = None,
+                end: Optional[Tuple[int, int]] = None, refresh: bool = False) -> List[Tuple[int, int, str]]:
+        """
+        요청한 연도/기간에 해당하는 월별 목록 URL을 반환합니다.
+
+        Args:
+            years: 대상 연도 리스트
+            start: 시작 연월 (포함, None이면 제한 없음)
+            end: 종료 연월 (포함, None이면 제한 없음)
+            refresh: True이면 저장된 심의일 목록을 무시하고 다시 요청
+
+        Returns:
+            [(연도, 월, 월별 목록 URL), ...] - config.TARGET_MONTH_URLS와 같은 형식
+        """
+        targets = []
+        for year in years:
+            for value in self.decide_base_nos(year, refresh=refresh):
+                month = int(value[5:7])
+                if start is not None and (year, month) < start:
+                    continue
+                if end is not None and (year, month) > end:
+                    continue
+                targets.append((year, month, period_url(year, value)))
+        return targets
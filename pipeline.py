@@ -0,0 +1,266 @@
+"""
+스트리밍 처리 파이프라인 모듈
+수집(fetch) → 파싱(parse) → 저장(write) 단계를 크기가 제한된 큐로 연결합니다.
+
+- 수집 단계: 호출한 스레드에서 페이지 소스 반복자를 소비하여 파싱 큐에 넣음
+- 파싱 단계: 여러 작업 스레드가 파싱 큐에서 꺼내 레코드로 변환하여 저장 큐에 넣음
+  (파싱 프로세스 풀을 넘기면 작업 스레드는 쌓인 항목을 묶어 작업 프로세스에 보내고 결과만 받아 옴)
+- 저장 단계: 작업 스레드 하나가 저장 큐에서 꺼내 파일로 기록
+
+큐가 가득 차면 앞 단계가 대기하므로(역압), 한 달치 데이터를 한꺼번에 메모리에 올리지 않습니다.
+"""
+
+import time
+import queue
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import config
+import metrics
+from parse_pool import ParsePool
+
+
+# 단계 종료 신호
+_DONE = object()
+
+
+class StreamingPipeline:
+    """제한된 큐로 연결된 수집 → 파싱 → 저장 파이프라인"""
+
+    def __init__(self, parse_func: Callable[[Any], Any], write_func: Callable[[Any], Any],
+                 parse_workers: int = None, queue_size: int = None, monitor_interval: float = None,
+                 parse_pool: Optional[ParsePool] = None, pool_input: Optional[Callable[[Any], bytes]] = None,
+                 shutdown_timeout: float = None):
+        """
+        파이프라인 초기화
+
+        Args:
+            parse_func: 수집 항목을 레코드로 변환하는 함수 (None 반환 시 해당 항목은 버림,
+                        parse_pool을 쓰면 (수집 항목, 파싱 결과)를 받아 레코드를 완성)
+            write_func: 레코드를 저장하고 결과(인덱스 항목 등)를 반환하는 함수 (None 반환 시 결과에서 제외)
+            parse_workers: 파싱 작업 스레드 수 (parse_pool을 쓰면 최소 작업 프로세스 수만큼)
+            queue_size: 단계 사이 큐의 최대 크기
+            monitor_interval: 큐 깊이를 로그로 남길 주기 (초, 0이면 기록 안 함)
+            parse_pool: 파싱을 맡길 프로세스 풀 (None이면 작업 스레드에서 parse_func로 파싱)
+            pool_input: 수집 항목에서 작업 프로세스에 보낼 HTML 바이트를 꺼내는 함수 (parse_pool 사용 시 필요)
+            shutdown_timeout: 중단 시 작업 스레드가 진행 중인 항목을 마치기를 기다리는 최대 시간 (초)
+        """
+        self.parse_func = parse_func
+        self.write_func = write_func
+        self.parse_workers = parse_workers if parse_workers is not None else config.PIPELINE_PARSE_WORKERS
+        self.parse_pool = parse_pool
+        self.pool_input = pool_input
+        if parse_pool is not None:
+            # 작업 스레드 하나가 묶음 하나를 기다리므로 모든 작업 프로세스가 일하도록 스레드 수를 맞춤
+            self.parse_workers = max(self.parse_workers, parse_pool.processes)
+        self.queue_size = queue_size if queue_size is not None else config.PIPELINE_QUEUE_SIZE
+        self.monitor_interval = (monitor_interval if monitor_interval is not None
+                                 else config.PIPELINE_MONITOR_INTERVAL)
+        self.shutdown_timeout = (shutdown_timeout if shutdown_timeout is not None
+                                 else config.PIPELINE_SHUTDOWN_TIMEOUT)
+
+        self.parse_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        self.write_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        self.stats = {'fetched': 0, 'parsed': 0, 'written': 0, 'parse_errors': 0, 'write_errors': 0}
+
+        self._results: List[Any] = []
+        self._stats_lock = threading.Lock()
+        self._stop = threading.Event()
+        self.logger = logging.getLogger(__name__)
+
+    def queue_depths(self) -> Dict[str, int]:
+        """
+        단계별 대기 중인 항목 수를 반환합니다. (모니터링용)
+
+        Returns:
+            {'parse': 파싱 대기 수, 'write': 저장 대기 수}
+        """
+        return {'parse': self.parse_queue.qsize(), 'write': self.write_queue.qsize()}
+
+    def _count(self, key: str):
+        """단계별 처리 건수 증가"""
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _put(self, target: queue.Queue, item: Any) -> bool:
+        """중단 요청을 확인하면서 큐에 항목을 넣음 (중단 시 False)"""
+        while not self._stop.is_set():
+            try:
+                target.put(item, timeout=0.2)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: queue.Queue) -> Any:
+        """중단 요청을 확인하면서 큐에서 항목을 꺼냄 (중단 시 _DONE)"""
+        while not self._stop.is_set():
+            try:
+                return source.get(timeout=0.2)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _emit(self, record: Any) -> bool:
+        """파싱된 레코드를 저장 큐에 넣음 (None이면 버림, 중단 시 False)"""
+        if record is None:
+            return True
+        self._count('parsed')
+        return self._put(self.write_queue, record)
+
+    def _parse_failed(self, error: str, error_type: str, count: int = 1):
+        """파싱 오류 기록"""
+        self.logger.error(f"파싱 단계 오류: {error}")
+        for _ in range(count):
+            self._count('parse_errors')
+        metrics.inc('errors', amount=count, stage='parse', type=error_type)
+
+    def _pool_parse_worker(self):
+        """파싱 단계 작업 스레드 (프로세스 풀 사용: 이미 쌓인 항목을 묶음 크기까지 모아 한 번에 보냄)"""
+        finished = False
+        while not finished:
+            item = self._get(self.parse_queue)
+            if item is _DONE:
+                break
+
+            # 첫 항목만 기다리고 나머지는 큐에 이미 있는 것만 모음 (수집이 느릴 때 지연을 늘리지 않도록)
+            chunk = [item]
+            while len(chunk) < self.parse_pool.chunk_size:
+                try:
+                    item = self.parse_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _DONE:
+                    finished = True
+                    break
+                chunk.append(item)
+
+            try:
+                results = self.parse_pool.parse_chunk([self.pool_input(chunk_item) for chunk_item in chunk])
+            except Exception as e:
+                self._parse_failed(str(e), type(e).__name__, count=len(chunk))
+                continue
+
+            for chunk_item, (detail, error, _) in zip(chunk, results):
+                if error is not None:
+                    self._parse_failed(error, error.split(':', 1)[0])
+                    continue
+                try:
+                    record = self.parse_func(chunk_item, detail)
+                except Exception as e:
+                    self._parse_failed(str(e), type(e).__name__)
+                    continue
+                if not self._emit(record):
+                    return
+
+    def _parse_worker(self):
+        """파싱 단계 작업 스레드"""
+        while True:
+            item = self._get(self.parse_queue)
+            if item is _DONE:
+                break
+
+            try:
+                record = self.parse_func(item)
+            except Exception as e:
+                self._parse_failed(str(e), type(e).__name__)
+                continue
+
+            if not self._emit(record):
+                break
+
+    def _write_worker(self):
+        """저장 단계 작업 스레드"""
+        while True:
+            record = self._get(self.write_queue)
+            if record is _DONE:
+                break
+
+            try:
+                result = self.write_func(record)
+            except Exception as e:
+                self.logger.error(f"저장 단계 오류: {e}")
+                self._count('write_errors')
+                metrics.inc('errors', stage='write', type=type(e).__name__)
+                continue
+
+            self._count('written')
+            if result is not None:
+                self._results.append(result)
+
+    def _monitor(self):
+        """큐 깊이와 처리 건수를 주기적으로 기록"""
+        while not self._stop.wait(self.monitor_interval):
+            depths = self.queue_depths()
+            self.logger.info(
+                f"파이프라인 상태: 파싱 대기 {depths['parse']}, 저장 대기 {depths['write']} "
+                f"(수집 {self.stats['fetched']}, 파싱 {self.stats['parsed']}, 저장 {self.stats['written']})"
+            )
+
+    def _join_workers(self, threads: List[threading.Thread]):
+        """중단 요청 후 작업 스레드가 진행 중인 파싱/저장을 마치고 끝날 때까지 대기 (전체 대기 시간 제한)"""
+        deadline = time.monotonic() + self.shutdown_timeout
+        for thread in threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+
+        alive = [thread.name for thread in threads if thread.is_alive()]
+        if alive:
+            self.logger.warning(f"파이프라인 작업 스레드가 {self.shutdown_timeout}초 안에 끝나지 않았습니다: "
+                                f"{', '.join(alive)}")
+
+    def run(self, source: Iterable[Any]) -> List[Any]:
+        """
+        수집 항목 반복자를 끝까지 처리합니다.
+        수집 단계는 호출한 스레드에서 실행되므로 종료 신호(KeyboardInterrupt)를 그대로 받습니다.
+        수집 중 예외가 나도 파싱/저장 작업 스레드가 끝난 뒤에 반환하므로, 호출 측이 저장소를 닫은 뒤
+        저장 단계가 기록하는 일은 없습니다.
+
+        Args:
+            source: 수집 단계가 생성하는 항목 반복자
+
+        Returns:
+            저장 단계 결과 리스트 (도착 순서)
+        """
+        start = time.monotonic()
+        parse_target = self._pool_parse_worker if self.parse_pool is not None else self._parse_worker
+        parsers = [
+            threading.Thread(target=parse_target, name=f"pipeline-parse-{i}", daemon=True)
+            for i in range(1, self.parse_workers + 1)
+        ]
+        writer = threading.Thread(target=self._write_worker, name="pipeline-write", daemon=True)
+        for thread in parsers + [writer]:
+            thread.start()
+
+        monitor = None
+        if self.monitor_interval:
+            monitor = threading.Thread(target=self._monitor, name="pipeline-monitor", daemon=True)
+            monitor.start()
+
+        try:
+            # 수집 단계: 파싱 큐가 가득 차면 여기서 대기 (역압)
+            for item in source:
+                self._count('fetched')
+                if not self._put(self.parse_queue, item):
+                    break
+
+            # 정상 종료: 파싱 작업 스레드 수만큼 종료 신호를 보내고, 파싱이 끝나면 저장 단계 종료
+            for _ in parsers:
+                self._put(self.parse_queue, _DONE)
+            for thread in parsers:
+                thread.join()
+            self._put(self.write_queue, _DONE)
+            writer.join()
+        finally:
+            # 예외(종료 신호 포함)로 빠져나온 경우 작업 스레드를 중단하고, 진행 중인 항목을 마칠 때까지 대기
+            self._stop.set()
+            self._join_workers(parsers + [writer])
+            if monitor is not None:
+                monitor.join()
+
+        elapsed = time.monotonic() - start
+        self.logger.info(
+            f"파이프라인 완료 ({elapsed:.2f}초): 수집 {self.stats['fetched']}, 파싱 {self.stats['parsed']}, "
+            f"저장 {self.stats['written']}, 오류 {self.stats['parse_errors'] + self.stats['write_errors']}"
+        )
+        return self._results
@@ -0,0 +1,365 @@
+"""
+호스트별 요청 속도 제한 모듈
+여러 작업 스레드와 asyncio 작업이 같은 호스트에 보내는 요청의 총량을 토큰 버킷으로 제한합니다.
+
+적응형 속도 조절(ADAPTIVE_PACING)을 켜면 페처/스크레이퍼가 알려 주는 응답 지연과 오류로
+호스트별 초당 요청 수를 AIMD 방식으로 조정합니다.
+- 응답 지연(지수 이동 평균)이 목표 이하이면 응답마다 조금씩 올림 (가산 증가)
+- 시간 초과, 연결 오류, 403/429/5xx 응답, 지연 급증 시 일정 비율로 낮춤 (승산 감소)
+- 조정 범위는 PACING_MIN_RATE ~ PACING_MAX_RATE로 고정
+
+여러 노드가 함께 수집할 때(cluster.py)는 공유 요청 예산(shared_budget)을 넘겨 받아
+이 프로세스의 토큰 버킷을 통과한 요청도 모든 노드 합계 예산의 요청 시각을 예약한 뒤 보냅니다.
+"""
+
+import time
+import random
+import asyncio
+import threading
+import logging
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+import config
+import metrics
+from supervisor import FAILURE_NETWORK, FAILURE_TIMEOUT, classify_failure
+
+
+# 서버 과부하/차단 신호로 보는 HTTP 상태 코드 (5xx는 모두 포함)
+CONGESTION_STATUSES = (403, 429)
+
+# 응답 지연 지수 이동 평균의 가중치 (최근 응답 비중)
+LATENCY_EWMA_WEIGHT = 0.3
+
+
+def is_congestion_signal(status: Optional[int] = None, error: Optional[BaseException] = None) -> bool:
+    """
+    응답 상태나 예외가 속도를 낮춰야 하는 신호인지 판단합니다.
+
+    Args:
+        status: HTTP 상태 코드
+        error: 요청 중 발생한 예외
+
+    Returns:
+        시간 초과, 연결 오류, 403/429/5xx 응답이면 True
+    """
+    if error is not None:
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            status = error.response.status_code
+        else:
+            return classify_failure(error) in (FAILURE_NETWORK, FAILURE_TIMEOUT)
+    return status is not None and (status in CONGESTION_STATUSES or status >= 500)
+
+
+class TokenBucket:
+    """예약 방식의 스레드 안전 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: int, jitter_range: Tuple[float, float] = (0.0, 0.0),
+                 clock: Callable[[], float] = None):
+        """
+        토큰 버킷 초기화
+
+        Args:
+            rate: 초당 충전되는 토큰 수 (평균 초당 요청 수)
+            burst: 버킷 용량 (연속으로 보낼 수 있는 최대 요청 수)
+            jitter_range: 토큰 대기 시간에 더할 랜덤 지연 범위 (초)
+            clock: 단조 시각 함수 (None이면 time.monotonic)
+        """
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        if burst < 1:
+            raise ValueError("burst는 1 이상이어야 합니다.")
+
+        self.rate = rate
+        self.burst = burst
+        self.jitter_range = jitter_range
+        self.clock = clock or time.monotonic
+        self._tokens = float(burst)
+        self._updated = self.clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        토큰 하나를 예약하고 요청을 보내기 전까지 기다려야 할 시간을 계산합니다.
+        토큰이 부족하면 음수로 빌려 쓰므로, 호출 순서대로 대기 시간이 늘어납니다.
+
+        Returns:
+            대기해야 할 시간 (초, 지터 포함)
+        """
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        low, high = self.jitter_range
+        if high > 0:
+            wait += random.uniform(low, high)
+        return wait
+
+    def set_rate(self, rate: float, jitter_range: Tuple[float, float] = None):
+        """
+        충전 속도를 바꿉니다. (지금까지 쌓인 토큰은 이전 속도로 계산)
+
+        Args:
+            rate: 새 초당 충전 토큰 수
+            jitter_range: 새 랜덤 지연 범위 (None이면 유지)
+        """
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self.rate = rate
+            if jitter_range is not None:
+                self.jitter_range = jitter_range
+
+    def acquire(self) -> float:
+        """
+        토큰을 얻을 때까지 현재 스레드를 대기시킵니다.
+
+        Returns:
+            실제로 대기한 시간 (초)
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """
+        토큰을 얻을 때까지 현재 asyncio 작업만 대기시킵니다. (이벤트 루프는 막지 않음)
+
+        Returns:
+            실제로 대기한 시간 (초)
+        """
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class AimdController:
+    """응답 지연과 오류로 토큰 버킷 하나의 초당 요청 수를 조정하는 AIMD 제어기"""
+
+    def __init__(self, bucket: TokenBucket, host: str, min_rate: float = None, max_rate: float = None,
+                 target_latency: float = None, spike_factor: float = None, increase_step: float = None,
+                 decrease_factor: float = None, cooldown: float = None):
+        """
+        제어기 초기화 (버킷의 현재 속도를 범위 안으로 맞춘 뒤 시작)
+
+        Args:
+            bucket: 조정할 토큰 버킷
+            host: 호스트 이름 (로그용)
+            min_rate: 초당 요청 수 하한
+            max_rate: 초당 요청 수 상한
+            target_latency: 속도를 올릴 수 있는 응답 지연 평균 상한 (초)
+            spike_factor: 응답 하나의 지연이 목표의 몇 배를 넘으면 지연 급증으로 볼지
+            increase_step: 목표 이하 응답마다 올릴 초당 요청 수
+            decrease_factor: 혼잡 신호 시 곱할 비율 (0~1)
+            cooldown: 속도를 낮춘 뒤 추가 감소/증가를 보류할 시간 (초, 이미 보낸 요청의 응답 반영 방지)
+        """
+        self.bucket = bucket
+        self.host = host
+        self.min_rate = min_rate if min_rate is not None else config.PACING_MIN_RATE
+        self.max_rate = max_rate if max_rate is not None else config.PACING_MAX_RATE
+        self.target_latency = target_latency if target_latency is not None else config.PACING_TARGET_LATENCY
+        self.spike_factor = spike_factor if spike_factor is not None else config.PACING_SPIKE_FACTOR
+        self.increase_step = increase_step if increase_step is not None else config.PACING_INCREASE_STEP
+        self.decrease_factor = decrease_factor if decrease_factor is not None else config.PACING_DECREASE_FACTOR
+        self.cooldown = cooldown if cooldown is not None else config.PACING_DECREASE_COOLDOWN
+        if self.min_rate <= 0 or self.min_rate > self.max_rate:
+            raise ValueError("PACING_MIN_RATE는 0보다 크고 PACING_MAX_RATE 이하여야 합니다.")
+
+        # 랜덤 지연은 시작 속도 기준으로 두고, 속도가 오르면 같은 비율로 줄임 (설정 범위보다 길어지지 않음)
+        self.initial_rate = self._clamp(bucket.rate)
+        self.base_jitter_range = bucket.jitter_range
+        self.latency_avg: Optional[float] = None
+        self._hold_until = 0.0
+        self._last_log = bucket.clock()
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+        self._apply(self.initial_rate)
+
+    def _clamp(self, rate: float) -> float:
+        """하한/상한 범위로 제한"""
+        return max(self.min_rate, min(self.max_rate, rate))
+
+    def _apply(self, rate: float):
+        """버킷에 새 속도와 그에 맞춘 랜덤 지연 범위를 반영"""
+        scale = min(1.0, self.initial_rate / rate)
+        low, high = self.base_jitter_range
+        self.bucket.set_rate(rate, (low * scale, high * scale))
+
+    def record(self, latency: Optional[float], congested: bool = False) -> float:
+        """
+        응답 하나의 결과를 반영합니다.
+
+        Args:
+            latency: 응답 지연 (초, 응답을 받지 못했으면 None)
+            congested: 시간 초과/연결 오류/403/429/5xx 응답 여부
+
+        Returns:
+            조정 후 초당 요청 수
+        """
+        with self._lock:
+            now = self.bucket.clock()
+            rate = self.bucket.rate
+
+            if latency is not None:
+                if self.latency_avg is None:
+                    self.latency_avg = latency
+                else:
+                    self.latency_avg += LATENCY_EWMA_WEIGHT * (latency - self.latency_avg)
+                if latency > self.target_latency * self.spike_factor:
+                    congested = True
+
+            if now < self._hold_until:
+                return rate
+
+            if congested:
+                new_rate = self._clamp(rate * self.decrease_factor)
+                self._hold_until = now + self.cooldown
+                if new_rate < rate:
+                    self._apply(new_rate)
+                    metrics.inc('pacing_adjustments', direction='down')
+                    self.logger.warning(
+                        f"요청 속도 감소: {self.host} {rate:.2f} → {new_rate:.2f}건/초 "
+                        f"(응답 지연 평균 {self._latency_ms()})"
+                    )
+                return new_rate
+
+            if self.latency_avg is not None and self.latency_avg <= self.target_latency and rate < self.max_rate:
+                new_rate = self._clamp(rate + self.increase_step)
+                self._apply(new_rate)
+                metrics.inc('pacing_adjustments', direction='up')
+                if now - self._last_log >= config.PACING_LOG_INTERVAL:
+                    self._last_log = now
+                    self.logger.info(f"요청 속도: {self.host} {new_rate:.2f}건/초 (응답 지연 평균 {self._latency_ms()})")
+                return new_rate
+
+            return rate
+
+    def _latency_ms(self) -> str:
+        """로그용 응답 지연 평균 문자열"""
+        return f"{self.latency_avg * 1000:.0f}ms" if self.latency_avg is not None else "없음"
+
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷을 스레드와 asyncio 작업 간에 공유하는 요청 예산"""
+
+    def __init__(self, requests_per_second: float = None, burst: int = None,
+                 jitter_range: Tuple[float, float] = None, adaptive: bool = None,
+                 shared_budget: Optional[Any] = None, clock: Callable[[], float] = None):
+        """
+        요청 예산 초기화
+
+        Args:
+            requests_per_second: 호스트당 허용하는 초당 요청 수 (모든 작업자 합계, 적응형이면 시작 값)
+            burst: 호스트당 연속으로 보낼 수 있는 최대 요청 수
+            jitter_range: 요청마다 더할 랜덤 지연 범위 (None이면 config 설정 사용)
+            adaptive: 응답 지연/오류로 초당 요청 수를 조정할지 여부 (None이면 config.ADAPTIVE_PACING)
+            shared_budget: 여러 노드가 함께 지키는 요청 예산 (호스트 -> 대기 시간을 반환하는 reserve 메서드,
+                           None이면 이 프로세스 안에서만 제한)
+            clock: 호스트별 토큰 버킷과 제어기가 쓸 단조 시각 함수 (None이면 time.monotonic)
+        """
+        if requests_per_second is None:
+            requests_per_second = config.HOST_REQUESTS_PER_SECOND
+        if burst is None:
+            burst = config.HOST_BURST_SIZE
+        if jitter_range is None:
+            jitter_range = config.REQUEST_DELAY_RANGE if config.USE_RANDOM_DELAY else (0.0, 0.0)
+
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.jitter_range = jitter_range
+        self.adaptive = adaptive if adaptive is not None else config.ADAPTIVE_PACING
+        self.shared_budget = shared_budget
+        self.clock = clock or time.monotonic
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._controllers: Dict[str, AimdController] = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        """
+        URL의 호스트에 해당하는 토큰 버킷을 반환합니다.
+
+        Args:
+            url: 요청할 URL
+
+        Returns:
+            호스트의 TokenBucket
+        """
+        host = urlsplit(url).netloc.lower()
+
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.requests_per_second, self.burst, self.jitter_range, clock=self.clock)
+                self._buckets[host] = bucket
+                if self.adaptive:
+                    self._controllers[host] = AimdController(bucket, host)
+            return bucket
+
+    def record_response(self, url: str, latency: Optional[float], status: Optional[int] = None,
+                        error: Optional[BaseException] = None):
+        """
+        요청 결과를 적응형 속도 조절에 반영합니다. (적응형이 아니면 무시)
+
+        Args:
+            url: 요청한 URL
+            latency: 응답 지연 (초, 응답을 받지 못했으면 None)
+            status: HTTP 상태 코드
+            error: 요청 중 발생한 예외
+        """
+        if not self.adaptive:
+            return
+        self.bucket_for(url)
+        controller = self._controllers[urlsplit(url).netloc.lower()]
+        controller.record(latency, is_congestion_signal(status, error))
+
+    def current_rate(self, url: str) -> float:
+        """해당 URL 호스트의 현재 초당 요청 수"""
+        return self.bucket_for(url).rate
+
+    def acquire(self, url: str) -> float:
+        """
+        해당 URL의 호스트에 요청을 보낼 수 있을 때까지 현재 스레드를 대기시킵니다.
+
+        Args:
+            url: 요청할 URL
+
+        Returns:
+            실제로 대기한 시간 (초)
+        """
+        waited = self.bucket_for(url).acquire()
+        if self.shared_budget is not None:
+            delay = self.shared_budget.reserve(urlsplit(url).netloc.lower())
+            if delay > 0:
+                time.sleep(delay)
+                waited += delay
+        return waited
+
+    async def acquire_async(self, url: str) -> float:
+        """
+        해당 URL의 호스트에 요청을 보낼 수 있을 때까지 현재 asyncio 작업을 대기시킵니다.
+
+        Args:
+            url: 요청할 URL
+
+        Returns:
+            실제로 대기한 시간 (초)
+        """
+        waited = await self.bucket_for(url).acquire_async()
+        if self.shared_budget is not None:
+            # 공유 예산 예약은 파일 잠금을 기다릴 수 있으므로 이벤트 루프 밖에서 실행
+            loop = asyncio.get_running_loop()
+            delay = await loop.run_in_executor(None, self.shared_budget.reserve, urlsplit(url).netloc.lower())
+            if delay > 0:
+                await asyncio.sleep(delay)
+                waited += delay
+        return waited
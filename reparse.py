@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+캐시된 상세 페이지 재파싱 스크립트
+파서를 고친 뒤 사이트에 다시 요청하지 않고 페이지 캐시의 상세 페이지를 모든 코어에서 다시 파싱하여
+마크다운 파일과 월별/연도별/전체 인덱스를 다시 만듭니다. (내용이 같은 파일은 다시 쓰지 않음)
+
+캐시의 gzip 본문을 그대로 작업 프로세스에 보내므로 이 프로세스는 파일 읽기와 저장만 담당합니다.
+
+사용법:
+    python reparse.py                            # 캐시의 모든 상세 페이지, CPU 코어 수만큼 프로세스
+    python reparse.py --processes 8 --chunk-size 32
+    python reparse.py --dry-run                  # 파싱만 하고 처리량 출력 (파일을 쓰지 않음)
+    python reparse.py --dry-run --processes 1    # 단일 프로세스 처리량 (속도 향상 비교용)
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import config
+from logging_setup import setup_logging
+from page_cache import PageCache, DECIDE_BASE_NO_PATTERN
+from parse_pool import ParsePool
+from period_index import period_url
+from parser import extract_decide_no
+from archive_index import write_archive_indexes
+from corpus_store import CorpusStore
+from search_index import SearchIndex
+from manifest import ProgressManifest, STATE_DISCOVERED
+from markdown_writer import load_existing_decisions
+from main import build_decision_record, write_decision_record, write_month_index
+
+
+logger = logging.getLogger(__name__)
+
+# 상세 페이지 URL 표시 (목록 페이지는 재파싱하지 않음)
+DETAIL_URL_MARKER = 'sub2_1_1.asp'
+
+
+def iter_cached_details(cache: PageCache) -> Iterator[Dict]:
+    """
+    캐시의 상세 페이지를 압축된 본문과 함께 반환합니다.
+
+    Args:
+        cache: 페이지 캐시
+
+    Yields:
+        'url', 'decision_no', 'year', 'month', 'decide_base_no', 'body' 키를 가진 딕셔너리
+        (연월은 URL의 심의일 기준, 결정번호나 심의일이 없는 URL은 건너뜀)
+    """
+    for url, body in cache.iter_raw(DETAIL_URL_MARKER):
+        decision_no = extract_decide_no(url)
+        match = DECIDE_BASE_NO_PATTERN.search(url)
+        if not decision_no or match is None:
+            continue
+        date = match.group(1)
+        yield {
+            'url': url,
+            'decision_no': decision_no,
+            'year': int(date[:4]),
+            'month': int(date[4:6]),
+            'decide_base_no': f"Y{date}",
+            'body': body,
+        }
+
+
+def link_info_for(page: Dict, manifest: Optional[ProgressManifest]) -> Dict:
+    """
+    재파싱할 페이지의 심의 링크 정보를 만듭니다.
+    매니페스트에 기록이 있으면 원래 URL/목록 제목/목록 순서를 사용하고, 없으면 새로 기록합니다.
+
+    Args:
+        page: iter_cached_details 항목
+        manifest: 진행 상황 매니페스트
+
+    Returns:
+        'url', 'title', 'decision_no' (기록이 있으면 'list_order') 키를 가진 심의 링크 정보
+    """
+    recorded = manifest.decision_link(page['decision_no']) if manifest is not None else None
+    if recorded is not None:
+        link_info = {
+            'url': recorded['url'],
+            'title': recorded['title'] or '',
+            'decision_no': page['decision_no'],
+            'list_order': recorded['discovered_order'],
+        }
+        return link_info
+
+    # 캐시 키는 정규화된 URL이므로 쿼리 순서가 원래 URL과 다를 수 있음
+    link_info = {'url': page['url'], 'title': '', 'decision_no': page['decision_no']}
+    list_url = period_url(page['year'], page['decide_base_no'])
+    if manifest is not None:
+        if manifest.period_state(list_url) is None:
+            manifest.mark_period(list_url, page['year'], page['month'], STATE_DISCOVERED)
+        manifest.record_discovered(list_url, [link_info])
+    return link_info
+
+
+def reparse(cache: PageCache, pool: ParsePool, output_dir: str, manifest: Optional[ProgressManifest] = None,
+            corpus: Optional[CorpusStore] = None, dry_run: bool = False) -> Dict[str, float]:
+    """
+    캐시된 상세 페이지를 다시 파싱하여 저장합니다.
+
+    Args:
+        cache: 페이지 캐시
+        pool: 파싱 프로세스 풀
+        output_dir: 출력 디렉토리 (output/YYYY/MM 구조)
+        manifest: 진행 상황 매니페스트 (저장 완료 기록, 연도별/전체 인덱스 집계)
+        corpus: 코퍼스 저장소 (None이면 마크다운 파일만 저장)
+        dry_run: True이면 파싱만 하고 저장하지 않음
+
+    Returns:
+        {'pages': 파싱한 페이지 수, 'errors': 오류 수, 'seconds': 소요 시간}
+    """
+    start = time.perf_counter()
+    pages = errors = 0
+    months: Dict[Tuple[int, int], List[Dict]] = {}
+
+    for page, (detail_data, error, _) in pool.map(iter_cached_details(cache), lambda page: page['body']):
+        if error is not None:
+            logger.error(f"파싱 오류: {page['url']} ({error})")
+            errors += 1
+            continue
+        pages += 1
+        if dry_run:
+            continue
+
+        try:
+            link_info = link_info_for(page, manifest)
+            decision = build_decision_record(link_info, None, manifest, detail_data)
+
+            year, month = page['year'], page['month']
+            month_dir = os.path.join(output_dir, f"{year}", f"{month:02d}")
+            months.setdefault((year, month), []).append(
+                write_decision_record(decision, year, month, month_dir, manifest, corpus)
+            )
+        except Exception as e:
+            logger.error(f"저장 오류: {page['url']} ({e})")
+            errors += 1
+
+    # 월별 인덱스: 저장된 심의를 모두 다시 저장했으면 목록 순서, 캐시에 없던 심의가 남아 있으면 합쳐서 결정번호 순
+    for (year, month), saved in sorted(months.items()):
+        month_dir = os.path.join(output_dir, f"{year}", f"{month:02d}")
+        if manifest is not None:
+            stored = {entry['decision_no']: entry for entry in manifest.month_written_decisions(year, month)}
+        else:
+            stored = load_existing_decisions(month_dir)
+        for entry in saved:
+            stored.pop(entry['manifest_key'], None)
+        write_month_index(saved, year, month, month_dir, stored)
+
+    if manifest is not None and months and config.WRITE_ARCHIVE_INDEXES:
+        manifest.flush()
+        write_archive_indexes(manifest.index_entries(), output_dir, years={year for year, _ in months})
+
+    return {'pages': pages, 'errors': errors, 'seconds': time.perf_counter() - start}
+
+
+def main(argv: Optional[List[str]] = None):
+    """재파싱 실행"""
+    arg_parser = argparse.ArgumentParser(description="캐시된 상세 페이지 재파싱")
+    arg_parser.add_argument('--cache-dir', default=config.CACHE_DIR,
+                            help=f"페이지 캐시 디렉토리 (기본값: {config.CACHE_DIR})")
+    arg_parser.add_argument('--output-dir', default=config.OUTPUT_DIR,
+                            help=f"출력 디렉토리 (기본값: {config.OUTPUT_DIR})")
+    arg_parser.add_argument('--processes', type=int, default=0,
+                            help="파싱 프로세스 수 (기본값: 0, CPU 코어 수)")
+    arg_parser.add_argument('--chunk-size', type=int, default=config.PARSE_CHUNK_SIZE,
+                            help=f"한 번에 보낼 최대 페이지 수 (기본값: {config.PARSE_CHUNK_SIZE})")
+    arg_parser.add_argument('--dry-run', action='store_true', help="파싱만 하고 파일을 쓰지 않음")
+    args = arg_parser.parse_args(argv)
+
+    setup_logging()
+
+    if not os.path.isdir(args.cache_dir):
+        print(f"캐시 디렉토리가 없습니다: {args.cache_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    cache = PageCache(cache_dir=args.cache_dir)
+    manifest = None
+    corpus = None
+    search_index = None
+    if not args.dry_run:
+        if config.USE_MANIFEST:
+            manifest = ProgressManifest(os.path.join(args.output_dir, os.path.basename(config.MANIFEST_PATH)))
+        if config.USE_CORPUS_STORE:
+            corpus = CorpusStore(os.path.join(args.output_dir, os.path.basename(config.CORPUS_DB_PATH)))
+            search_index = SearchIndex(corpus.path) if config.USE_SEARCH_INDEX else None
+
+    try:
+        with ParsePool(processes=args.processes, chunk_size=args.chunk_size) as pool:
+            result = reparse(cache, pool, args.output_dir, manifest, corpus, dry_run=args.dry_run)
+        if corpus is not None:
+            corpus.flush()
+        if search_index is not None:
+            search_index.update()
+    finally:
+        cache.close()
+        if manifest is not None:
+            manifest.close()
+        if search_index is not None:
+            search_index.close()
+        if corpus is not None:
+            corpus.close()
+
+    rate = result['pages'] / result['seconds'] if result['seconds'] > 0 else 0.0
+    print(f"재파싱 완료: {result['pages']}페이지, {result['seconds']:.2f}초 "
+          f"({rate:,.1f} 페이지/초, 프로세스 {pool.processes}개, 묶음 {pool.chunk_size}), 오류 {result['errors']}건")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,7 @@ JavaScript 동적 로딩을 처리하고 EUC-KR 인코딩 문제를 해결합니
 
 import time
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -20,24 +20,41 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 
 import config
+import metrics
+from parser import parse_decision_list, is_valid_list_page
+from page_cache import PageCache
+from browser_daemon import daemon_available
+from rate_limiter import HostRateLimiter
+from supervisor import IncompletePage
 
 
 class IkpecScraper:
     """신문윤리위원회 웹사이트 스크레이퍼"""
 
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, cache: Optional[PageCache] = None, lean: bool = None,
+                 rate_limiter: Optional[HostRateLimiter] = None):
         """
         스크레이퍼 초기화
 
         Args:
             headless: True일 경우 브라우저를 백그라운드에서 실행
+            cache: 페이지 응답 캐시 (None이면 캐시 사용 안 함)
+            lean: 경량 브라우저 모드 (None이면 config.LEAN_BROWSER)
+            rate_limiter: 페이지 이동 지연/오류를 알려 줄 요청 예산 (적응형 속도 조절용, None이면 알리지 않음)
         """
         self.headless = headless
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.lean = lean if lean is not None else config.LEAN_BROWSER
         self.driver = None
+        self._attached = False
         self.logger = logging.getLogger(__name__)
 
     def setup_driver(self):
-        """Selenium WebDriver 설정"""
+        """Selenium WebDriver 설정 (상시 실행 브라우저가 있으면 연결, 없으면 새 브라우저 실행)"""
+        if daemon_available() and self._attach_driver():
+            return
+
         chrome_options = Options()
 
         if self.headless:
@@ -50,52 +67,228 @@ class IkpecScraper:
         chrome_options.add_argument('--window-size=1920,1080')
 
         # User-Agent 설정 (봇 차단 방지)
-        chrome_options.add_argument(
-            'user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-            'AppleWebKit/537.36 (KHTML, like Gecko) '
-            'Chrome/120.0.0.0 Safari/537.36'
-        )
+        chrome_options.add_argument(f'user-agent={config.USER_AGENT}')
 
         # 인코딩 관련 설정
         chrome_options.add_argument('--lang=ko-KR')
-        chrome_options.add_experimental_option('prefs', {
+        prefs = {
             'intl.accept_languages': 'ko-KR,ko,en-US,en'
-        })
+        }
+
+        # 경량 모드: 이미지 로딩 끄기, DOM 구성이 끝나면 바로 반환 (준비 조건은 wait_until_ready에서 확인)
+        if self.lean:
+            prefs['profile.managed_default_content_settings.images'] = 2
+            chrome_options.page_load_strategy = 'eager'
+
+        chrome_options.add_experimental_option('prefs', prefs)
 
         # ChromeDriver 자동 설치 및 설정
-        service = Service("/usr/local/bin/chromedriver")
+        service = Service(config.CHROMEDRIVER_PATH)
         self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.driver.implicitly_wait(config.SELENIUM_TIMEOUT)
+        # 암묵적 대기는 사용하지 않음 (명시적 준비 조건 대기와 섞이면 대기 시간이 예측 불가)
+
+        if self.lean:
+            self._block_static_assets()
+
+        self.logger.info(f"WebDriver 설정 완료 (경량 모드: {'사용' if self.lean else '사용 안 함'})")
+
+    def _attach_driver(self) -> bool:
+        """
+        상시 실행 브라우저(browser_daemon.py)에 원격 디버깅 주소로 연결하고 전용 탭을 엽니다.
+        (창 크기, 언어, 이미지 설정은 브라우저를 띄울 때 이미 적용되어 있음)
+
+        Returns:
+            연결 성공 여부 (실패하면 호출 측이 새 브라우저를 실행)
+        """
+        start = time.perf_counter()
+        chrome_options = Options()
+        chrome_options.debugger_address = config.BROWSER_DAEMON_ADDRESS
+        if self.lean:
+            chrome_options.page_load_strategy = 'eager'
+
+        try:
+            self.driver = webdriver.Chrome(service=Service(config.CHROMEDRIVER_PATH), options=chrome_options)
+            # 풀의 다른 작업 스레드와 같은 탭을 쓰지 않도록 이 세션 전용 탭을 사용
+            self.driver.switch_to.new_window('tab')
+        except Exception as e:
+            self.logger.warning(f"상시 실행 브라우저 연결 실패 (새 브라우저 실행): {e}")
+            if self.driver:
+                self.driver.service.stop()
+                self.driver = None
+            return False
+
+        self._attached = True
+        if self.lean:
+            self._block_static_assets()
 
-        self.logger.info("WebDriver 설정 완료")
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.logger.info(f"상시 실행 브라우저에 연결: {config.BROWSER_DAEMON_ADDRESS} ({elapsed_ms:.0f}ms)")
+        return True
+
+    def _block_static_assets(self):
+        """CDP 네트워크 차단으로 스타일시트/글꼴 등 정적 리소스 요청을 막음 (실패하면 차단 없이 진행)"""
+        patterns = list(config.LEAN_BLOCKED_URL_PATTERNS)
+        if not patterns:
+            return
+
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        except Exception as e:
+            self.logger.warning(f"정적 리소스 차단 설정 실패 (차단 없이 진행): {e}")
+            return
+
+        self.logger.debug(f"정적 리소스 차단: {len(patterns)}개 패턴")
 
     def close_driver(self):
-        """WebDriver 종료"""
-        if self.driver:
-            self.driver.quit()
-            self.logger.info("WebDriver 종료")
+        """WebDriver 종료 (상시 실행 브라우저에 연결한 경우 전용 탭만 닫고 브라우저는 유지)"""
+        if not self.driver:
+            return
+
+        if self._attached:
+            try:
+                self.driver.close()
+            except Exception as e:
+                self.logger.debug(f"전용 탭 닫기 실패: {e}")
+            # quit()은 연결한 브라우저의 창까지 정리하므로 드라이버 프로세스만 종료
+            self.driver.service.stop()
+            self.driver = None
+            self._attached = False
+            self.logger.info("상시 실행 브라우저 연결 해제")
+            return
+
+        self.driver.quit()
+        self.logger.info("WebDriver 종료")
+
+    def wait_until_ready(self, url: str, ready_selector: Optional[str] = None, timeout: float = None) -> bool:
+        """
+        현재 페이지가 준비될 때까지만 대기합니다.
+        document.readyState가 loading을 벗어나고, ready_selector 요소가 나타나면 즉시 반환합니다.
+
+        Args:
+            url: 대기 중인 URL (로깅용)
+            ready_selector: 준비 완료를 판단할 CSS 선택자 (None이면 readyState만 확인)
+            timeout: 최대 대기 시간 (초)
 
-    def get_page_source(self, url: str, wait_time: float = 2.0) -> str:
+        Returns:
+            제한 시간 내 준비 조건 충족 여부
         """
-        URL에 접근하여 페이지 소스를 가져옵니다.
+        if timeout is None:
+            timeout = config.SELENIUM_TIMEOUT
+
+        def is_ready(driver) -> bool:
+            if driver.execute_script("return document.readyState") == 'loading':
+                return False
+            if ready_selector:
+                return len(driver.find_elements(By.CSS_SELECTOR, ready_selector)) > 0
+            return True
+
+        start = time.monotonic()
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(is_ready)
+            ready = True
+        except TimeoutException:
+            ready = False
+
+        elapsed = time.monotonic() - start
+        log_extra = {'url': url, 'stage': 'wait', 'duration_ms': round(elapsed * 1000, 1)}
+        if ready:
+            self.logger.info(f"페이지 준비 완료 ({elapsed:.2f}초): {url}", extra=log_extra)
+        else:
+            self.logger.warning(f"페이지 준비 대기 시간 초과 ({elapsed:.2f}초, 조건: {ready_selector}): {url}",
+                                extra=log_extra)
+
+        return ready
+
+    def is_cached(self, url: str) -> bool:
+        """
+        URL이 캐시에 있어 요청 없이 처리되는지 확인합니다.
+
+        Args:
+            url: 확인할 URL
+
+        Returns:
+            캐시 적중 여부
+        """
+        return self.cache is not None and self.cache.contains(url)
+
+    def get_page_source(self, url: str, ready_selector: Optional[str] = None, timeout: float = None) -> str:
+        """
+        URL에 접근하여 준비 조건이 충족되면 페이지 소스를 가져옵니다.
+        캐시에 있으면 브라우저를 사용하지 않고 캐시된 소스를 반환합니다.
 
         Args:
             url: 접근할 URL
-            wait_time: 페이지 로딩 후 대기 시간 (JavaScript 실행 대기)
+            ready_selector: 준비 완료를 판단할 CSS 선택자
+            timeout: 최대 대기 시간 (초)
 
         Returns:
-            페이지의 HTML 소스
+            페이지의 HTML 소스 (대기 시간 초과 시에도 현재 소스를 반환)
         """
+        if self.cache is not None:
+            cached = self.cache.get(url)
+            if cached is not None:
+                self.logger.info(f"캐시 사용: {url}")
+                metrics.inc('pages', kind='detail', source='cache')
+                return cached
+
         self.logger.info(f"페이지 접근: {url}")
-        self.driver.get(url)
+        page_source, ready = self._load_page(url, ready_selector, timeout, kind='detail')
 
-        # JavaScript 렌더링 대기
-        time.sleep(wait_time)
+        # 준비 조건을 충족한 페이지만 캐시 (불완전한 페이지가 재사용되지 않도록)
+        if ready and self.cache is not None:
+            self.cache.put(url, page_source)
 
-        # 페이지 소스 반환
-        return self.driver.page_source
+        return page_source
 
-    def get_decision_links_from_url(self, url: str, year: int, month: int) -> List[Dict[str, str]]:
+    def _load_page(self, url: str, ready_selector: Optional[str], timeout: float = None,
+                   kind: str = 'detail') -> Tuple[str, bool]:
+        """
+        브라우저로 URL을 열고 준비 조건을 기다린 뒤 페이지 소스를 가져옵니다.
+        이동/대기/소스 전송 단계별 시간과 가져온 바이트 수를 지표로 기록합니다.
+
+        Args:
+            url: 접근할 URL
+            ready_selector: 준비 완료를 판단할 CSS 선택자
+            timeout: 최대 대기 시간 (초)
+            kind: 페이지 종류 (지표 레이블: list/detail)
+
+        Returns:
+            (페이지 소스, 준비 조건 충족 여부) 튜플
+        """
+        navigation = None
+        try:
+            start = time.perf_counter()
+            with metrics.timer('navigation', kind=kind):
+                self.driver.get(url)
+            navigation = time.perf_counter() - start
+
+            # 고정 대기 대신 준비 조건 대기
+            with metrics.timer('wait', kind=kind):
+                ready = self.wait_until_ready(url, ready_selector, timeout)
+
+            with metrics.timer('page_source', kind=kind):
+                page_source = self.driver.page_source
+        except Exception as e:
+            metrics.inc('errors', stage='browser', type=type(e).__name__)
+            if self.rate_limiter is not None:
+                self.rate_limiter.record_response(url, navigation, error=e)
+            raise
+
+        if not ready:
+            metrics.inc('errors', stage='wait', type='TimeoutException')
+
+        # 페이지 이동 시간을 요청 속도 조절에 반영 (준비 조건을 충족하지 못했으면 시간 초과로 반영)
+        if self.rate_limiter is not None:
+            self.rate_limiter.record_response(
+                url, navigation, error=None if ready else TimeoutException(f"준비 조건 대기 시간 초과: {url}")
+            )
+        metrics.inc('pages', kind=kind, source='browser')
+        metrics.inc('bytes_fetched', len(page_source.encode('utf-8')), source='browser')
+        return page_source, ready
+
+    def get_decision_links_from_url(self, url: str, year: int, month: int,
+                                    use_cache: bool = True) -> List[Dict[str, str]]:
         """
         지정된 URL에서 개별 심의 링크를 추출합니다.
 
@@ -103,44 +296,48 @@ class IkpecScraper:
             url: 월별 목록 페이지 URL
             year: 연도 (로깅용)
             month: 월 (로깅용)
+            use_cache: False이면 캐시를 읽지 않고 목록을 새로 가져옴 (결과는 캐시에 저장)
 
         Returns:
-            심의 링크 정보 리스트
+            심의 링크 정보 리스트 ('title', 'url', 'decision_no', 'decision_type' 키, 결정번호 기준 중복 제거,
+            빈 리스트는 목록 페이지를 받았고 심의가 없는 달)
+
+        Raises:
+            IncompletePage: 목록 항목도 목록 컨테이너도 없는 페이지를 받은 경우 (재시도 대상)
         """
         self.logger.info(f"{year}년 {month}월 심의 목록 추출 시작")
         self.logger.info(f"접근 URL: {url}")
-        
-        self.driver.get(url)
 
-        # 페이지 로딩 대기
-        time.sleep(3)
+        # 캐시된 목록 페이지는 브라우저 없이 파싱
+        if self.cache is not None and use_cache:
+            cached = self.cache.get(url)
+            if cached is not None:
+                metrics.inc('pages', kind='list', source='cache')
+                decisions = parse_decision_list(cached)
+                self.logger.info(f"캐시 사용: {len(decisions)}건의 심의 링크 발견")
+                return decisions
 
-        decisions = []
+        # 목록 항목이 나타날 때까지 대기한 뒤 페이지 소스를 한 번만 가져옴
+        page_source, ready = self._load_page(url, config.LIST_READY_SELECTOR, kind='list')
 
-        try:
-            # 모든 링크 중 sub2_1_1.asp를 포함한 링크 찾기
-            links = self.driver.find_elements(By.TAG_NAME, 'a')
-
-            for link in links:
-                href = link.get_attribute('href')
-                if href and 'sub2_1_1.asp' in href:
-                    text = link.text.strip()
-                    if text:  # 텍스트가 있는 경우만
-                        decisions.append({
-                            'title': text,
-                            'url': href,
-                        })
-
-            self.logger.info(f"{len(decisions)}건의 심의 링크 발견")
-            
-            # 발견된 링크의 샘플 출력 (처음 3개)
-            if decisions:
-                self.logger.info(f"발견된 링크 샘플 (처음 3개):")
-                for i, decision in enumerate(decisions[:3], 1):
-                    self.logger.info(f"  {i}. {decision['title'][:50]}...")
+        # 심의가 없는 달은 목록 항목이 나타나지 않으므로, 목록 컨테이너가 있으면 빈 목록으로 인정
+        if not ready and not is_valid_list_page(page_source):
+            raise IncompletePage(f"준비 대기 시간 안에 목록이 나타나지 않았습니다: {url}")
 
-        except Exception as e:
-            self.logger.error(f"링크 추출 중 오류: {e}")
+        if self.cache is not None:
+            self.cache.put(url, page_source)
+
+        # 링크마다 WebDriver를 호출하지 않고 한 번에 파싱
+        decisions = parse_decision_list(page_source)
+
+        self.logger.info(f"{len(decisions)}건의 심의 링크 발견")
+
+        # 발견된 링크의 샘플 출력 (처음 3개)
+        if decisions:
+            self.logger.info(f"발견된 링크 샘플 (처음 3개):")
+            for i, decision in enumerate(decisions[:3], 1):
+                self.logger.info(f"  {i}. [{decision['decision_no']}] {decision['title'][:50]} "
+                                 f"({decision['decision_type']})")
 
         return decisions
 
@@ -154,7 +351,7 @@ class IkpecScraper:
         Returns:
             페이지 HTML 소스
         """
-        return self.get_page_source(url, wait_time=2.0)
+        return self.get_page_source(url, ready_selector=config.DETAIL_READY_SELECTOR)
 
     def extract_text_from_current_page(self) -> str:
         """
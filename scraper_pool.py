@@ -0,0 +1,181 @@
+"""
+WebDriver 풀 모듈
+여러 개의 IkpecScraper를 작업 스레드에서 실행하여 상세 페이지를 병렬로 가져옵니다.
+
+각 작업 스레드는 IkpecScraper의 __enter__/__exit__ 수명 주기로 드라이버를 소유하고,
+공유 작업 큐에서 URL을 가져오며, 모든 요청은 하나의 HostRateLimiter 예산을 거칩니다.
+"""
+
+import queue
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import config
+from scraper import IkpecScraper
+from rate_limiter import HostRateLimiter
+from supervisor import FAILURE_SESSION, classify_failure, restart_scraper
+
+
+# 작업 스레드 종료 신호
+_STOP = object()
+
+
+def default_scraper_factory() -> IkpecScraper:
+    """config 설정으로 IkpecScraper를 생성합니다."""
+    return IkpecScraper(headless=config.HEADLESS_MODE)
+
+
+def default_fetch_func(scraper: IkpecScraper, url: str) -> str:
+    """작업 스레드의 스크레이퍼로 상세 페이지를 가져옵니다."""
+    return scraper.get_decision_detail(url)
+
+
+class ScraperPool:
+    """공유 요청 예산을 사용하는 WebDriver 작업 스레드 풀"""
+
+    def __init__(self, size: int = None, rate_limiter: Optional[HostRateLimiter] = None,
+                 scraper_factory: Callable = None, fetch_func: Callable = None):
+        """
+        풀 초기화
+
+        Args:
+            size: 작업 스레드(드라이버) 수
+            rate_limiter: 모든 작업 스레드가 공유하는 요청 예산
+            scraper_factory: 컨텍스트 매니저를 지원하는 스크레이퍼 생성 함수
+            fetch_func: (스크레이퍼, URL) -> HTML 을 반환하는 함수
+        """
+        self.size = size if size is not None else config.DRIVER_POOL_SIZE
+        self.rate_limiter = rate_limiter if rate_limiter is not None else HostRateLimiter()
+        self.scraper_factory = scraper_factory or default_scraper_factory
+        self.fetch_func = fetch_func or default_fetch_func
+
+        self._tasks: queue.Queue = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._alive = 0
+        self._alive_lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def start(self):
+        """작업 스레드 시작"""
+        self._alive = self.size
+        for worker_id in range(1, self.size + 1):
+            thread = threading.Thread(
+                target=self._worker, args=(worker_id,), name=f"scraper-pool-{worker_id}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+        self.logger.info(f"WebDriver 풀 시작: {self.size}개 작업 스레드")
+
+    def close(self):
+        """대기 중인 요청을 취소하고, 작업 스레드에 종료 신호를 보내 드라이버가 모두 닫힐 때까지 대기"""
+        while True:
+            try:
+                task = self._tasks.get_nowait()
+            except queue.Empty:
+                break
+            if task is not _STOP:
+                task[1].cancel()
+
+        for _ in self._threads:
+            self._tasks.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self.logger.info("WebDriver 풀 종료")
+
+    def submit(self, url: str) -> Future:
+        """
+        상세 페이지 요청을 작업 큐에 추가합니다.
+
+        Args:
+            url: 심의 페이지 URL
+
+        Returns:
+            HTML 소스 또는 예외가 설정될 Future
+        """
+        future = Future()
+        with self._alive_lock:
+            if self._alive == 0:
+                future.set_exception(RuntimeError("사용 가능한 WebDriver 작업 스레드가 없습니다."))
+                return future
+            self._tasks.put((url, future))
+        return future
+
+    def fetch_all(self, urls: List[str]) -> Iterator[Tuple[str, Optional[str], Optional[Exception]]]:
+        """
+        여러 URL을 병렬로 가져오고 입력 순서대로 결과를 반환합니다.
+
+        Args:
+            urls: 심의 페이지 URL 리스트
+
+        Yields:
+            (URL, HTML 소스, 예외) 튜플 - 성공 시 예외는 None, 실패 시 HTML은 None
+        """
+        futures = [(url, self.submit(url)) for url in urls]
+
+        try:
+            for url, future in futures:
+                try:
+                    yield url, future.result(), None
+                except Exception as e:
+                    yield url, None, e
+        finally:
+            # 소비 측이 중간에 멈춘 경우 아직 시작하지 않은 요청은 취소
+            for _, future in futures:
+                future.cancel()
+
+    def _worker(self, worker_id: int):
+        """작업 스레드 본체: 드라이버 하나를 소유하고 큐가 닫힐 때까지 요청을 처리"""
+        try:
+            with self.scraper_factory() as scraper:
+                while True:
+                    task = self._tasks.get()
+                    if task is _STOP:
+                        break
+
+                    url, future = task
+                    if not future.set_running_or_notify_cancel():
+                        continue
+
+                    try:
+                        # 캐시에 있는 페이지는 요청하지 않으므로 토큰을 쓰지 않음
+                        if not scraper.is_cached(url):
+                            self.rate_limiter.acquire(url)
+                        future.set_result(self.fetch_func(scraper, url))
+                    except Exception as e:
+                        future.set_exception(e)
+                        # 세션이 끊기면 이후 요청이 모두 실패하므로 이 작업 스레드의 드라이버를 다시 시작
+                        if classify_failure(e) == FAILURE_SESSION:
+                            self.logger.warning(f"작업 스레드 {worker_id}: WebDriver 세션 종료, 드라이버 재시작")
+                            restart_scraper(scraper)
+        except Exception as e:
+            self.logger.error(f"작업 스레드 {worker_id} 오류: {e}")
+        finally:
+            self._on_worker_exit()
+
+    def _on_worker_exit(self):
+        """마지막 작업 스레드가 종료되면 남은 요청을 모두 실패 처리"""
+        with self._alive_lock:
+            self._alive -= 1
+            if self._alive > 0:
+                return
+
+            while True:
+                try:
+                    task = self._tasks.get_nowait()
+                except queue.Empty:
+                    break
+                if task is not _STOP:
+                    task[1].set_exception(RuntimeError("사용 가능한 WebDriver 작업 스레드가 없습니다."))
+
+    def __enter__(self):
+        """컨텍스트 매니저 진입"""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """컨텍스트 매니저 종료"""
+        self.close()
@@ -0,0 +1,336 @@
+"""
+심의 결정 전문 검색 모듈
+코퍼스 저장소(corpus.db)의 제목, 주문, 이유, 적용 조항을 SQLite FTS5로 색인하고 검색합니다.
+
+한국어는 띄어쓰기 단위로 나누면 조사/어미 때문에 검색되지 않으므로(예: '명예훼손을'),
+글자 2개씩 겹쳐 자른 바이그램(명예 예훼 훼손 손을)으로 색인하고,
+검색어도 같은 방식으로 잘라 연속된 구문으로 찾습니다. (부분 문자열 검색과 같은 효과)
+
+제목/주문/적용 조항과 분량이 큰 이유는 색인을 나누어, 앞의 필드에서 찾은 심의를 관련도 순으로 먼저 보여주고
+이유에만 검색어가 있는 심의는 그 뒤를 채웁니다. (흔한 검색어도 긴 본문 전체의 순위를 매기지 않아 빠름)
+
+색인은 코퍼스 저장소의 내용 해시를 기준으로 새로 추가되거나 바뀐 심의만 갱신합니다.
+
+사용법:
+    python search_index.py 명예훼손
+    python search_index.py "사생활 침해" --type 경고 --limit 5
+    python search_index.py 제3조 --newspaper OO일보 --year 2023
+"""
+
+import os
+import re
+import sys
+import time
+import sqlite3
+import logging
+import argparse
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import config
+
+
+# 색인 테이블별 대상 필드와 BM25 가중치 (제목 > 주문 > 적용 조항, 이유는 별도 테이블)
+PRIMARY_FIELDS = ('title', 'decision_text', 'applied_rules')
+PRIMARY_WEIGHTS = (10.0, 4.0, 2.0)
+BODY_FIELDS = ('reason',)
+INDEX_TABLES = (('search_fts', PRIMARY_FIELDS, PRIMARY_WEIGHTS), ('search_body_fts', BODY_FIELDS, (1.0,)))
+
+# 발췌문을 찾을 필드 순서
+SNIPPET_FIELDS = PRIMARY_FIELDS + BODY_FIELDS
+
+# 글자/숫자 연속 구간 (밑줄은 FTS5 토크나이저가 구분자로 취급하므로 제외)
+WORD_RUN_PATTERN = re.compile(r'[^\W_]+')
+
+SNIPPET_WIDTH = 40
+
+
+def ngram_tokens(text: str, n: int = 2) -> List[str]:
+    """
+    텍스트를 n-gram 토큰으로 나눕니다.
+    글자/숫자 연속 구간마다 n글자씩 겹쳐 자르고, n보다 짧은 구간은 그대로 사용합니다.
+
+    Args:
+        text: 원문
+        n: 토큰 글자 수
+
+    Returns:
+        토큰 리스트 (예: '명예훼손' -> ['명예', '예훼', '훼손'])
+    """
+    tokens = []
+    for run in WORD_RUN_PATTERN.findall(text.lower()):
+        if len(run) <= n:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + n] for i in range(len(run) - n + 1))
+    return tokens
+
+
+def build_match_query(query: str) -> Optional[str]:
+    """
+    검색어를 FTS5 MATCH 식으로 변환합니다.
+    띄어쓰기로 나뉜 단어마다 바이그램 구문을 만들고 모두 포함하는 문서를 찾습니다.
+
+    Args:
+        query: 검색어
+
+    Returns:
+        MATCH 식 (검색할 글자가 없으면 None)
+    """
+    phrases = []
+    for run in WORD_RUN_PATTERN.findall(query.lower()):
+        if len(run) == 1:
+            # 한 글자는 그 글자로 시작하는 토큰을 접두사로 검색
+            phrases.append(f'"{run}"*')
+        else:
+            phrases.append('"' + ' '.join(ngram_tokens(run)) + '"')
+    return ' AND '.join(phrases) if phrases else None
+
+
+def make_snippet(text: str, query: str, width: int = SNIPPET_WIDTH) -> str:
+    """
+    원문에서 검색어가 처음 나타나는 부분 주변을 잘라 반환합니다.
+
+    Args:
+        text: 원문
+        query: 검색어
+        width: 검색어 앞뒤로 포함할 글자 수
+
+    Returns:
+        검색어를 **로 강조한 한 줄 발췌문 (검색어가 없으면 빈 문자열)
+    """
+    flat = ' '.join(text.split())
+    lowered = flat.lower()
+    for run in WORD_RUN_PATTERN.findall(query.lower()):
+        start = lowered.find(run)
+        if start < 0:
+            continue
+        end = start + len(run)
+        prefix = '…' if start > width else ''
+        suffix = '…' if end + width < len(flat) else ''
+        return (f"{prefix}{flat[max(0, start - width):start]}**{flat[start:end]}**"
+                f"{flat[end:end + width]}{suffix}")
+    return ''
+
+
+class SearchIndex:
+    """코퍼스 저장소의 심의를 바이그램으로 색인하는 FTS5 검색 색인"""
+
+    def __init__(self, path: str = None):
+        """
+        검색 색인 초기화 (코퍼스 저장소와 같은 SQLite 파일에 색인 테이블을 만듦)
+
+        Args:
+            path: 코퍼스 저장소 SQLite 파일 경로
+        """
+        self.path = path or config.CORPUS_DB_PATH
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.RLock()
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        for table, fields, _ in INDEX_TABLES:
+            self._conn.execute(
+                f'CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5('
+                f'{", ".join(fields)}, tokenize="unicode61 remove_diacritics 0")'
+            )
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS search_docs (
+                rowid INTEGER PRIMARY KEY,
+                decision_no TEXT NOT NULL UNIQUE,
+                content_hash TEXT NOT NULL
+            );
+        ''')
+        self._conn.commit()
+
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def update(self, rebuild: bool = False) -> int:
+        """
+        코퍼스 저장소에서 새로 추가되거나 내용이 바뀐 심의를 색인에 반영합니다.
+
+        Args:
+            rebuild: True이면 색인을 비우고 전체를 다시 색인
+
+        Returns:
+            색인한 심의 수
+        """
+        start = time.perf_counter()
+        fields = ', '.join(f'd.{field}' for field in SNIPPET_FIELDS)
+
+        with self._lock:
+            if rebuild:
+                for table, _, _ in INDEX_TABLES:
+                    self._conn.execute(f'DELETE FROM {table}')
+                self._conn.execute('DELETE FROM search_docs')
+
+            rows = self._conn.execute(
+                f'SELECT d.decision_no, d.content_hash, s.rowid AS doc_id, {fields} FROM decisions d '
+                f'LEFT JOIN search_docs s ON s.decision_no = d.decision_no '
+                f'WHERE s.content_hash IS NULL OR s.content_hash != d.content_hash'
+            ).fetchall()
+
+            for row in rows:
+                doc_id = row['doc_id']
+                if doc_id is None:
+                    doc_id = self._conn.execute(
+                        'INSERT INTO search_docs (decision_no, content_hash) VALUES (?, ?)',
+                        (row['decision_no'], row['content_hash'])
+                    ).lastrowid
+                else:
+                    for table, _, _ in INDEX_TABLES:
+                        self._conn.execute(f'DELETE FROM {table} WHERE rowid = ?', (doc_id,))
+                    self._conn.execute('UPDATE search_docs SET content_hash = ? WHERE rowid = ?',
+                                       (row['content_hash'], doc_id))
+
+                for table, table_fields, _ in INDEX_TABLES:
+                    tokens = [' '.join(ngram_tokens(row[field] or '')) for field in table_fields]
+                    self._conn.execute(
+                        f'INSERT INTO {table} (rowid, {", ".join(table_fields)}) '
+                        f'VALUES (?, {", ".join("?" for _ in table_fields)})',
+                        (doc_id, *tokens)
+                    )
+
+            self._conn.commit()
+
+        if rows:
+            self.logger.info(f"검색 색인 갱신: {len(rows)}건 ({time.perf_counter() - start:.2f}초)")
+        return len(rows)
+
+    def search(self, query: str, decision_type: str = None, newspaper: str = None,
+               year: int = None, limit: int = 10) -> List[Dict[str, any]]:
+        """
+        검색어를 포함하는 심의를 관련도 순으로 반환합니다.
+        제목/주문/적용 조항에서 찾은 심의가 먼저 오고, 이유에서만 찾은 심의가 그 뒤에 옵니다.
+
+        Args:
+            query: 검색어 (띄어쓰기로 나뉜 단어는 모두 포함해야 함)
+            decision_type: 결정유형 조건
+            newspaper: 언론사 조건
+            year: 연도 조건
+            limit: 최대 건수
+
+        Returns:
+            'decision_no', 'decision_type', 'newspaper', 'title', 'url', 'year', 'month',
+            'score', 'snippet' 키를 가진 딕셔너리 리스트
+        """
+        match = build_match_query(query)
+        if match is None:
+            return []
+
+        filters = {'decision_type': decision_type, 'newspaper': newspaper, 'year': year}
+        results: List[Dict[str, any]] = []
+        seen: List[int] = []
+
+        # 제목/주문/적용 조항에서 찾은 심의를 먼저, 남은 자리는 이유에서만 찾은 심의로 채움
+        for table, _, weights in INDEX_TABLES:
+            if len(results) >= limit:
+                break
+            for row in self._query(table, weights, match, filters, seen, limit - len(results)):
+                seen.append(row['doc_id'])
+                results.append(self._result(row, query))
+        return results
+
+    def _query(self, table: str, weights: Tuple[float, ...], match: str, filters: Dict[str, any],
+               exclude: List[int], limit: int) -> List[sqlite3.Row]:
+        """색인 테이블 하나에서 조건에 맞는 심의를 BM25 순으로 조회"""
+        conditions = [f'{table} MATCH ?']
+        params: List = [match]
+        for column, value in filters.items():
+            if value is not None:
+                conditions.append(f'd.{column} = ?')
+                params.append(value)
+        if exclude:
+            conditions.append(f'{table}.rowid NOT IN ({", ".join("?" for _ in exclude)})')
+            params.extend(exclude)
+        params.append(limit)
+
+        with self._lock:
+            return self._conn.execute(
+                f'SELECT d.*, s.rowid AS doc_id, bm25({table}, {", ".join(map(str, weights))}) AS score '
+                f'FROM {table} '
+                f'JOIN search_docs s ON s.rowid = {table}.rowid '
+                f'JOIN decisions d ON d.decision_no = s.decision_no '
+                f'WHERE {" AND ".join(conditions)} ORDER BY score LIMIT ?',
+                params
+            ).fetchall()
+
+    @staticmethod
+    def _result(row: sqlite3.Row, query: str) -> Dict[str, any]:
+        """조회 결과 한 행을 검색 결과 딕셔너리로 변환 (원문에서 발췌문 생성)"""
+        snippet = ''
+        for field in SNIPPET_FIELDS:
+            snippet = make_snippet(row[field] or '', query)
+            if snippet:
+                break
+        return {
+            'decision_no': row['decision_no'],
+            'decision_type': row['decision_type'],
+            'newspaper': row['newspaper'],
+            'title': row['title'],
+            'url': row['url'],
+            'year': row['year'],
+            'month': row['month'],
+            'score': round(-row['score'], 3),
+            'snippet': snippet,
+        }
+
+    def __enter__(self):
+        """컨텍스트 매니저 진입"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """컨텍스트 매니저 종료"""
+        self.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    """검색 명령행 실행"""
+    arg_parser = argparse.ArgumentParser(description="심의 결정 전문 검색")
+    arg_parser.add_argument('query', help="검색어 (띄어쓰기로 나뉜 단어는 모두 포함)")
+    arg_parser.add_argument('--type', dest='decision_type', help="결정유형 (예: 경고, 주의)")
+    arg_parser.add_argument('--newspaper', help="언론사")
+    arg_parser.add_argument('--year', type=int, help="연도")
+    arg_parser.add_argument('--limit', type=int, default=10, help="최대 결과 수 (기본값: 10)")
+    arg_parser.add_argument('--db', default=config.CORPUS_DB_PATH,
+                            help=f"코퍼스 저장소 경로 (기본값: {config.CORPUS_DB_PATH})")
+    arg_parser.add_argument('--rebuild', action='store_true', help="검색 전에 색인을 전부 다시 만듦")
+    args = arg_parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        print(f"코퍼스 저장소가 없습니다: {args.db}", file=sys.stderr)
+        print("config.py에서 USE_CORPUS_STORE = True로 설정한 뒤 스크레이퍼를 실행해주세요.", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        with SearchIndex(args.db) as index:
+            # 스크레이퍼 실행 중 색인되지 않은 심의가 있으면 먼저 반영
+            index.update(rebuild=args.rebuild)
+
+            start = time.perf_counter()
+            results = index.search(args.query, decision_type=args.decision_type,
+                                   newspaper=args.newspaper, year=args.year, limit=args.limit)
+            elapsed = time.perf_counter() - start
+    except sqlite3.OperationalError as e:
+        print(f"코퍼스 저장소를 열 수 없습니다 ({args.db}): {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for rank, result in enumerate(results, 1):
+        print(f"{rank}. [{result['decision_no']}] {result['title']}")
+        print(f"   {result['year']}년 {result['month']}월 | {result['decision_type']} | "
+              f"{result['newspaper']} | 점수 {result['score']}")
+        if result['snippet']:
+            print(f"   {result['snippet']}")
+        print(f"   {result['url']}")
+
+    print(f"\n{len(results)}건 ({elapsed * 1000:.1f}ms)")
+
+
+if __name__ == "__main__":
+    main()
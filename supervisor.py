@@ -0,0 +1,270 @@
+"""
+수집 실패 감독 모듈
+상세 페이지/기간 처리 실패를 유형별로 분류하고, 일시적인 실패는 지수 백오프 재시도 큐에 넣어 다시 시도합니다.
+
+- network: 연결 실패, 연결 끊김, HTTP 429/5xx, 브라우저 내비게이션 오류
+- timeout: 요청/대기 시간 초과, 준비 조건을 충족하지 못한 불완전한 페이지
+- session: WebDriver 세션 종료 (이후 모든 요청이 실패하므로 드라이버를 다시 시작)
+- permanent: 그 밖의 오류 (HTTP 4xx, 파싱할 수 없는 응답 등) - 재시도하지 않음
+
+재시도 횟수를 넘겼거나 영구 실패한 항목은 실행이 끝날 때 로그와 실패 보고서(output/failures.json)로 남깁니다.
+"""
+
+import os
+import json
+import time
+import heapq
+import random
+import logging
+import itertools
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import requests
+from selenium.common.exceptions import (
+    InvalidSessionIdException, NoSuchWindowException, TimeoutException, WebDriverException
+)
+
+import config
+import metrics
+
+
+FAILURE_NETWORK = 'network'
+FAILURE_TIMEOUT = 'timeout'
+FAILURE_SESSION = 'session'
+FAILURE_PERMANENT = 'permanent'
+
+RETRYABLE_FAILURES = (FAILURE_NETWORK, FAILURE_TIMEOUT, FAILURE_SESSION)
+
+# 세션이 끊겼음을 나타내는 WebDriver 오류 메시지 (소문자)
+SESSION_ERROR_MARKERS = (
+    'invalid session id', 'session deleted', 'chrome not reachable', 'disconnected',
+    'no such window', 'target window already closed', 'session not created',
+)
+
+
+class IncompletePage(Exception):
+    """준비 조건 대기 시간 안에 본문 컨테이너가 나타나지 않은 페이지"""
+
+
+def classify_failure(error: BaseException) -> str:
+    """
+    수집 실패를 유형별로 분류합니다.
+
+    Args:
+        error: 발생한 예외
+
+    Returns:
+        FAILURE_NETWORK, FAILURE_TIMEOUT, FAILURE_SESSION, FAILURE_PERMANENT 중 하나
+    """
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException)):
+        return FAILURE_SESSION
+    if isinstance(error, (TimeoutException, IncompletePage, requests.Timeout, TimeoutError)):
+        return FAILURE_TIMEOUT
+    if isinstance(error, WebDriverException):
+        message = (error.msg or str(error)).lower()
+        if any(marker in message for marker in SESSION_ERROR_MARKERS):
+            return FAILURE_SESSION
+        return FAILURE_NETWORK
+    if isinstance(error, requests.HTTPError):
+        status = error.response.status_code if error.response is not None else None
+        if status is not None and (status == 429 or status >= 500):
+            return FAILURE_NETWORK
+        return FAILURE_PERMANENT
+    if isinstance(error, (requests.ConnectionError, ConnectionError)):
+        return FAILURE_NETWORK
+    return FAILURE_PERMANENT
+
+
+def backoff_delay(attempt: int, base: float = None, cap: float = None) -> float:
+    """
+    재시도 대기 시간을 계산합니다. (base * 2^(attempt-2), 최대 cap, 50~100% 임의 조정)
+
+    Args:
+        attempt: 다음 시도 번호 (첫 재시도는 2)
+        base: 첫 재시도 대기 시간 (초, None이면 config.RETRY_BACKOFF_BASE)
+        cap: 최대 대기 시간 (초, None이면 config.RETRY_BACKOFF_CAP)
+
+    Returns:
+        대기 시간 (초)
+    """
+    base = base if base is not None else config.RETRY_BACKOFF_BASE
+    cap = cap if cap is not None else config.RETRY_BACKOFF_CAP
+    delay = min(cap, base * (2 ** max(0, attempt - 2)))
+    # 여러 항목이 같은 시각에 몰리지 않도록 임의로 분산
+    return delay * random.uniform(0.5, 1.0)
+
+
+def restart_scraper(scraper: Any):
+    """
+    스크레이퍼의 WebDriver를 닫고 다시 시작합니다. (이미 끊긴 세션을 닫다가 나는 오류는 무시)
+
+    Args:
+        scraper: setup_driver/close_driver를 제공하는 스크레이퍼
+    """
+    try:
+        scraper.close_driver()
+    except Exception as e:
+        logging.getLogger(__name__).debug(f"끊긴 드라이버 종료 중 오류 (무시): {e}")
+    scraper.driver = None
+    scraper.setup_driver()
+    metrics.inc('driver_restarts')
+
+
+class RetryQueue:
+    """재시도 시각 순으로 항목을 꺼내는 재시도 큐"""
+
+    def __init__(self):
+        """큐 초기화"""
+        self._heap: List[Tuple[float, int, Any, int]] = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def push(self, item: Any, attempt: int, delay: float):
+        """
+        항목을 delay초 뒤에 다시 시도하도록 추가합니다.
+
+        Args:
+            item: 재시도할 항목
+            attempt: 다음 시도 번호
+            delay: 대기 시간 (초)
+        """
+        with self._lock:
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._counter), item, attempt))
+
+    def drain(self) -> Iterator[Tuple[Any, int]]:
+        """
+        큐가 빌 때까지 재시도 시각이 된 항목을 꺼냅니다. (시각이 되지 않았으면 대기)
+        반복 중에 추가된 항목도 이어서 꺼냅니다.
+
+        Yields:
+            (항목, 시도 번호) 튜플
+        """
+        while True:
+            with self._lock:
+                if not self._heap:
+                    return
+                ready_at, _, item, attempt = heapq.heappop(self._heap)
+
+            wait = ready_at - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            yield item, attempt
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._heap)
+
+
+class DriverSupervisor:
+    """IkpecScraper의 실패를 분류하여 드라이버 재시작, 재시도 예약, 영구 실패 기록을 담당"""
+
+    def __init__(self, scraper: Any, max_attempts: int = None, max_restarts: int = None):
+        """
+        감독자 초기화
+
+        Args:
+            scraper: 감독할 스크레이퍼 (세션이 끊기면 다시 시작)
+            max_attempts: 항목당 최대 시도 횟수 (첫 시도 포함)
+            max_restarts: 실행당 최대 드라이버 재시작 횟수 (넘으면 RuntimeError)
+        """
+        self.scraper = scraper
+        self.max_attempts = max_attempts if max_attempts is not None else config.MAX_FETCH_ATTEMPTS
+        self.max_restarts = max_restarts if max_restarts is not None else config.MAX_DRIVER_RESTARTS
+        self.retry_queue = RetryQueue()
+        self.failures: List[Dict[str, Any]] = []
+        self.restarts = 0
+        self.logger = logging.getLogger(__name__)
+
+    def restart_driver(self):
+        """
+        감독 중인 스크레이퍼의 드라이버를 다시 시작합니다.
+
+        Raises:
+            RuntimeError: 최대 재시작 횟수를 넘은 경우
+        """
+        if self.restarts >= self.max_restarts:
+            raise RuntimeError(f"WebDriver 재시작 횟수 초과 ({self.max_restarts}회)")
+        self.restarts += 1
+        self.logger.warning(f"WebDriver 세션 종료, 드라이버 재시작 ({self.restarts}/{self.max_restarts})")
+        restart_scraper(self.scraper)
+
+    def handle_failure(self, item: Dict[str, Any], error: BaseException, attempt: int,
+                       retry_queue: Optional[RetryQueue] = None, restart: bool = True) -> str:
+        """
+        실패를 분류하고 재시도를 예약하거나 영구 실패로 기록합니다.
+
+        Args:
+            item: 실패한 항목 (심의 링크 정보 또는 기간 정보, 'url' 키 필요)
+            error: 발생한 예외
+            attempt: 실패한 시도 번호 (첫 시도는 1)
+            retry_queue: 재시도를 넣을 큐 (None이면 상세 페이지 재시도 큐)
+            restart: 세션 종료 시 감독 중인 드라이버를 다시 시작할지 여부
+                     (다른 스크레이퍼에서 난 오류면 False)
+
+        Returns:
+            실패 유형
+        """
+        failure = classify_failure(error)
+        if failure == FAILURE_SESSION and restart:
+            self.restart_driver()
+
+        if failure in RETRYABLE_FAILURES and attempt < self.max_attempts:
+            delay = backoff_delay(attempt + 1)
+            (retry_queue if retry_queue is not None else self.retry_queue).push(item, attempt + 1, delay)
+            metrics.inc('retries', failure=failure)
+            self.logger.warning(
+                f"재시도 예약 ({attempt + 1}/{self.max_attempts}, {failure}, {delay:.1f}초 후): {item['url']}",
+                extra={'url': item['url'], 'decision_no': item.get('decision_no')}
+            )
+            return failure
+
+        self.failures.append({
+            'url': item['url'],
+            'decision_no': item.get('decision_no'),
+            'title': item.get('title'),
+            'failure': failure,
+            'error': f"{type(error).__name__}: {error}",
+            'attempts': attempt,
+        })
+        metrics.inc('permanent_failures', failure=failure)
+        return failure
+
+    def retries(self) -> Iterator[Tuple[Dict[str, Any], int]]:
+        """상세 페이지 재시도 큐에서 재시도 시각이 된 항목을 꺼냅니다. (RetryQueue.drain)"""
+        return self.retry_queue.drain()
+
+    def report(self, path: str = None) -> List[Dict[str, Any]]:
+        """
+        영구 실패를 로그로 남기고 실패 보고서 JSON을 기록합니다. (실패가 없어도 빈 보고서로 갱신)
+
+        Args:
+            path: 보고서 경로 (None이면 config.FAILURE_REPORT_PATH)
+
+        Returns:
+            영구 실패 목록
+        """
+        path = path or config.FAILURE_REPORT_PATH
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        report = {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'driver_restarts': self.restarts,
+            'failures': self.failures,
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+        if self.failures:
+            self.logger.error(f"영구 실패 {len(self.failures)}건 (보고서: {path})")
+            for failure in self.failures:
+                self.logger.error(
+                    f"  - {failure['url']} ({failure['failure']}, {failure['attempts']}회 시도): {failure['error']}",
+                    extra={'url': failure['url'], 'decision_no': failure['decision_no']}
+                )
+        else:
+            self.logger.info(f"영구 실패 없음 (드라이버 재시작 {self.restarts}회)")
+        return self.failures
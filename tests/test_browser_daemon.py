@@ -0,0 +1,15 @@
+"""browser_daemon.chrome_command가 새로 실행하는 브라우저와 같은 설정으로 상시 실행 브라우저를 띄우는지 확인"""
+
+import config
+from browser_daemon import chrome_command
+
+
+def test_daemon_sends_configured_user_agent(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'CHROME_BINARY', '/usr/bin/chromium')
+
+    command = chrome_command('127.0.0.1:9222', str(tmp_path / 'profile'), headless=True)
+
+    # headless 모드에서도 HeadlessChrome이 아닌 설정된 User-Agent를 보냄
+    assert f'--user-agent={config.USER_AGENT}' in command
+    assert '--headless' in command
+    assert 'HeadlessChrome' not in config.USER_AGENT
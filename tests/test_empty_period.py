@@ -0,0 +1,44 @@
+"""심의가 없는 달의 목록 페이지를 받으면 기간이 완료로 기록되고, 불러오지 못한 페이지는 재시도되는지 확인"""
+
+import pytest
+
+from main import prepare_decision_links
+from manifest import ProgressManifest, STATE_DISCOVERED
+from scraper import IkpecScraper
+from supervisor import IncompletePage
+
+
+PERIOD_URL = 'https://www.ikpec.or.kr/m2/sub2_1.asp?Year=2019&DecideBaseNo=Y20190109'
+EMPTY_LIST_PAGE = '<html><body><div class="rst_list_l"><ul></ul></div></body></html>'
+BLANK_PAGE = '<html><body></body></html>'
+
+
+def scraper_returning(page_source: str, ready: bool) -> IkpecScraper:
+    """브라우저 없이 정해진 페이지 소스를 돌려주는 스크레이퍼"""
+    scraper = IkpecScraper()
+    scraper._load_page = lambda url, ready_selector, timeout=None, kind='detail': (page_source, ready)
+    return scraper
+
+
+def test_empty_list_page_marks_period(tmp_path):
+    manifest = ProgressManifest(str(tmp_path / 'manifest.db'))
+    try:
+        links = prepare_decision_links(scraper_returning(EMPTY_LIST_PAGE, False), 2019, 1, PERIOD_URL, manifest)
+
+        assert links == []
+        # 메인 루프는 기록이 있고 남은 심의가 없는 기간을 완료로 기록
+        assert manifest.period_state(PERIOD_URL) == STATE_DISCOVERED
+        assert manifest.pending_count(PERIOD_URL) == 0
+    finally:
+        manifest.close()
+
+
+def test_unloaded_list_page_is_not_recorded(tmp_path):
+    manifest = ProgressManifest(str(tmp_path / 'manifest.db'))
+    try:
+        with pytest.raises(IncompletePage):
+            prepare_decision_links(scraper_returning(BLANK_PAGE, False), 2019, 1, PERIOD_URL, manifest)
+
+        assert manifest.period_state(PERIOD_URL) is None
+    finally:
+        manifest.close()
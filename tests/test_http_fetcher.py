@@ -0,0 +1,81 @@
+"""HTTP 페처의 오류 전달과 WebDriver 대체 조건 확인"""
+
+import pytest
+import requests
+
+from http_fetcher import HttpFetcher
+from main import fetch_decision_html
+
+
+URL = 'https://www.ikpec.or.kr/m2/sub2_1_1.asp?Year=2019&DecideBaseNo=Y20190109&DecideNo=2019-4101'
+DETAIL_PAGE = '<html><body><div class="rst_result_view"><h3>본문</h3></div></body></html>'
+
+
+class FakeSession:
+    """정해진 상태 코드와 본문으로 응답하는 세션"""
+
+    def __init__(self, status: int, body: str = ''):
+        self.status = status
+        self.body = body
+        self.requests = 0
+
+    def get(self, url, timeout=None):
+        self.requests += 1
+        response = requests.Response()
+        response.status_code = self.status
+        response.url = url
+        response._content = self.body.encode('utf-8')
+        response.headers['Content-Type'] = 'text/html; charset=utf-8'
+        return response
+
+
+class RecordingLimiter:
+    """record_response/acquire 호출을 기록하는 요청 예산"""
+
+    def __init__(self):
+        self.statuses = []
+        self.acquired = []
+
+    def record_response(self, url, latency, status=None, error=None):
+        self.statuses.append(status)
+
+    def acquire(self, url):
+        self.acquired.append(url)
+        return 0.0
+
+
+class FallbackScraper:
+    """WebDriver 대체 경로 호출 횟수를 기록하는 스크레이퍼"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_decision_detail(self, url):
+        self.calls += 1
+        return DETAIL_PAGE
+
+
+@pytest.mark.parametrize('status', [403, 429, 503])
+def test_http_error_is_raised_without_webdriver_fallback(status):
+    limiter = RecordingLimiter()
+    fetcher = HttpFetcher(rate_limiter=limiter)
+    fetcher.session = FakeSession(status)
+    scraper = FallbackScraper()
+
+    with pytest.raises(requests.HTTPError):
+        fetch_decision_html(scraper, fetcher, URL)
+
+    assert limiter.statuses == [status]
+    assert scraper.calls == 0
+
+
+def test_structure_check_failure_falls_back_to_webdriver_with_token():
+    limiter = RecordingLimiter()
+    fetcher = HttpFetcher()
+    fetcher.session = FakeSession(200, '<html><body>점검 중</body></html>')
+    scraper = FallbackScraper()
+
+    assert fetch_decision_html(scraper, fetcher, URL, limiter) == DETAIL_PAGE
+    assert scraper.calls == 1
+    # WebDriver 대체 요청도 토큰을 받은 뒤 보냄
+    assert limiter.acquired == [URL]
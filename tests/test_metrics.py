@@ -0,0 +1,44 @@
+"""metrics 히스토그램 분위수가 최댓값으로 잘리지 않고 관측값 범위 안에서 계산되는지 확인"""
+
+import random
+
+import pytest
+
+import metrics
+from metrics import DEFAULT_BUCKETS, MetricsRegistry, _Histogram
+
+
+def test_small_counts_use_exact_samples():
+    histogram = _Histogram(DEFAULT_BUCKETS)
+    for value in (0.011, 0.012, 0.013, 0.014, 0.020):
+        histogram.observe(value)
+
+    assert histogram.quantile(0.50) == pytest.approx(0.013)
+    assert histogram.quantile(0.0) == pytest.approx(0.011)
+    assert histogram.quantile(1.0) == pytest.approx(0.020)
+
+
+def test_large_counts_interpolate_within_observed_range(monkeypatch):
+    monkeypatch.setattr(metrics, 'EXACT_QUANTILE_SAMPLES', 100)
+    rng = random.Random(7)
+    histogram = _Histogram(DEFAULT_BUCKETS)
+    # 모두 (0.001, 0.0025] 구간의 아래쪽에 모인 빠른 단계
+    for _ in range(5000):
+        histogram.observe(rng.uniform(0.0011, 0.0013))
+
+    assert histogram.samples is None
+    p50 = histogram.quantile(0.50)
+    p95 = histogram.quantile(0.95)
+    assert p50 < p95 < histogram.maximum
+    assert p50 == pytest.approx(0.0012, abs=0.00003)
+    assert histogram.minimum <= p50
+
+
+def test_summary_p50_below_max_for_fast_stage():
+    registry = MetricsRegistry()
+    for value in (0.0011, 0.0012, 0.0012, 0.0013, 0.0024):
+        registry.observe('stage_seconds', value, stage='parse')
+
+    stage = registry.summary()['stages']['stage=parse']
+    assert stage['p50_ms'] == pytest.approx(1.2)
+    assert stage['p50_ms'] < stage['max_ms'] == pytest.approx(2.4)
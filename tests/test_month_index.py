@@ -0,0 +1,41 @@
+"""한 달에 심의일(DecideBaseNo)이 둘인 경우 월별 인덱스가 두 기간의 심의를 모두 담는지 확인"""
+
+import os
+
+import config
+from main import collect_stored_decisions, write_decision_record, write_month_index
+from manifest import ProgressManifest, STATE_DISCOVERED
+
+
+PERIOD_A = 'https://www.ikpec.or.kr/m2/sub2_1.asp?Year=2019&DecideBaseNo=Y20190109'
+PERIOD_B = 'https://www.ikpec.or.kr/m2/sub2_1.asp?Year=2019&DecideBaseNo=Y20190123'
+
+
+def save_period(manifest, period_url, decision_no, title):
+    """기간 하나를 발견 → 저장 → 월별 인덱스 작성 순서로 처리"""
+    link = {'decision_no': decision_no, 'url': f"{period_url}&DecideNo={decision_no}", 'title': title}
+    manifest.record_discovered(period_url, [link])
+    manifest.mark_period(period_url, 2019, 1, STATE_DISCOVERED, 1)
+
+    stored = collect_stored_decisions(2019, 1, period_url, manifest)
+    decision = {'decision_no': decision_no, 'manifest_key': decision_no, 'title': title,
+                'url': link['url'], 'list_order': 1}
+    month_dir = os.path.join(config.OUTPUT_DIR, '2019', '01')
+    saved = [write_decision_record(decision, 2019, 1, month_dir, manifest)]
+    write_month_index(saved, 2019, 1, month_dir, stored)
+    return os.path.join(month_dir, 'INDEX_2019_01.md')
+
+
+def test_second_period_keeps_first_period_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'OUTPUT_DIR', str(tmp_path))
+    manifest = ProgressManifest(str(tmp_path / 'manifest.db'))
+    try:
+        save_period(manifest, PERIOD_A, '2019-4101', '첫 심의일 결정')
+        index_path = save_period(manifest, PERIOD_B, '2019-4201', '둘째 심의일 결정')
+    finally:
+        manifest.close()
+
+    with open(index_path, encoding='utf-8') as f:
+        index = f.read()
+    assert '첫 심의일 결정' in index
+    assert '둘째 심의일 결정' in index
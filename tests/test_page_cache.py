@@ -0,0 +1,120 @@
+"""page_cache.PageCache 만료, 불변 페이지, URL 정규화, LRU 용량 제한 확인 (임시 캐시 디렉토리, 주입한 시계)"""
+
+import gzip
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+import page_cache
+from page_cache import PageCache, cache_key, normalize_url
+
+
+def list_url(decided: datetime) -> str:
+    return f"https://www.ikpec.or.kr/m2/sub2_1.asp?Year={decided.year}&DecideBaseNo=Y{decided:%Y%m%d}"
+
+
+OLD_URL = list_url(datetime(2019, 1, 9))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def time(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(page_cache, 'time', SimpleNamespace(time=fake.time))
+    return fake
+
+
+@pytest.fixture
+def make_cache(tmp_path):
+    caches = []
+
+    def make(**kwargs):
+        kwargs.setdefault('ttl_seconds', 3600)
+        kwargs.setdefault('immutable_after_days', 90)
+        kwargs.setdefault('max_bytes', 10 * 1024 * 1024)
+        cache = PageCache(cache_dir=str(tmp_path / 'pages'), **kwargs)
+        caches.append(cache)
+        return cache
+
+    yield make
+    for cache in caches:
+        cache.close()
+
+
+def test_normalize_url_ignores_case_port_fragment_and_query_order():
+    url = 'HTTPS://WWW.IKPEC.OR.KR:443/m2/sub2_1_1.asp?DecideNo=2019-4101&Year=2019#top'
+
+    assert normalize_url(url) == 'https://www.ikpec.or.kr/m2/sub2_1_1.asp?DecideNo=2019-4101&Year=2019'
+    assert normalize_url('http://Example.com:8080') == 'http://example.com:8080/'
+    assert cache_key(url) == cache_key('https://www.ikpec.or.kr/m2/sub2_1_1.asp?Year=2019&DecideNo=2019-4101')
+
+
+def test_equivalent_urls_share_entry(clock, make_cache):
+    cache = make_cache()
+    cache.put('https://www.ikpec.or.kr/m2/sub2_1_1.asp?Year=2019&DecideNo=2019-4101', '<html>본문</html>')
+
+    assert cache.get('https://WWW.ikpec.or.kr:443/m2/sub2_1_1.asp?DecideNo=2019-4101&Year=2019#x') == '<html>본문</html>'
+
+
+def test_recent_page_expires_after_ttl(clock, make_cache):
+    cache = make_cache(ttl_seconds=3600)
+    url = list_url(datetime.now() - timedelta(days=10))
+    cache.put(url, '<html>최근</html>')
+
+    clock.advance(3599)
+    assert cache.contains(url)
+    assert cache.get(url) == '<html>최근</html>'
+
+    clock.advance(1)
+    assert not cache.contains(url)
+    assert cache.get(url) is None
+    # 만료된 항목은 지워지므로 다시 확인해도 없음
+    assert list(cache.iter_pages()) == []
+
+
+def test_page_older_than_immutable_window_never_expires(clock, make_cache):
+    cache = make_cache(ttl_seconds=3600, immutable_after_days=90)
+
+    assert cache.ttl_for(OLD_URL) is None
+    assert cache.ttl_for(list_url(datetime.now() - timedelta(days=89))) == 3600
+    assert cache.ttl_for('https://www.ikpec.or.kr/m2/sub2_1.asp?Year=2019') == 3600
+
+    cache.put(OLD_URL, '<html>지난 심의</html>')
+    clock.advance(365 * 24 * 3600)
+    assert cache.get(OLD_URL) == '<html>지난 심의</html>'
+
+
+def test_evicts_least_recently_used_when_over_limit(clock, make_cache):
+    pages = {name: f"<html>{name * 200}</html>" for name in ('a', 'b', 'c')}
+    sizes = {name: len(gzip.compress(html.encode('utf-8'))) for name, html in pages.items()}
+    urls = {name: f"{OLD_URL}&DecideNo=2019-{name}" for name in pages}
+    # 항목 두 개까지만 들어가는 한도
+    cache = make_cache(max_bytes=sum(sizes.values()) - min(sizes.values()))
+
+    cache.put(urls['a'], pages['a'])
+    clock.advance(1)
+    cache.put(urls['b'], pages['b'])
+    clock.advance(1)
+    # a를 다시 사용하면 가장 오래 사용하지 않은 항목은 b
+    assert cache.get(urls['a']) == pages['a']
+    clock.advance(1)
+    cache.put(urls['c'], pages['c'])
+
+    assert cache.get(urls['b']) is None
+    assert cache.get(urls['a']) == pages['a']
+    assert cache.get(urls['c']) == pages['c']
+
+    # 다시 열어도 전체 크기를 이어서 계산
+    reopened = make_cache(max_bytes=cache.max_bytes)
+    assert reopened._total_bytes == sizes['a'] + sizes['c']
@@ -0,0 +1,102 @@
+"""parser.py의 두 파서 방식(html.parser, lxml)이 같은 결과를 반환하는지 확인"""
+
+import pytest
+
+from parser import parse_decision_detail, parse_decision_list
+
+
+# 섹션 <p> 안에 블록 요소(<div>, <table>, <ul>)가 들어 있는 상세 페이지
+# (lxml은 블록 요소를 만나면 <p>를 닫으므로 html.parser와 결과가 달라지기 쉬운 구조)
+NESTED_BLOCK_DETAIL = """
+<html><body>
+<div class="rst_result_view">
+  <div class="rst_titleW">
+    <u class="rl_btn green">주의</u>
+    <h3 class="type01"><i>2019-4101</i> 기사 제목 <b>강조</b></h3>
+    <dl><dt>언론사</dt><dd>중부매일      발행인  한  인  섭</dd></dl>
+  </div>
+  <div class="rst_contW">
+    <ul>
+      <li><h3 class="type01">주 문</h3><p>가<table><tr><td>표</td></tr></table>나</p></li>
+      <li><h3 class="type01">이 유</h3><p>첫 문단<div>div 안 문단</div>꼬리</p></li>
+      <li><h3 class="type01">적용 조항</h3><p>신문윤리실천요강 <ul><li>제3조</li></ul> 제10조</p></li>
+      <li><h3 class="type01">참고</h3><p>앞</p><p>뒤</p></li>
+    </ul>
+  </div>
+</div>
+</body></html>
+"""
+
+
+def detail_page(section: str) -> str:
+    """이유 섹션 하나만 있는 상세 페이지"""
+    return f"""
+<html><body>
+<div>컨테이너 밖</div>
+<div class="rst_result_view">
+  <div class="rst_contW">
+    <ul>
+      <li><h3 class="type01">이 유</h3>{section}</li>
+    </ul>
+  </div>
+</div>
+</body></html>
+"""
+
+
+LIST_PAGE = """
+<html><body>
+<div class="rst_list_l">
+  <ul>
+    <li><a href="sub2_1_1.asp?Year=2019&DecideBaseNo=Y20190109&DecideNo=2019-4101">
+      <span>2019-4101</span><strong>첫 번째 제목</strong><u class="rl_btn green">주의</u></a></li>
+    <li><a href="/m2/sub2_1_1.asp?Year=2019&DecideBaseNo=Y20190109&DecideNo=2019-4102" title="두 번째 제목">
+      <span>2019-4102</span><u class="rl_btn">경고</u></a></li>
+    <li><a href="sub2_1_1.asp?Year=2019&DecideBaseNo=Y20190109&DecideNo=2019-4101"><span>2019-4101</span></a></li>
+  </ul>
+</div>
+</body></html>
+"""
+
+
+def test_detail_backends_match_with_nested_blocks():
+    expected = parse_decision_detail(NESTED_BLOCK_DETAIL, backend='html.parser')
+    actual = parse_decision_detail(NESTED_BLOCK_DETAIL, backend='lxml')
+
+    assert actual == expected
+    assert expected['decision_text'] == '가표나'
+    assert expected['reason'] == '첫 문단div 안 문단꼬리'
+    assert expected['applied_rules'] == '신문윤리실천요강제3조제10조'
+
+
+def test_list_backends_match():
+    expected = parse_decision_list(LIST_PAGE, backend='html.parser')
+
+    assert parse_decision_list(LIST_PAGE, backend='lxml') == expected
+    assert [decision['title'] for decision in expected] == ['첫 번째 제목', '두 번째 제목']
+
+
+@pytest.mark.parametrize('backend', ['html.parser', 'lxml'])
+def test_detail_without_container(backend):
+    detail = parse_decision_detail('<html><body><p>점검 중</p></body></html>', backend=backend)
+
+    assert detail['reason'] == '' and detail['full_content'] == ''
+
+
+@pytest.mark.parametrize('section, reason', [
+    # 닫힌 <p> 바로 뒤의 블록 형제는 <p>에 포함되지 않음
+    ('<p>가</p><div>추가</div>', '가'),
+    ('<p>가</p><table><tr><td>표</td></tr></table>', '가'),
+    ('<P class="text">가</P>\n<div>추가</div>', '가'),
+    # 중첩된 <p>와 짝이 없는 </p>
+    ('<p>가<p>나</p>다</p>', '가나다'),
+    ('<p>가</p></p>나', '가'),
+    # 닫히지 않은 <p> 안의 블록 요소
+    ('<p>가<div>나</div>다<hr>라', '가나다라'),
+])
+def test_detail_backends_match_around_paragraphs(section, reason):
+    html_content = detail_page(section)
+    expected = parse_decision_detail(html_content, backend='html.parser')
+
+    assert parse_decision_detail(html_content, backend='lxml') == expected
+    assert expected['reason'] == reason
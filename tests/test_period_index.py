@@ -0,0 +1,56 @@
+"""period_index.PeriodIndex 캐시 동작 확인"""
+
+import json
+from datetime import datetime
+
+from period_index import PeriodIndex
+
+
+YEAR_PAGE = '<select><option value="Y20190109">1월</option><option value="Y20190213">2월</option></select>'
+
+
+def test_empty_year_page_is_not_cached(tmp_path):
+    pages = iter(['<html>점검 중</html>', YEAR_PAGE])
+    index = PeriodIndex(fetch_func=lambda url: next(pages), path=str(tmp_path / 'periods.json'))
+
+    assert index.decide_base_nos(2019) == []
+    # 빈 결과를 저장하지 않았으므로 다시 요청함
+    assert index.decide_base_nos(2019) == ['Y20190109', 'Y20190213']
+
+    reloaded = PeriodIndex(fetch_func=lambda url: '', path=str(tmp_path / 'periods.json'))
+    assert reloaded.decide_base_nos(2019) == ['Y20190109', 'Y20190213']
+
+
+def write_index(path, fetched_at, decide_base_nos):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'years': {'2019': {'fetched_at': fetched_at, 'decide_base_nos': decide_base_nos}}}, f)
+
+
+def test_past_year_fetched_mid_year_is_fetched_again(tmp_path):
+    path = str(tmp_path / 'periods.json')
+    # 2019년 6월에 찾은 목록에는 7월 이후 심의일이 없음
+    write_index(path, datetime(2019, 6, 15).timestamp(), ['Y20190109'])
+    requested = []
+
+    def fetch(url):
+        requested.append(url)
+        return YEAR_PAGE
+
+    index = PeriodIndex(fetch_func=fetch, path=path, ttl_seconds=3600)
+
+    assert index.decide_base_nos(2019) == ['Y20190109', 'Y20190213']
+    assert len(requested) == 1
+    # 해가 끝난 뒤 다시 찾은 목록은 확정되어 더 요청하지 않음
+    assert index.decide_base_nos(2019) == ['Y20190109', 'Y20190213']
+    assert len(requested) == 1
+
+
+def test_past_year_fetched_after_year_end_is_final(tmp_path):
+    path = str(tmp_path / 'periods.json')
+    write_index(path, datetime(2020, 1, 2).timestamp(), ['Y20190109', 'Y20191211'])
+
+    def fetch(url):
+        raise AssertionError(f"요청하지 않아야 합니다: {url}")
+
+    index = PeriodIndex(fetch_func=fetch, path=path, ttl_seconds=3600)
+    assert index.decide_base_nos(2019) == ['Y20190109', 'Y20191211']
@@ -0,0 +1,66 @@
+"""pipeline.StreamingPipeline 정상 종료와 수집 중 예외 시 작업 스레드 정리 확인"""
+
+import threading
+import time
+
+import pytest
+
+from pipeline import StreamingPipeline
+
+
+class SlowWriter:
+    """저장에 시간이 걸리는 저장 단계 (진행 중인 저장이 있는지 기록)"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.written = []
+        self.active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, record):
+        with self._lock:
+            self.active += 1
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+            self.written.append(record)
+        return record
+
+
+def pipeline_threads():
+    return [thread for thread in threading.enumerate() if thread.name.startswith('pipeline-')]
+
+
+def test_pipeline_processes_all_items():
+    writer = SlowWriter()
+    pipeline = StreamingPipeline(parse_func=lambda item: item * 10, write_func=writer,
+                                 parse_workers=2, queue_size=2, monitor_interval=0)
+
+    results = pipeline.run(range(20))
+
+    assert sorted(results) == [n * 10 for n in range(20)]
+    assert pipeline.stats['written'] == 20
+    assert pipeline_threads() == []
+
+
+@pytest.mark.parametrize('error', [RuntimeError('목록 페이지 오류'), KeyboardInterrupt()])
+def test_source_error_stops_workers_before_returning(error):
+    writer = SlowWriter(delay=0.2)
+    pipeline = StreamingPipeline(parse_func=lambda item: item, write_func=writer,
+                                 parse_workers=2, queue_size=4, monitor_interval=0, shutdown_timeout=5)
+
+    def source():
+        yield from range(4)
+        # 저장 단계가 앞 항목을 기록하는 중에 수집 단계가 실패
+        time.sleep(0.05)
+        raise error
+
+    with pytest.raises(type(error)):
+        pipeline.run(source())
+
+    # 호출 측이 저장소를 닫기 전에 작업 스레드가 모두 끝났고, 진행 중인 저장도 없음
+    assert pipeline_threads() == []
+    assert writer.active == 0
+    written = list(writer.written)
+    time.sleep(0.3)
+    assert writer.written == written
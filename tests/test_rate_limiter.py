@@ -0,0 +1,183 @@
+"""rate_limiter.TokenBucket/HostRateLimiter 요청 예산과 AimdController 속도 조정 확인 (시각 함수를 주입하여 실제로 기다리지 않음)"""
+
+import pytest
+import requests
+
+import rate_limiter
+from rate_limiter import AimdController, HostRateLimiter, TokenBucket
+
+
+URL = 'https://www.ikpec.or.kr/m2/sub2_1_1.asp?DecideNo=2019-4101'
+OTHER_HOST_URL = 'https://example.com/page'
+
+
+class FakeClock:
+    """sleep을 호출하면 그만큼 시각이 흐르는 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, 'sleep', fake.sleep)
+    return fake
+
+
+def test_bucket_allows_burst_then_spaces_requests(clock):
+    bucket = TokenBucket(rate=2.0, burst=3, clock=clock)
+
+    # 버킷 용량만큼은 바로 보내고, 이후에는 1/rate 초씩 대기 시간이 늘어남
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_bucket_refills_at_rate_up_to_burst(clock):
+    bucket = TokenBucket(rate=2.0, burst=2, clock=clock)
+    bucket.reserve()
+    bucket.reserve()
+
+    clock.advance(0.5)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+    # 오래 쉬어도 버킷 용량 이상은 쌓이지 않음 (빌려 쓴 토큰을 먼저 갚음)
+    clock.advance(60.0)
+    assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.5)
+
+
+def test_set_rate_keeps_tokens_accrued_at_old_rate(clock):
+    bucket = TokenBucket(rate=1.0, burst=1, clock=clock)
+    bucket.reserve()
+
+    clock.advance(0.5)
+    bucket.set_rate(4.0)
+    # 이전 속도로 0.5개가 쌓였으므로 나머지 0.5개는 새 속도로 0.125초
+    assert bucket.reserve() == pytest.approx(0.125)
+
+
+def test_limiter_shares_bucket_per_host(clock):
+    limiter = HostRateLimiter(requests_per_second=1.0, burst=1, jitter_range=(0.0, 0.0), adaptive=False, clock=clock)
+
+    assert limiter.acquire(URL) == 0.0
+    # 다른 호스트는 별도 예산
+    assert limiter.acquire(OTHER_HOST_URL) == 0.0
+    # 같은 호스트는 대소문자와 경로가 달라도 같은 버킷
+    assert limiter.acquire(URL.replace('www.ikpec.or.kr', 'WWW.IKPEC.OR.KR')) == pytest.approx(1.0)
+    assert clock.slept == [pytest.approx(1.0)]
+    assert limiter.bucket_for(URL) is limiter.bucket_for('https://www.ikpec.or.kr/')
+
+
+class FakeSharedBudget:
+    """노드 합계 예산: 정해진 대기 시간을 차례로 돌려주고 호출을 기록"""
+
+    def __init__(self, delays):
+        self.delays = list(delays)
+        self.hosts = []
+
+    def reserve(self, host):
+        self.hosts.append(host)
+        return self.delays.pop(0)
+
+
+def test_limiter_waits_for_shared_budget_after_local_token(clock):
+    budget = FakeSharedBudget([0.0, 0.75])
+    limiter = HostRateLimiter(requests_per_second=10.0, burst=2, jitter_range=(0.0, 0.0), adaptive=False,
+                              shared_budget=budget, clock=clock)
+
+    assert limiter.acquire(URL) == 0.0
+    # 로컬 토큰은 남아 있어도 공유 예산이 정한 시각까지 대기
+    assert limiter.acquire(URL) == pytest.approx(0.75)
+    assert budget.hosts == ['www.ikpec.or.kr', 'www.ikpec.or.kr']
+    assert clock.slept == [pytest.approx(0.75)]
+
+
+def make_controller(clock, rate=1.0, jitter_range=(0.0, 0.0)):
+    bucket = TokenBucket(rate=rate, burst=1, jitter_range=jitter_range, clock=clock)
+    controller = AimdController(bucket, 'www.ikpec.or.kr', min_rate=0.1, max_rate=2.0, target_latency=1.0,
+                                spike_factor=3.0, increase_step=0.25, decrease_factor=0.5, cooldown=5.0)
+    return bucket, controller
+
+
+def test_aimd_increases_additively_under_target(clock):
+    bucket, controller = make_controller(clock)
+
+    assert controller.record(0.2) == pytest.approx(1.25)
+    assert controller.record(0.4) == pytest.approx(1.5)
+    assert bucket.rate == pytest.approx(1.5)
+
+
+def test_aimd_decreases_multiplicatively_and_holds_during_cooldown(clock):
+    bucket, controller = make_controller(clock)
+
+    assert controller.record(None, congested=True) == pytest.approx(0.5)
+    # 이미 보낸 요청의 혼잡 응답은 보류 시간 동안 반영하지 않음
+    assert controller.record(None, congested=True) == pytest.approx(0.5)
+    assert controller.record(0.1) == pytest.approx(0.5)
+
+    clock.advance(5.0)
+    assert controller.record(None, congested=True) == pytest.approx(0.25)
+
+
+def test_aimd_treats_latency_spike_as_congestion(clock):
+    _, controller = make_controller(clock)
+
+    # 목표(1초)의 3배를 넘는 응답 하나로 속도를 낮춤
+    assert controller.record(3.5) == pytest.approx(0.5)
+
+
+def test_aimd_clamps_to_floor_and_ceiling(clock):
+    bucket, controller = make_controller(clock, rate=5.0)
+    # 시작 속도도 범위 안으로 맞춤
+    assert bucket.rate == pytest.approx(2.0)
+    assert controller.record(0.1) == pytest.approx(2.0)
+
+    for _ in range(10):
+        controller.record(None, congested=True)
+        clock.advance(5.0)
+    assert bucket.rate == pytest.approx(0.1)
+
+
+def test_aimd_scales_jitter_down_as_rate_rises(clock):
+    bucket, controller = make_controller(clock, jitter_range=(2.0, 4.0))
+
+    controller.record(0.1)
+    controller.record(0.1)
+    controller.record(0.1)
+    controller.record(0.1)
+    assert bucket.rate == pytest.approx(2.0)
+    assert bucket.jitter_range == (pytest.approx(1.0), pytest.approx(2.0))
+
+
+@pytest.mark.parametrize('status, error, congested', [
+    (429, None, True),
+    (503, None, True),
+    (403, None, True),
+    (None, requests.Timeout('read timed out'), True),
+    (None, requests.ConnectionError('connection reset'), True),
+    (200, None, False),
+    (404, None, False),
+])
+def test_limiter_feeds_congestion_signals_to_controller(clock, status, error, congested):
+    limiter = HostRateLimiter(requests_per_second=1.0, burst=1, jitter_range=(0.0, 0.0), adaptive=True, clock=clock)
+
+    limiter.record_response(URL, 0.1 if error is None else None, status=status, error=error)
+
+    if congested:
+        assert limiter.current_rate(URL) < 1.0
+    else:
+        assert limiter.current_rate(URL) > 1.0
@@ -0,0 +1,130 @@
+"""scraper_pool.ScraperPool의 작업 스레드 수명 주기, 공유 요청 예산, 세션 재시작 확인 (브라우저 대신 스텁 스크레이퍼)"""
+
+import threading
+import time
+
+from selenium.common.exceptions import InvalidSessionIdException
+
+from rate_limiter import HostRateLimiter
+from scraper_pool import ScraperPool
+
+
+BASE = 'https://www.ikpec.or.kr/m2/sub2_1_1.asp?DecideNo='
+
+
+class StubScraper:
+    """IkpecScraper의 수명 주기와 드라이버 재시작만 흉내 내는 스크레이퍼"""
+
+    def __init__(self, cached=()):
+        self.cached = set(cached)
+        self.entered = 0
+        self.exited = 0
+        self.setups = 0
+        self.closes = 0
+        self.threads = set()
+        self.session_alive = True
+
+    def __enter__(self):
+        self.entered += 1
+        self.setup_driver()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.exited += 1
+        self.close_driver()
+
+    def setup_driver(self):
+        self.setups += 1
+        self.session_alive = True
+
+    def close_driver(self):
+        self.closes += 1
+
+    def is_cached(self, url):
+        return url in self.cached
+
+
+class CountingLimiter(HostRateLimiter):
+    """acquire 호출을 호스트 예산 그대로 통과시키면서 기록하는 요청 예산"""
+
+    def __init__(self, **kwargs):
+        super().__init__(jitter_range=(0.0, 0.0), adaptive=False, **kwargs)
+        self.acquired = []
+        self._record_lock = threading.Lock()
+
+    def acquire(self, url):
+        waited = super().acquire(url)
+        with self._record_lock:
+            self.acquired.append((time.monotonic(), url))
+        return waited
+
+
+def make_pool(size, limiter, fetch_func, cached=()):
+    scrapers = []
+
+    def factory():
+        scraper = StubScraper(cached)
+        scrapers.append(scraper)
+        return scraper
+
+    return ScraperPool(size=size, rate_limiter=limiter, scraper_factory=factory, fetch_func=fetch_func), scrapers
+
+
+def fetch_page(scraper, url):
+    scraper.threads.add(threading.current_thread().name)
+    if not scraper.session_alive:
+        raise InvalidSessionIdException('invalid session id')
+    return f"<html>{url}</html>"
+
+
+def test_workers_own_scrapers_for_pool_lifetime():
+    limiter = CountingLimiter(requests_per_second=1000, burst=10)
+    pool, scrapers = make_pool(3, limiter, fetch_page)
+
+    urls = [f"{BASE}2019-{n}" for n in range(12)]
+    with pool:
+        results = list(pool.fetch_all(urls))
+
+    assert [url for url, _, _ in results] == urls
+    assert all(html == f"<html>{url}</html>" and error is None for url, html, error in results)
+    # 작업 스레드마다 스크레이퍼 하나를 열고, 풀을 닫을 때 모두 닫음
+    assert len(scrapers) == 3
+    assert all(scraper.entered == 1 and scraper.exited == 1 for scraper in scrapers)
+    assert all(len(scraper.threads) <= 1 for scraper in scrapers)
+
+
+def test_workers_share_one_host_budget():
+    # 초당 20건, 연속 1건: 작업 스레드가 4개여도 합계 요청 간격은 약 0.05초
+    limiter = CountingLimiter(requests_per_second=20, burst=1)
+    cached = {f"{BASE}cached"}
+    pool, _ = make_pool(4, limiter, fetch_page, cached=cached)
+
+    urls = [f"{BASE}2019-{n}" for n in range(8)] + list(cached)
+    start = time.monotonic()
+    with pool:
+        results = list(pool.fetch_all(urls))
+    elapsed = time.monotonic() - start
+
+    assert all(error is None for _, _, error in results)
+    # 캐시에 있는 페이지는 토큰을 쓰지 않음
+    assert sorted(url for _, url in limiter.acquired) == sorted(urls[:8])
+    # 첫 요청은 바로, 나머지 7건은 하나의 예산에서 차례로 토큰을 받음
+    assert elapsed >= 7 / 20 - 0.02
+
+
+def test_dead_session_restarts_worker_driver():
+    limiter = CountingLimiter(requests_per_second=1000, burst=10)
+    pool, scrapers = make_pool(1, limiter, fetch_page)
+
+    with pool:
+        assert pool.submit(f"{BASE}2019-1").result() == f"<html>{BASE}2019-1</html>"
+        scrapers[0].session_alive = False
+        failed = pool.submit(f"{BASE}2019-2")
+        assert isinstance(failed.exception(), InvalidSessionIdException)
+        # 같은 작업 스레드가 드라이버를 다시 시작하여 이후 요청을 처리
+        assert pool.submit(f"{BASE}2019-3").result() == f"<html>{BASE}2019-3</html>"
+
+    scraper = scrapers[0]
+    assert len(scrapers) == 1
+    assert scraper.setups == 2
+    assert scraper.entered == 1 and scraper.exited == 1
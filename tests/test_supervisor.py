@@ -0,0 +1,103 @@
+"""HTTP 수집 경로의 실패가 감독자의 분류/재시도를 거치는지 확인"""
+
+import pytest
+import requests
+
+import config
+from main import iter_decision_pages
+from supervisor import DriverSupervisor, FAILURE_NETWORK, FAILURE_PERMANENT, FAILURE_TIMEOUT, classify_failure
+
+
+URL = 'https://www.ikpec.or.kr/m2/sub2_1_1.asp?Year=2019&DecideBaseNo=Y20190109&DecideNo=2019-4101'
+DETAIL_PAGE = '<html><body><div class="rst_result_view"><h3>본문</h3></div></body></html>'
+
+
+def http_error(status: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"{status}", response=response)
+
+
+@pytest.mark.parametrize('error, failure', [
+    (requests.ConnectionError('connection reset'), FAILURE_NETWORK),
+    (requests.Timeout('read timed out'), FAILURE_TIMEOUT),
+    (http_error(429), FAILURE_NETWORK),
+    (http_error(503), FAILURE_NETWORK),
+    (http_error(404), FAILURE_PERMANENT),
+])
+def test_classify_requests_errors(error, failure):
+    assert classify_failure(error) == failure
+
+
+class FlakyFetcher:
+    """처음 몇 번은 요청 예외를 내고 이후에는 페이지를 반환하는 HTTP 페처"""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def get_decision_detail(self, url):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return DETAIL_PAGE
+
+
+class CountingScraper:
+    """WebDriver 대체 경로가 쓰이지 않았는지 확인하는 스크레이퍼"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def is_cached(self, url):
+        return False
+
+    def get_decision_detail(self, url):
+        self.calls += 1
+        return DETAIL_PAGE
+
+
+class RecordingLimiter:
+    def __init__(self):
+        self.acquired = []
+
+    def acquire(self, url):
+        self.acquired.append(url)
+        return 0.0
+
+
+def test_http_failures_are_retried_with_backoff(monkeypatch):
+    monkeypatch.setattr(config, 'RETRY_BACKOFF_BASE', 0.01)
+    fetcher = FlakyFetcher([requests.ConnectionError('reset'), requests.Timeout('timed out')])
+    scraper = CountingScraper()
+    limiter = RecordingLimiter()
+    supervisor = DriverSupervisor(scraper, max_attempts=3)
+    link = {'url': URL, 'title': '제목', 'decision_no': '2019-4101'}
+
+    pages = list(iter_decision_pages(scraper, [link], fetcher, rate_limiter=limiter, supervisor=supervisor))
+
+    assert pages == [(link, DETAIL_PAGE)]
+    assert fetcher.calls == 3
+    assert len(limiter.acquired) == 3
+    assert scraper.calls == 0
+    assert supervisor.failures == []
+
+
+class StructureFailureBackend:
+    """구조 검사에 실패하여 HTML 없이 돌아온 결과를 내보내는 병렬 수집 방식"""
+
+    def fetch_all(self, urls):
+        for url in urls:
+            yield url, None, None
+
+
+def test_backend_fallback_waits_for_token():
+    scraper = CountingScraper()
+    limiter = RecordingLimiter()
+    link = {'url': URL, 'title': '제목', 'decision_no': '2019-4101'}
+
+    pages = list(iter_decision_pages(scraper, [link], backend=StructureFailureBackend(), rate_limiter=limiter))
+
+    assert pages == [(link, DETAIL_PAGE)]
+    assert limiter.acquired == [URL]
+    assert scraper.calls == 1
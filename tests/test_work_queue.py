@@ -0,0 +1,210 @@
+"""work_queue.WorkQueue 임대/만료/재시도와 cluster.merge_outputs 병합 확인 (임시 SQLite 파일 사용)"""
+
+import os
+import re
+import time
+
+import pytest
+
+import config
+from cluster import merge_outputs, print_status
+from manifest import ProgressManifest
+from work_queue import (
+    WorkQueue, SharedRequestBudget, KIND_DECISION, KIND_PERIOD,
+    STATUS_DONE, STATUS_FAILED, STATUS_LEASED, STATUS_PENDING
+)
+
+
+PERIOD_URL = 'https://www.ikpec.or.kr/m2/sub2_1.asp?Year=2019&DecideBaseNo=Y20190109'
+
+
+@pytest.fixture
+def queue_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'RETRY_BACKOFF_BASE', 0.0)
+    return str(tmp_path / 'queue.db')
+
+
+def add_period(queue):
+    queue.add_periods([(2019, 1, PERIOD_URL)])
+
+
+def item_status(queue, kind=KIND_PERIOD):
+    return {item['item_id']: item['status'] for item in queue.items(kind)}
+
+
+def test_expired_lease_is_reclaimed(queue_path):
+    node_a = WorkQueue(queue_path, lease_seconds=0.1)
+    node_b = WorkQueue(queue_path, lease_seconds=0.1)
+    add_period(node_a)
+
+    leased = node_a.lease('a')
+    assert leased['owner'] == 'a'
+    assert node_b.lease('b') is None
+
+    time.sleep(0.2)
+    reclaimed = node_b.lease('b')
+    assert reclaimed['item_id'] == leased['item_id']
+    assert reclaimed['owner'] == 'b' and reclaimed['attempts'] == 2
+
+
+def test_complete_rejected_after_lease_moves_to_another_owner(queue_path):
+    node_a = WorkQueue(queue_path, lease_seconds=0.1)
+    node_b = WorkQueue(queue_path, lease_seconds=0.1)
+    add_period(node_a)
+
+    item_a = node_a.lease('a')
+    time.sleep(0.2)
+    item_b = node_b.lease('b')
+
+    assert node_a.complete(item_a, 'a', decision_count=3) is False
+    assert node_a.renew(item_a, 'a') is False
+    assert item_status(node_a) == {PERIOD_URL: STATUS_LEASED}
+    assert node_b.complete(item_b, 'b', decision_count=3) is True
+    assert item_status(node_a) == {PERIOD_URL: STATUS_DONE}
+
+
+def test_item_fails_after_max_attempts(queue_path):
+    queue = WorkQueue(queue_path, max_attempts=2)
+    add_period(queue)
+
+    first = queue.lease('a')
+    assert queue.release(first, 'a', 'ConnectionError', retry=True) == STATUS_PENDING
+    second = queue.lease('a')
+    assert second['attempts'] == 2
+    assert queue.release(second, 'a', 'ConnectionError', retry=True) == STATUS_FAILED
+    assert queue.lease('a') is None
+    assert item_status(queue) == {PERIOD_URL: STATUS_FAILED}
+
+
+def test_expired_lease_fails_after_max_attempts(queue_path):
+    queue = WorkQueue(queue_path, lease_seconds=0.1, max_attempts=1)
+    add_period(queue)
+
+    assert queue.lease('a') is not None
+    time.sleep(0.2)
+    # 작업자가 죽은 채 시도 횟수를 다 쓴 항목은 다시 내주지 않음
+    assert queue.lease('b') is None
+    assert item_status(queue) == {PERIOD_URL: STATUS_FAILED}
+
+
+def test_renewed_lease_is_not_reclaimed(queue_path):
+    node_a = WorkQueue(queue_path, lease_seconds=0.3)
+    node_b = WorkQueue(queue_path, lease_seconds=0.3)
+    add_period(node_a)
+
+    item = node_a.lease('a')
+    with node_a.keep_leased(item, 'a', interval=0.05):
+        time.sleep(0.6)
+        assert node_b.lease('b') is None
+    assert node_a.complete(item, 'a', decision_count=0) is True
+
+
+def test_skewed_node_clock_does_not_expire_lease(queue_path):
+    node_a = WorkQueue(queue_path, lease_seconds=300)
+    # 시계가 한 시간 빠른 노드도 파일 서버 시각으로 비교하므로 임대 중인 항목을 가져가지 않음
+    node_b = WorkQueue(queue_path, lease_seconds=300, clock=lambda: time.time() + 3600)
+    add_period(node_a)
+
+    assert node_a.lease('a') is not None
+    assert node_b.lease('b') is None
+    assert abs(node_b.now() - node_a.now()) < 1.0
+
+
+def test_shared_budget_spaces_requests_across_nodes(queue_path):
+    node_a = SharedRequestBudget(WorkQueue(queue_path), requests_per_second=10)
+    node_b = SharedRequestBudget(WorkQueue(queue_path, clock=lambda: time.time() - 3600), requests_per_second=10)
+
+    waits = [node_a.reserve('www.ikpec.or.kr'), node_b.reserve('www.ikpec.or.kr'),
+             node_a.reserve('www.ikpec.or.kr')]
+
+    assert waits[0] == pytest.approx(0.0, abs=0.05)
+    assert waits[1] == pytest.approx(0.1, abs=0.05)
+    assert waits[2] == pytest.approx(0.2, abs=0.05)
+
+
+def test_cluster_budget_default_matches_single_node_ceiling(queue_path, monkeypatch):
+    monkeypatch.setattr(config, 'CLUSTER_REQUESTS_PER_SECOND', None)
+    monkeypatch.setattr(config, 'ADAPTIVE_PACING', True)
+
+    assert SharedRequestBudget(WorkQueue(queue_path)).interval == pytest.approx(1.0 / config.PACING_MAX_RATE)
+
+
+# ----- 병합 -----
+
+def run_fake_worker(queue, nodes_dir, worker_id):
+    """기간 하나와 심의 두 건을 처리한 작업자 출력을 만듦 (사이트 요청 없이 큐 상태만 진행)"""
+    period = queue.lease(worker_id)
+    queue.add_decisions(period, [
+        {'decision_no': f"2019-410{n}", 'url': f"{PERIOD_URL}&DecideNo=2019-410{n}", 'title': f"제목 {n}",
+         'list_order': n}
+        for n in (1, 2)
+    ])
+    queue.complete(period, worker_id, decision_count=2)
+
+    while True:
+        item = queue.lease(worker_id)
+        if item is None:
+            break
+        relative_path = os.path.join('2019', '01', f"{item['item_id']}_{item['title']}.md")
+        path = os.path.join(nodes_dir, worker_id, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"# {item['title']}\n")
+        queue.complete(item, worker_id, output_path=relative_path, title=item['title'],
+                       decision_type='주의', newspaper='중부매일')
+
+
+def snapshot(directory):
+    """출력 디렉토리의 파일 내용 (생성 시간 줄 제외)"""
+    files = {}
+    for dirpath, _, filenames in os.walk(directory):
+        for name in filenames:
+            if name.endswith('.db'):
+                continue
+            path = os.path.join(dirpath, name)
+            with open(path, encoding='utf-8') as f:
+                files[os.path.relpath(path, directory)] = re.sub(r'.*생성 시간.*\n', '', f.read())
+    return files
+
+
+def test_merge_outputs_is_idempotent(queue_path, tmp_path):
+    queue = WorkQueue(queue_path)
+    queue.add_periods([(2019, 1, PERIOD_URL)])
+    nodes_dir = str(tmp_path / 'nodes')
+    run_fake_worker(queue, nodes_dir, 'w1')
+    assert item_status(queue, KIND_DECISION) == {'2019-4101': STATUS_DONE, '2019-4102': STATUS_DONE}
+
+    output_dir = str(tmp_path / 'output')
+    manifest_path = os.path.join(output_dir, 'manifest.db')
+    inputs = [os.path.join(nodes_dir, 'w1')]
+
+    first = merge_outputs(queue, inputs, output_dir, manifest_path)
+    first_files = snapshot(output_dir)
+    second = merge_outputs(queue, inputs, output_dir, manifest_path)
+
+    assert first == second == {'periods': 1, 'decisions': 2, 'missing': 0}
+    assert snapshot(output_dir) == first_files
+    assert '2019/01/2019-4101_제목 1.md' in first_files
+
+    manifest = ProgressManifest(manifest_path)
+    try:
+        assert manifest.is_period_complete(PERIOD_URL)
+        assert sorted(entry['decision_no'] for entry in manifest.index_entries()) == ['2019-4101', '2019-4102']
+    finally:
+        manifest.close()
+
+
+def test_status_uses_queue_clock(queue_path, capsys, monkeypatch):
+    node = WorkQueue(queue_path, lease_seconds=600)
+    add_period(node)
+    node.lease('a')
+
+    # 상태를 보는 노드의 시계가 한 시간 빨라도 남은 임대 시간은 파일 서버 시계로 계산
+    real_time = time.time
+    monkeypatch.setattr(time, 'time', lambda: real_time() + 3600)
+    print_status(node)
+
+    output = capsys.readouterr().out
+    assert '임대 만료' not in output
+    remaining = int(re.search(r'\[a, (\d+)초 남음\]', output).group(1))
+    assert 590 <= remaining <= 600
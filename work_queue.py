@@ -0,0 +1,461 @@
+"""
+분산 수집 작업 큐 모듈
+여러 노드가 공유 파일시스템의 SQLite 파일 하나를 통해 수집할 기간(월별 목록 URL)과
+개별 심의(DecideNo URL)를 임대(lease) 방식으로 나누어 가져갑니다.
+
+- 작업자는 항목을 임대 시간 동안 독점하며, 완료/실패를 기록하지 못한 채 임대가 만료되면
+  (작업자 비정상 종료) 다른 작업자가 다시 가져감
+- 일시적인 실패는 지수 백오프 후 다시 임대할 수 있게 되고, 시도 횟수를 넘기면 failed로 남음
+- 오래 걸리는 항목은 처리하는 동안 임대를 연장하므로 임대 시간보다 오래 걸려도 다른 작업자가 가져가지 않음
+- 모든 노드가 함께 지키는 호스트별 요청 예산(다음 요청 시각)도 같은 파일에 기록
+
+임대 만료와 요청 시각은 노드마다 다른 시계로 비교하지 않도록 파일 서버의 시계를 기준으로 기록합니다.
+큐 파일 옆의 시계 파일 수정 시각을 갱신하고 읽어 노드 시계와의 차이를 구합니다. (NFS에서는
+utime(NULL)이 서버 시각으로 기록되므로 노드 시계가 어긋나 있어도 모든 노드가 같은 시각을 사용)
+
+네트워크 파일시스템에서는 WAL의 공유 메모리 파일을 쓸 수 없으므로 롤백 저널(DELETE)과
+파일 잠금(BEGIN IMMEDIATE)으로 노드 간 쓰기를 직렬화합니다. (POSIX 잠금을 지원하는 파일시스템 필요)
+
+항목 상태: pending(대기) → leased(임대 중) → done(완료) / failed(영구 실패)
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import config
+from supervisor import backoff_delay
+
+
+# 항목 종류
+KIND_PERIOD = 'period'
+KIND_DECISION = 'decision'
+
+# 항목 상태
+STATUS_PENDING = 'pending'
+STATUS_LEASED = 'leased'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+
+class WorkQueue:
+    """여러 노드가 공유하는 SQLite 임대 작업 큐"""
+
+    def __init__(self, path: str = None, lease_seconds: float = None, max_attempts: int = None,
+                 clock: Callable[[], float] = None):
+        """
+        작업 큐 초기화
+
+        Args:
+            path: 공유 SQLite 파일 경로 (None이면 config.CLUSTER_QUEUE_PATH)
+            lease_seconds: 항목 임대 시간 (초, 이 시간 안에 완료를 기록하거나 임대를 연장하지 않으면 다시 임대)
+            max_attempts: 항목당 최대 시도 횟수 (첫 시도 포함, None이면 config.MAX_FETCH_ATTEMPTS)
+            clock: 이 노드의 현재 시각 함수 (None이면 time.time, 파일 서버 시계와의 차이를 더해 사용)
+        """
+        self.path = path or config.CLUSTER_QUEUE_PATH
+        self.lease_seconds = lease_seconds if lease_seconds is not None else config.CLUSTER_LEASE_SECONDS
+        self.max_attempts = max_attempts if max_attempts is not None else config.MAX_FETCH_ATTEMPTS
+        self.clock = clock or time.time
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.RLock()
+        self._clock_offset = 0.0
+        self._clock_synced_at: Optional[float] = None
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # 트랜잭션은 직접 시작 (BEGIN IMMEDIATE로 읽기 전에 쓰기 잠금을 잡아 두 노드가 같은 항목을 임대하지 않도록)
+        self._conn = sqlite3.connect(self.path, timeout=config.CLUSTER_LOCK_TIMEOUT,
+                                     isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=DELETE')
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS items (
+                item_id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                year INTEGER NOT NULL,
+                month INTEGER NOT NULL,
+                url TEXT NOT NULL,
+                period_url TEXT NOT NULL,
+                title TEXT,
+                list_order INTEGER NOT NULL DEFAULT 0,
+                status TEXT NOT NULL,
+                owner TEXT,
+                lease_expires REAL,
+                available_at REAL NOT NULL DEFAULT 0,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                decision_count INTEGER,
+                output_path TEXT,
+                decision_type TEXT,
+                newspaper TEXT,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_items_status ON items (status, kind);
+            CREATE INDEX IF NOT EXISTS idx_items_period ON items (period_url, kind);
+            CREATE TABLE IF NOT EXISTS request_slots (
+                host TEXT PRIMARY KEY,
+                next_slot REAL NOT NULL
+            );
+        ''')
+
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """쓰기 잠금을 잡은 트랜잭션 (예외가 나면 되돌림)"""
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    # ----- 공유 시계 -----
+
+    def _sync_clock(self):
+        """시계 파일의 수정 시각을 갱신하고 읽어 파일 서버 시계와 이 노드 시계의 차이를 구합니다."""
+        clock_path = f"{self.path}.clock"
+        try:
+            with open(clock_path, 'a'):
+                pass
+            before = self.clock()
+            os.utime(clock_path, None)
+            after = self.clock()
+            offset = os.stat(clock_path).st_mtime - (before + after) / 2
+        except OSError as e:
+            # 시계 파일을 갱신할 수 없으면 이전 차이(처음에는 0, 노드 시계)를 계속 사용
+            self.logger.warning(f"시계 파일을 갱신하지 못했습니다. 노드 시계를 사용합니다: {clock_path} ({e})")
+            self._clock_synced_at = time.monotonic()
+            return
+
+        if self._clock_synced_at is None and abs(offset) > 1.0:
+            self.logger.warning(f"이 노드의 시계가 파일 서버와 {offset:+.1f}초 다릅니다. 큐 시각은 파일 서버 기준으로 기록합니다.")
+        self._clock_offset = offset
+        self._clock_synced_at = time.monotonic()
+
+    def now(self) -> float:
+        """
+        모든 노드가 함께 쓰는 현재 시각을 반환합니다. (파일 서버 시계 기준, 임대 만료/재시도/요청 시각 비교용)
+
+        Returns:
+            Unix 시각 (초)
+        """
+        with self._lock:
+            if self._clock_synced_at is None or \
+                    time.monotonic() - self._clock_synced_at >= config.CLUSTER_CLOCK_SYNC_SECONDS:
+                self._sync_clock()
+            return self.clock() + self._clock_offset
+
+    # ----- 항목 추가 -----
+
+    def add_periods(self, periods: List[Tuple[int, int, str]]) -> int:
+        """
+        수집할 기간을 추가합니다. (이미 있는 기간은 상태를 유지)
+
+        Args:
+            periods: [(연도, 월, 월별 목록 URL), ...]
+
+        Returns:
+            새로 추가된 기간 수
+        """
+        now = self.now()
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                'INSERT OR IGNORE INTO items (item_id, kind, year, month, url, period_url, status, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                [(url, KIND_PERIOD, year, month, url, url, STATUS_PENDING, now) for year, month, url in periods]
+            )
+            return conn.total_changes - before
+
+    def add_decisions(self, period: Dict, decisions: List[Dict]) -> int:
+        """
+        기간 목록에서 발견된 심의를 추가합니다. (이미 있는 심의는 상태를 유지)
+
+        Args:
+            period: 심의를 발견한 기간 항목 (lease 결과)
+            decisions: 'decision_no', 'url', 'title', 'list_order' 키를 가진 심의 링크 리스트
+
+        Returns:
+            새로 추가된 심의 수
+        """
+        now = self.now()
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                'INSERT OR IGNORE INTO items (item_id, kind, year, month, url, period_url, title, list_order, '
+                'status, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                [(d['decision_no'], KIND_DECISION, period['year'], period['month'], d['url'], period['url'],
+                  d.get('title'), d.get('list_order', 0), STATUS_PENDING, now) for d in decisions]
+            )
+            return conn.total_changes - before
+
+    # ----- 임대 -----
+
+    def lease(self, worker_id: str) -> Optional[Dict]:
+        """
+        처리할 항목 하나를 임대합니다. (기간 항목 우선, 임대가 만료된 항목도 다시 임대)
+
+        Args:
+            worker_id: 작업자 식별자
+
+        Returns:
+            항목 딕셔너리 ('item_id', 'kind', 'year', 'month', 'url', 'period_url', 'title', 'list_order',
+            'attempts' 등), 지금 임대할 수 있는 항목이 없으면 None
+        """
+        with self._transaction() as conn:
+            # 잠금을 기다린 시간이 임대 시각에 섞이지 않도록 잠금을 잡은 뒤 시각을 읽음
+            now = self.now()
+
+            # 시도 횟수를 다 쓴 채 임대가 만료된 항목은 다시 내주지 않음 (매번 작업자를 죽이는 항목)
+            expired = conn.execute(
+                'UPDATE items SET status = ?, owner = NULL, last_error = COALESCE(last_error, ?), updated_at = ? '
+                'WHERE status = ? AND lease_expires < ? AND attempts >= ?',
+                (STATUS_FAILED, '임대 만료 (작업자 응답 없음)', now, STATUS_LEASED, now, self.max_attempts)
+            ).rowcount
+            if expired:
+                self.logger.warning(f"임대 만료 후 시도 횟수를 넘긴 항목 {expired}건을 실패로 기록")
+
+            row = conn.execute(
+                'SELECT * FROM items '
+                'WHERE (status = ? AND available_at <= ?) OR (status = ? AND lease_expires < ?) '
+                'ORDER BY kind = ? DESC, year, month, list_order LIMIT 1',
+                (STATUS_PENDING, now, STATUS_LEASED, now, KIND_PERIOD)
+            ).fetchone()
+            if row is None:
+                return None
+
+            if row['status'] == STATUS_LEASED:
+                self.logger.warning(f"임대 만료 항목 회수 ({row['owner']}): {row['url']}")
+
+            conn.execute(
+                'UPDATE items SET status = ?, owner = ?, lease_expires = ?, attempts = attempts + 1, updated_at = ? '
+                'WHERE item_id = ?',
+                (STATUS_LEASED, worker_id, now + self.lease_seconds, now, row['item_id'])
+            )
+
+        item = dict(row)
+        item.update(status=STATUS_LEASED, owner=worker_id, attempts=row['attempts'] + 1)
+        return item
+
+    def complete(self, item: Dict, worker_id: str, decision_count: int = None, output_path: str = None,
+                 title: str = None, decision_type: str = None, newspaper: str = None) -> bool:
+        """
+        임대한 항목을 완료로 기록합니다.
+
+        Args:
+            item: lease로 받은 항목
+            worker_id: 작업자 식별자
+            decision_count: 기간 목록에서 발견된 심의 수 (기간 항목)
+            output_path: 작업자 출력 디렉토리 기준 마크다운 파일 상대 경로 (심의 항목)
+            title: 심의 제목
+            decision_type: 결정유형
+            newspaper: 언론사
+
+        Returns:
+            기록했으면 True, 그 사이 임대가 만료되어 다른 작업자에게 넘어갔으면 False
+        """
+        with self._transaction() as conn:
+            updated = conn.execute(
+                'UPDATE items SET status = ?, owner = ?, lease_expires = NULL, last_error = NULL, '
+                'decision_count = COALESCE(?, decision_count), output_path = COALESCE(?, output_path), '
+                'title = COALESCE(?, title), decision_type = ?, newspaper = ?, updated_at = ? '
+                'WHERE item_id = ? AND owner = ? AND status = ?',
+                (STATUS_DONE, worker_id, decision_count, output_path, title, decision_type, newspaper,
+                 self.now(), item['item_id'], worker_id, STATUS_LEASED)
+            ).rowcount
+        if not updated:
+            self.logger.warning(f"임대가 만료되어 다른 작업자에게 넘어간 항목 (결과는 버림): {item['url']}")
+        return bool(updated)
+
+    def release(self, item: Dict, worker_id: str, error: str, retry: bool) -> str:
+        """
+        임대한 항목의 실패를 기록합니다.
+
+        Args:
+            item: lease로 받은 항목
+            worker_id: 작업자 식별자
+            error: 오류 설명
+            retry: 일시적인 실패이면 True (시도 횟수가 남았으면 백오프 후 다시 임대)
+
+        Returns:
+            새 상태 (STATUS_PENDING 또는 STATUS_FAILED)
+        """
+        attempts = item['attempts']
+        if retry and attempts < self.max_attempts:
+            status, available_at = STATUS_PENDING, self.now() + backoff_delay(attempts + 1)
+        else:
+            status, available_at = STATUS_FAILED, 0
+
+        with self._transaction() as conn:
+            conn.execute(
+                'UPDATE items SET status = ?, owner = NULL, lease_expires = NULL, available_at = ?, '
+                'last_error = ?, updated_at = ? WHERE item_id = ? AND owner = ? AND status = ?',
+                (status, available_at, error, self.now(), item['item_id'], worker_id, STATUS_LEASED)
+            )
+        return status
+
+    def renew(self, item: Dict, worker_id: str) -> bool:
+        """
+        임대한 항목의 임대 시간을 지금부터 다시 lease_seconds로 연장합니다.
+
+        Args:
+            item: lease로 받은 항목
+            worker_id: 작업자 식별자
+
+        Returns:
+            연장했으면 True, 이미 만료되어 다른 작업자에게 넘어갔으면 False
+        """
+        with self._transaction() as conn:
+            now = self.now()
+            updated = conn.execute(
+                'UPDATE items SET lease_expires = ?, updated_at = ? WHERE item_id = ? AND owner = ? AND status = ?',
+                (now + self.lease_seconds, now, item['item_id'], worker_id, STATUS_LEASED)
+            ).rowcount
+        return bool(updated)
+
+    @contextmanager
+    def keep_leased(self, item: Dict, worker_id: str, interval: float = None) -> Iterator[None]:
+        """
+        with 블록 안에서 처리하는 동안 백그라운드 스레드로 임대를 주기적으로 연장합니다.
+        재시도와 백오프로 처리가 임대 시간보다 길어져도 다른 작업자가 같은 항목을 가져가지 않습니다.
+
+        Args:
+            item: lease로 받은 항목
+            worker_id: 작업자 식별자
+            interval: 연장 간격 (초, None이면 임대 시간의 1/3)
+        """
+        interval = interval if interval is not None else self.lease_seconds / 3
+        stop = threading.Event()
+
+        def renew_loop():
+            while not stop.wait(interval):
+                try:
+                    if not self.renew(item, worker_id):
+                        self.logger.warning(f"임대를 연장하지 못했습니다 (다른 작업자에게 넘어감): {item['url']}")
+                        return
+                except sqlite3.Error as e:
+                    # 잠금 대기 시간 초과 등은 다음 간격에 다시 시도
+                    self.logger.warning(f"임대 연장 중 오류: {item['url']} ({e})")
+
+        thread = threading.Thread(target=renew_loop, name=f"lease-{item['item_id']}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    # ----- 조회 -----
+
+    def outstanding(self) -> int:
+        """아직 끝나지 않은 항목 수 (대기 + 임대 중)"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT COUNT(*) FROM items WHERE status IN (?, ?)', (STATUS_PENDING, STATUS_LEASED)
+            ).fetchone()
+        return row[0]
+
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        """
+        종류/상태별 항목 수를 반환합니다.
+
+        Returns:
+            {종류: {상태: 항목 수}} 딕셔너리
+        """
+        with self._lock:
+            rows = self._conn.execute('SELECT kind, status, COUNT(*) AS n FROM items GROUP BY kind, status').fetchall()
+        counts: Dict[str, Dict[str, int]] = {}
+        for row in rows:
+            counts.setdefault(row['kind'], {})[row['status']] = row['n']
+        return counts
+
+    def items(self, kind: str, status: str = None) -> List[Dict]:
+        """
+        종류(와 상태)에 해당하는 항목을 반환합니다.
+
+        Args:
+            kind: KIND_PERIOD 또는 KIND_DECISION
+            status: 상태 (None이면 모든 상태)
+
+        Returns:
+            항목 딕셔너리 리스트 (기간, 목록 순)
+        """
+        query = 'SELECT * FROM items WHERE kind = ?'
+        params: Tuple = (kind,)
+        if status is not None:
+            query += ' AND status = ?'
+            params += (status,)
+        with self._lock:
+            rows = self._conn.execute(query + ' ORDER BY year, month, list_order', params).fetchall()
+        return [dict(row) for row in rows]
+
+    # ----- 전역 요청 예산 -----
+
+    def reserve_request_slot(self, host: str, interval: float) -> float:
+        """
+        호스트에 요청을 보낼 시각을 예약합니다. (모든 노드의 요청이 interval초 간격을 유지하도록)
+
+        Args:
+            host: 요청할 호스트
+            interval: 요청 사이 최소 간격 (초)
+
+        Returns:
+            예약한 시각까지 기다려야 할 시간 (초)
+        """
+        with self._transaction() as conn:
+            now = self.now()
+            row = conn.execute('SELECT next_slot FROM request_slots WHERE host = ?', (host,)).fetchone()
+            slot = max(now, row['next_slot']) if row else now
+            conn.execute(
+                'INSERT INTO request_slots (host, next_slot) VALUES (?, ?) '
+                'ON CONFLICT(host) DO UPDATE SET next_slot = excluded.next_slot',
+                (host, slot + interval)
+            )
+        return slot - now
+
+
+class SharedRequestBudget:
+    """작업 큐 파일에 다음 요청 시각을 기록하여 모든 노드가 함께 지키는 호스트별 요청 예산"""
+
+    def __init__(self, queue: WorkQueue, requests_per_second: float = None):
+        """
+        공유 요청 예산 초기화
+
+        Args:
+            queue: 예약 시각을 기록할 작업 큐
+            requests_per_second: 모든 노드 합계 초당 요청 수 (None이면 config.CLUSTER_REQUESTS_PER_SECOND,
+                                 그것도 None이면 노드 하나의 상한과 같게 적응형이면 PACING_MAX_RATE,
+                                 아니면 HOST_REQUESTS_PER_SECOND)
+        """
+        if requests_per_second is None:
+            requests_per_second = config.CLUSTER_REQUESTS_PER_SECOND
+        if requests_per_second is None:
+            requests_per_second = config.PACING_MAX_RATE if config.ADAPTIVE_PACING else config.HOST_REQUESTS_PER_SECOND
+        self.queue = queue
+        self.interval = 1.0 / requests_per_second
+
+    def reserve(self, host: str) -> float:
+        """
+        호스트에 보낼 다음 요청 시각을 예약합니다. (HostRateLimiter의 shared_budget)
+
+        Args:
+            host: 요청할 호스트
+
+        Returns:
+            기다려야 할 시간 (초)
+        """
+        return self.queue.reserve_request_slot(host, self.interval)